@@ -0,0 +1,65 @@
+"""
+Замер времени добавления страницы (MainWindow.add_page) от 1-й до 500-й страницы.
+Время добавления не должно расти с количеством страниц.
+
+Запуск из корня проекта:
+    python benchmarks/add_page.py [--pages 500] [--step 50]
+"""
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication, QMessageBox
+
+from src import __version__
+from src.gui.styles import APP_STYLE
+from src.gui.views.main_window import MainWindow
+
+
+def measure(window: MainWindow, app: QApplication, pages: int) -> list[float]:
+    """Возвращает время (мс) добавления каждой страницы с учетом обработки событий"""
+    timings = []
+    for _ in range(pages):
+        start = time.perf_counter()
+        window.add_page()
+        app.processEvents()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--step", type=int, default=50)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    app.setStyleSheet(APP_STYLE)
+    # Без вопроса о загрузке последнего файла состояния
+    QMessageBox.question = staticmethod(lambda *a, **k: QMessageBox.No)
+    window = MainWindow(__version__)
+    app.processEvents()
+
+    timings = measure(window, app, args.pages)
+    print(f"{'Страницы':>12} | {'среднее, мс':>12} | {'максимум, мс':>12}")
+    for start in range(0, len(timings), args.step):
+        chunk = timings[start : start + args.step]
+        print(
+            f"{start + 1:>5}-{start + len(chunk):<6} | "
+            f"{sum(chunk) / len(chunk):>12.2f} | {max(chunk):>12.2f}"
+        )
+    first = timings[: args.step]
+    last = timings[-args.step :]
+    ratio = (sum(last) / len(last)) / (sum(first) / len(first))
+    print(f"Отношение времени последних и первых {args.step} страниц: {ratio:.2f}")
+    print(f"Живых представлений страниц: {len(window.page_pool.views)}")
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
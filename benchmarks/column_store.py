@@ -0,0 +1,62 @@
+"""
+Замер добавления столбцов в набор данных: DataFrame (по одному столбцу)
+и хранилище столбцов Dataset. Время добавления столбца в Dataset не должно
+расти с количеством столбцов.
+
+Запуск из корня проекта:
+    python benchmarks/column_store.py [--columns 2000] [--points 100000]
+"""
+import sys
+import time
+import argparse
+import warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from src.core.dataset import Dataset
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--columns", type=int, default=2000)
+    parser.add_argument("--points", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    base = pd.DataFrame(
+        {
+            "t": np.arange(args.points, dtype=np.float64),
+            "p": rng.normal(size=args.points),
+        }
+    )
+    values = rng.normal(size=args.points)
+
+    frame = base.copy()
+    warnings.simplefilter("ignore", pd.errors.PerformanceWarning)
+    start = time.perf_counter()
+    for idx in range(args.columns):
+        frame[f"c{idx}"] = values
+    frame_add = time.perf_counter() - start
+    start = time.perf_counter()
+    frame.iloc[: args.points // 2].copy()
+    frame_slice = time.perf_counter() - start
+
+    dataset = Dataset(base)
+    start = time.perf_counter()
+    for idx in range(args.columns):
+        dataset[f"c{idx}"] = values
+    dataset_add = time.perf_counter() - start
+
+    print(
+        f"DataFrame: добавление {args.columns} столбцов {frame_add:.3f} с, "
+        f"срез строк после добавления {frame_slice:.3f} с"
+    )
+    print(f"Dataset:   добавление {args.columns} столбцов {dataset_add:.3f} с")
+
+
+if __name__ == "__main__":
+    main()
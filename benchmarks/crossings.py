@@ -0,0 +1,62 @@
+"""
+Замер поиска пересечений порога (src/core/events.py) по всем параметрам набора
+данных. Полный просмотр 3000 параметров по 10^6 точек должен занимать секунды.
+Чтобы не занимать 24 ГБ, параметры набора ссылаются на несколько различных
+массивов (Dataset хранит столбцы без копирования).
+
+Запуск из корня проекта:
+    python benchmarks/crossings.py [--columns 3000] [--points 1000000]
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from src.core.dataset import Dataset
+from src.core.events import find_crossings
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--columns", type=int, default=3000)
+    parser.add_argument("--points", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=16)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    t = np.cumsum(rng.uniform(0.005, 0.015, args.points))
+    sources = [
+        np.sin(t / (10 + j)) * (1 + j % 4) + rng.normal(0, 0.01, args.points)
+        for j in range(args.distinct)
+    ]
+    sources[0][args.points // 2 : args.points // 2 + 100] = np.nan
+    data = Dataset(pd.DataFrame({"Время": t}))
+    for j in range(args.columns):
+        data[f"Параметр {j}"] = sources[j % args.distinct]
+
+    for direction, first_only in (("up", True), ("up", False), ("both", False)):
+        start = time.perf_counter()
+        result = find_crossings(data, 2.5, direction=direction, first_only=first_only)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{direction:<5} first_only={first_only!s:<5} "
+            f"{args.columns} x {args.points}: {elapsed:.3f} с, "
+            f"пересечений {len(result)}, параметров {result['column'].nunique()}"
+        )
+
+    # Проверка на одном столбце: совпадение с прямым перебором
+    y = sources[0]
+    above = y > 2.5
+    finite = np.flatnonzero(np.isfinite(y))
+    rows = finite[1:][~above[finite[:-1]] & above[finite[1:]]]
+    result = find_crossings(data, 2.5, ["Параметр 0"], chunk_bytes=8 * 4096)
+    print(f"Совпадение строк с прямым перебором: {np.array_equal(rows, result['row'])}")
+
+
+if __name__ == "__main__":
+    main()
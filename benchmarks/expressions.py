@@ -0,0 +1,63 @@
+"""
+Замер вычисления производных столбцов при загрузке проекта (evaluate_expressions).
+
+Запуск из корня проекта:
+    python benchmarks/expressions.py [--expressions 200] [--points 100000]
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from src.core.expressions import evaluate_expressions
+
+
+def make_expressions(columns: list[str], count: int) -> list[str]:
+    """Выражения в формате файла сохранения, в том числе зависящие друг от друга"""
+    kinds = [
+        lambda a, b: f"$({a})+({b})$",
+        lambda a, b: f"$({a})-({b})$",
+        lambda a, b: f"$({a})*(2.5)$",
+        lambda a, b: f"$Integral({a})$",
+        lambda a, b: f"$abs(({a})-({b}))/(2)$",
+    ]
+    expressions = []
+    for idx in range(count):
+        a = columns[idx % len(columns)]
+        b = columns[(idx * 7 + 3) % len(columns)]
+        if expressions and idx % 10 == 9:
+            a = expressions[-1]
+        expressions.append(kinds[idx % len(kinds)](a, b))
+    return list(dict.fromkeys(expressions))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--expressions", type=int, default=200)
+    parser.add_argument("--columns", type=int, default=50)
+    parser.add_argument("--points", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    data = {"t": np.linspace(0.0, 3600.0, args.points)}
+    for i in range(args.columns):
+        data[f"p{i}"] = rng.normal(0, 1, args.points)
+    data = pd.DataFrame(data)
+    expressions = make_expressions(list(data.columns[1:]), args.expressions)
+
+    start = time.perf_counter()
+    values, errors = evaluate_expressions(data, expressions)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{len(values)} выражений по {args.points} точек: {elapsed * 1000:.1f} мс, "
+        f"ошибок: {len(errors)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Замер накопленного интегрирования столбцов по общему времени (cumulative_integral).
+Интегрирование 100 столбцов по 10^6 точек должно занимать меньше секунды.
+
+Запуск из корня проекта:
+    python benchmarks/integral.py [--columns 100] [--points 1000000]
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from src.core.integration import cumulative_integral
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--columns", type=int, default=100)
+    parser.add_argument("--points", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    t = np.cumsum(rng.uniform(0.005, 0.015, args.points))
+    y = np.asfortranarray(
+        np.sin(t[:, None] / (10 + np.arange(args.columns)))
+        + rng.normal(0, 0.01, (args.points, args.columns))
+    )
+    y[args.points // 2 : args.points // 2 + 100, 0] = np.nan
+
+    for method in ("trapezoid", "simpson"):
+        start = time.perf_counter()
+        result = cumulative_integral(t, y, method=method)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{method:<10} {args.columns} x {args.points}: {elapsed:.3f} с, "
+            f"интеграл последнего столбца {result[-1, -1]:.6f}"
+        )
+
+    # Проверка на небольшом фрагменте: совпадение с np.trapezoid по префиксам
+    n = 2000
+    expected = np.array([np.trapezoid(y[: i + 1, 1], t[: i + 1]) for i in range(n)])
+    error = np.abs(cumulative_integral(t[:n], y[:n, 1]) - expected).max()
+    print(f"Максимальное отличие от np.trapezoid: {error:.3e}")
+
+
+if __name__ == "__main__":
+    main()
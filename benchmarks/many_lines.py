@@ -0,0 +1,71 @@
+"""
+Замер построения и отрисовки страницы в режиме 'много линий' (200 линий × 10^5 точек)
+в сравнении с обычным построением отдельными линиями matplotlib.
+
+Запуск из корня проекта:
+    python benchmarks/many_lines.py [--lines 200] [--points 100000] [--repeat 3]
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from src.core.constants import PAGE_FIGURE_SIZE
+from src.core.page_spec import new_page_spec, pad_lines
+from src.core.render import plot_page
+
+
+def make_data(lines: int, points: int) -> pd.DataFrame:
+    """Синтетический набор данных: время и lines зашумленных синусоид"""
+    rng = np.random.default_rng(0)
+    t = np.linspace(0.0, 3600.0, points)
+    columns = {"t": t}
+    for i in range(lines):
+        columns[f"p{i}"] = np.sin(t / (50 + i)) * (1 + i / lines) + rng.normal(0, 0.05, points)
+    return pd.DataFrame(columns)
+
+
+def measure(spec: dict, data: pd.DataFrame, repeat: int) -> tuple[float, float]:
+    """Возвращает лучшее время (мс) построения и отрисовки страницы"""
+    best_plot = best_draw = float("inf")
+    for _ in range(repeat):
+        fig = Figure(figsize=PAGE_FIGURE_SIZE, dpi=100)
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        start = time.perf_counter()
+        plot_page(ax, spec, data)
+        middle = time.perf_counter()
+        canvas.draw()
+        end = time.perf_counter()
+        best_plot = min(best_plot, (middle - start) * 1000)
+        best_draw = min(best_draw, (end - middle) * 1000)
+    return best_plot, best_draw
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=200)
+    parser.add_argument("--points", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    data = make_data(args.lines, args.points)
+    print(f"{'Режим':>12} | {'построение, мс':>15} | {'отрисовка, мс':>14}")
+    for mode in ("many", "lines"):
+        spec = new_page_spec("graph_0")
+        spec["Mode"] = mode
+        # Обычный режим строит все линии списка, ограничение 15 линий здесь не применяется
+        spec["Lists"] = pad_lines(list(data.columns[1:]), "many")
+        plot_ms, draw_ms = measure(spec, data, args.repeat)
+        print(f"{mode:>12} | {plot_ms:>15.1f} | {draw_ms:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Замер размера и времени кодирования экспортируемых PNG (src/core/image_encoding.py)
+при разных параметрах: RGBA без палитры, точная палитра, сведение к 256 цветам,
+уровни сжатия. Для каждой страницы выводится количество различных цветов.
+
+Запуск из корня проекта:
+    python benchmarks/png_size.py [--lines 6] [--points 100000] [--dpi 300]
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pandas as pd
+from PIL import Image
+
+from src.core.constants import PAGE_FIGURE_SIZE
+from src.core.image_encoding import encode_png
+from src.core.page_spec import new_page_spec
+from src.core.render import figure_rgba, page_figure
+
+# Варианты кодирования: (название, параметры encode_png)
+VARIANTS = [
+    ("RGBA, уровень 6", {"compress_level": 6, "palette": False, "quantize": False}),
+    ("палитра, уровень 6", {"compress_level": 6, "palette": True, "quantize": False}),
+    ("палитра, уровень 9", {"compress_level": 9, "palette": True, "quantize": False}),
+    ("256 цветов, уровень 6", {"compress_level": 6, "palette": True, "quantize": True}),
+    ("256 цветов, уровень 9", {"compress_level": 9, "palette": True, "quantize": True}),
+]
+
+
+def make_data(columns: int, points: int) -> pd.DataFrame:
+    """Синтетический набор данных: время и зашумленные синусоиды"""
+    rng = np.random.default_rng(0)
+    t = np.linspace(0.0, 3600.0, points)
+    data = {"t": t}
+    for i in range(columns):
+        data[f"p{i}"] = np.sin(t / (40 + i)) + rng.normal(0, 0.05, points)
+    return pd.DataFrame(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=6)
+    parser.add_argument("--points", type=int, default=100_000)
+    parser.add_argument("--dpi", type=int, default=300)
+    args = parser.parse_args()
+
+    data = make_data(args.lines, args.points)
+    pages = {"lines": "Линии", "many": "Много линий"}
+    for mode, title in pages.items():
+        spec = new_page_spec(title)
+        spec["Mode"] = mode
+        for line in range(args.lines):
+            spec["Lists"][line] = f"p{line}"
+        rgba = figure_rgba(page_figure(spec, data, PAGE_FIGURE_SIZE), args.dpi)
+        colors = len(Image.fromarray(np.ascontiguousarray(rgba)).getcolors(rgba.size))
+        print(f"Страница '{title}', {args.dpi} dpi: цветов {colors}")
+        base = None
+        for name, options in VARIANTS:
+            start = time.perf_counter()
+            size = len(encode_png(rgba, args.dpi, options))
+            elapsed = time.perf_counter() - start
+            base = base or size
+            print(
+                f"  {name:<22} {size / 1024:>8.0f} КБ  {base / size:>5.2f}x  "
+                f"{elapsed * 1000:>7.0f} мс"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Замер экспорта страниц пулом процессов отрисовки (RenderPool) при разном числе процессов.
+Время экспорта должно уменьшаться почти пропорционально числу процессов.
+
+Запуск из корня проекта:
+    python benchmarks/save_all.py [--pages 48] [--lines 6] [--points 100000]
+"""
+import os
+import sys
+import time
+import tempfile
+import argparse
+from pathlib import Path
+from concurrent.futures import wait
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from src.core.constants import PAGE_FIGURE_SIZE
+from src.core.page_spec import new_page_spec
+from src.core.render_pool import RenderPool
+
+
+def make_data(columns: int, points: int) -> pd.DataFrame:
+    """Синтетический набор данных: время и зашумленные синусоиды"""
+    rng = np.random.default_rng(0)
+    t = np.linspace(0.0, 3600.0, points)
+    data = {"t": t}
+    for i in range(columns):
+        data[f"p{i}"] = np.sin(t / (40 + i)) + rng.normal(0, 0.05, points)
+    return pd.DataFrame(data)
+
+
+def make_pages(data: pd.DataFrame, pages: int, lines: int) -> list[dict]:
+    columns = list(data.columns[1:])
+    specs = []
+    for idx in range(pages):
+        spec = new_page_spec(f"graph_{idx}")
+        for line in range(lines):
+            spec["Lists"][line] = columns[(idx + line) % len(columns)]
+        specs.append(spec)
+    return specs
+
+
+def measure(data, specs, workers: int, directory: str) -> float:
+    """Время (с) экспорта всех страниц; запуск процессов не учитывается"""
+    pool = RenderPool(workers)
+    pool.prepare(data, version=0)
+    # Прогрев: запуск процессов и импорт matplotlib в каждом из них
+    wait([pool.submit_save(specs[0], os.path.join(directory, "warm.png"), PAGE_FIGURE_SIZE, 50)
+          for _ in range(workers)])
+    start = time.perf_counter()
+    futures = [
+        pool.submit_save(spec, os.path.join(directory, f"{idx}.png"), PAGE_FIGURE_SIZE, 300)
+        for idx, spec in enumerate(specs)
+    ]
+    wait(futures)
+    elapsed = time.perf_counter() - start
+    for future in futures:
+        future.result()
+    pool.shutdown()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=48)
+    parser.add_argument("--lines", type=int, default=6)
+    parser.add_argument("--points", type=int, default=100_000)
+    args = parser.parse_args()
+
+    data = make_data(24, args.points)
+    specs = make_pages(data, args.pages, args.lines)
+    counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    print(f"{'Процессы':>9} | {'время, с':>9} | {'ускорение':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        base = None
+        for workers in counts:
+            elapsed = measure(data, specs, workers, directory)
+            base = base or elapsed
+            print(f"{workers:>9} | {elapsed:>9.2f} | {base / elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Замер операций обработки сигналов (src/core/signal_ops.py) над многими столбцами
+с общим неравномерным временем. Скользящее среднее 500 столбцов по 10^6 точек
+должно занимать единицы секунд (нужно около 8 ГБ памяти: данные и результат).
+
+Запуск из корня проекта:
+    python benchmarks/signal_ops.py [--columns 500] [--points 1000000]
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from src.core import signal_ops
+from src.core.rolling import window_bounds
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--columns", type=int, default=500)
+    parser.add_argument("--points", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    t = np.cumsum(rng.uniform(0.005, 0.015, args.points))
+    columns = [
+        np.sin(t / (10 + j)) + rng.normal(0, 0.01, args.points)
+        for j in range(args.columns)
+    ]
+    columns[0][args.points // 2 : args.points // 2 + 100] = np.nan
+
+    operations = {
+        "derivative": lambda: signal_ops.derivative(t, columns),
+        "moving_average": lambda: signal_ops.moving_average(t, columns, 1.0),
+        "causal_average": lambda: signal_ops.moving_average(t, columns, 1.0, False),
+        "smoothing": lambda: signal_ops.exponential_smoothing(t, columns, 1.0),
+        "lag_filter": lambda: signal_ops.lag_filter(t, columns, 1.0),
+        "resample": lambda: signal_ops.resample(t, columns, 0.1),
+    }
+    for name, operation in operations.items():
+        start = time.perf_counter()
+        result = operation()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<15} {args.columns} x {args.points}: {elapsed:.3f} с")
+        del result
+
+    # Проверка на небольшом фрагменте: совпадение с прямыми вычислениями
+    n, y = 2000, columns[1][:2000]
+    lo, hi = window_bounds(t[:n], 1.0, centered=True)
+    expected = np.array([y[a:b].mean() for a, b in zip(lo, hi)])
+    error = np.abs(signal_ops.moving_average(t[:n], y, 1.0) - expected).max()
+    print(f"Скользящее среднее, максимальное отличие: {error:.3e}")
+
+    expected = np.empty(n)
+    expected[0] = y[0]
+    for i in range(1, n):
+        alpha = 1 - np.exp(-(t[i] - t[i - 1]) / 0.05)
+        expected[i] = expected[i - 1] + alpha * (y[i] - expected[i - 1])
+    error = np.abs(signal_ops.exponential_smoothing(t[:n], y, 0.05) - expected).max()
+    print(f"Экспоненциальное сглаживание, максимальное отличие: {error:.3e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 import sys
+import multiprocessing
 from typing import NoReturn
 
 from PyQt5.QtWidgets import QApplication
 
+from src.gui.styles import APP_STYLE
 from src.gui.views.main_window import MainWindow
 from src.utils.logger import Logger
 from src import __version__
@@ -23,6 +25,7 @@ def main() -> NoReturn:
     try:
         logger.info("Запуск приложения")
         app = QApplication(sys.argv)
+        app.setStyleSheet(APP_STYLE)
         window = MainWindow(__version__)
         window.show()
         logger.info("Приложение успешно запущено")
@@ -33,4 +36,6 @@ def main() -> NoReturn:
 
 
 if __name__ == "__main__":
+    # Рабочие процессы отрисовки в собранном приложении (PyInstaller)
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
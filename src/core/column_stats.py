@@ -0,0 +1,164 @@
+"""
+В этом файле содержится кэш статистики столбцов набора данных.
+Статистика (min, max, количество NaN и inf, монотонность, шаг) вычисляется лениво,
+одним векторизованным проходом по столбцу, и используется для границ осей
+и подсказок в таблице данных вместо повторного просмотра данных.
+"""
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from src.core.dataset import Dataset
+
+
+def compute_column_stats(values) -> dict:
+    """
+    Вычисляет статистику одного столбца.
+
+    Args:
+        values: Значения столбца (pd.Series или np.ndarray).
+
+    Returns:
+        dict: count, numeric, min, max, nan, inf, monotonic, step.
+            Для нечисловых столбцов и столбцов без конечных значений min/max/step равны None.
+    """
+    stats = {
+        "count": len(values),
+        "numeric": False,
+        "min": None,
+        "max": None,
+        "nan": 0,
+        "inf": 0,
+        "monotonic": False,
+        "step": None,
+    }
+    try:
+        arr = np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return stats
+    finite_mask = np.isfinite(arr)
+    finite = arr[finite_mask]
+    nan_count = int(np.count_nonzero(np.isnan(arr)))
+    stats["numeric"] = True
+    stats["nan"] = nan_count
+    stats["inf"] = int(arr.size - finite.size - nan_count)
+    if finite.size == 0:
+        return stats
+    stats["min"] = float(finite.min())
+    stats["max"] = float(finite.max())
+    diffs = np.diff(finite)
+    stats["monotonic"] = bool(np.all(diffs >= 0))
+    if diffs.size:
+        stats["step"] = float(np.median(diffs))
+    return stats
+
+
+class ColumnStats:
+    """
+    Ленивый кэш статистики столбцов набора данных.
+    При добавлении или изменении столбца его статистику нужно сбросить (invalidate).
+
+    Attributes:
+        data (pd.DataFrame): Набор данных.
+    """
+
+    def __init__(self, data: pd.DataFrame) -> None:
+        self.data = data
+        self._stats: dict[str, dict] = {}
+        self._fingerprints: dict[str, str] = {}
+
+    def __getitem__(self, column: str) -> dict:
+        stats = self._stats.get(column)
+        if stats is None:
+            stats = compute_column_stats(self.data[column].to_numpy())
+            self._stats[column] = stats
+        return stats
+
+    def get(self, column: str) -> dict | None:
+        """Статистика столбца или None, если столбца нет в наборе данных"""
+        if column not in self.data.columns:
+            return None
+        return self[column]
+
+    def min(self, column: str) -> float | None:
+        return self[column]["min"]
+
+    def max(self, column: str) -> float | None:
+        return self[column]["max"]
+
+    def fingerprint(self, column: str) -> str | None:
+        """
+        Отпечаток содержимого столбца (хэш значений) для ключей кэша экспорта.
+        None, если столбца нет в наборе данных.
+        """
+        if column not in self.data.columns:
+            return None
+        value = self._fingerprints.get(column)
+        if value is None and isinstance(self.data, Dataset) and self.data.is_derived(
+            column
+        ):
+            # Производный столбец определяется выражением и отпечатками входов,
+            # поэтому для ключа его значения не вычисляются
+            parts = [column] + [
+                f"{name}={self.fingerprint(name)}"
+                for name in sorted(self.data.inputs(column), key=str)
+            ]
+            digest = hashlib.blake2b(
+                "\x1f".join(parts).encode("utf-8"), digest_size=16
+            ).hexdigest()
+            value = f"derived:{digest}"
+            self._fingerprints[column] = value
+        if value is None:
+            values = self.data[column].to_numpy()
+            if values.dtype == object:
+                payload = "\x1f".join(map(str, values)).encode("utf-8")
+            else:
+                payload = np.ascontiguousarray(values).tobytes()
+            digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+            value = f"{values.dtype}:{values.size}:{digest}"
+            self._fingerprints[column] = value
+        return value
+
+    def invalidate(self, column: str | None = None) -> None:
+        """Сбрасывает статистику столбца (или всех столбцов, если column is None)"""
+        if column is None:
+            self._stats.clear()
+            self._fingerprints.clear()
+        else:
+            self._stats.pop(column, None)
+            self._fingerprints.pop(column, None)
+
+    def copy_for(self, data: pd.DataFrame) -> "ColumnStats":
+        """
+        Возвращает кэш для копии набора данных с уже вычисленной статистикой.
+        Используется, когда таблица данных работает с копией набора.
+        """
+        stats = ColumnStats(data)
+        stats._stats = {
+            column: value
+            for column, value in self._stats.items()
+            if column in data.columns
+        }
+        stats._fingerprints = {
+            column: value
+            for column, value in self._fingerprints.items()
+            if column in data.columns
+        }
+        return stats
+
+
+def format_column_stats(stats: dict) -> str:
+    """Текст статистики столбца для подсказки"""
+    if not stats["numeric"]:
+        return "Нечисловой столбец"
+    lines = []
+    if stats["min"] is None:
+        lines.append("Нет конечных значений")
+    else:
+        lines.append(f"Диапазон: {stats['min']:.6g} … {stats['max']:.6g}")
+    if stats["nan"] or stats["inf"]:
+        lines.append(f"NaN: {stats['nan']}, inf: {stats['inf']}")
+    if stats["monotonic"] and stats["step"] is not None:
+        lines.append(f"Монотонный, шаг: {stats['step']:.6g}")
+    return "\n".join(lines)
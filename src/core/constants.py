@@ -29,6 +29,88 @@ COLORS = [
     "darkred",
 ]
 MARKERS = ["o", "s", "D", "^", "v", "*", "+", "x", ".", '>', '<', 'd', 'p', 'h', 'X']
+# Размер фигуры графика (дюймы) на экране при создании и при сохранении в файл
+PAGE_FIGURE_SIZE = (9, 5)
+# Количество линий на одной странице (графике)
+LINES_PER_PAGE = 15
+# Режимы страницы: обычный (отдельная линия matplotlib на каждый параметр),
+# 'много линий' (все линии одной прореженной коллекцией) и панели (параметр на своих осях)
+PAGE_MODES = {"lines": "Линии", "many": "Много линий", "grid": "Панели"}
+# Максимальное количество линий на странице в режиме 'много линий'
+MANY_LINES_MAX = 200
+# Количество интервалов min/max прореживания каждой линии в режиме 'много линий'
+MANY_LINES_BUCKETS = 1000
+# Максимальное количество маркеров на одной линии в режиме 'много линий'
+MANY_LINES_MARKERS = 8
+# Расположения панелей (строки x столбцы) и расположение по умолчанию
+GRID_LAYOUTS = ["2x2", "2x3", "3x3", "3x4", "3x5"]
+DEFAULT_GRID_LAYOUT = "3x4"
+# Количество общих интервалов прореживания параметров на страницах с панелями
+GRID_BUCKETS = 1000
+# Максимальное количество строк со значениями линий в подписи перекрестия
+CURSOR_MAX_ROWS = 20
+# Количество живых представлений страниц (виджетов), переиспользуемых при навигации
+PAGE_VIEW_POOL_SIZE = 3
+# Профили качества отрисовки графика:
+# полный - для спокойного состояния и экспорта, черновой - на время перетаскивания и ввода
+FULL_RENDER_PROFILE = {
+    "name": "full",
+    "max_points": None,
+    "antialiased": True,
+    "markers": True,
+    "rc": {},
+}
+DRAFT_RENDER_PROFILE = {
+    "name": "draft",
+    "max_points": 1500,
+    "antialiased": False,
+    "markers": False,
+    "rc": {"path.simplify": True, "path.simplify_threshold": 1.0},
+}
+# Задержка (мс) после последнего действия пользователя до перерисовки в полном качестве
+RENDER_IDLE_DELAY = 400
+# Максимальный объем памяти (байт) под кэш изображений страниц
+PAGE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Векторные форматы экспорта, разрешение, до которого прореживаются линии,
+# и параметры упрощения путей matplotlib
+VECTOR_FORMATS = ("pdf", "svg")
+VECTOR_EXPORT_DPI = 300
+VECTOR_RC = {"path.simplify": True, "path.simplify_threshold": 0.5}
+# Кодирование экспортируемых PNG: уровень сжатия zlib (0-9), точная палитра
+# для изображений не более чем из 256 цветов (без потерь), сведение остальных
+# к 256 цветам (с потерями на сглаженных краях линий, по умолчанию выключено)
+PNG_OPTIONS = {"compress_level": 6, "palette": True, "quantize": False}
+# Дисковый кэш экспортированных изображений страниц (в каталоге кэша пользователя,
+# не в каталоге программы) и его максимальный объем (байт)
+USER_CACHE_DIR = Path(
+    os.environ.get("LOCALAPPDATA")
+    or os.environ.get("XDG_CACHE_HOME")
+    or Path.home() / ".cache"
+)
+RENDER_CACHE_DIR = USER_CACHE_DIR / "DataPlotter" / "render_cache"
+RENDER_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+# Фоновая подготовка изображений соседних страниц: количество соседей с каждой стороны,
+# число рабочих потоков, пауза (мс) перед началом и объем памяти под подготовленные изображения
+PREFETCH_RADIUS = 2
+PREFETCH_WORKERS = 1
+PREFETCH_DELAY = 300
+PREFETCH_MAX_BYTES = 64 * 1024 * 1024
+# Таблица данных: значащих цифр в отображаемых числах по умолчанию,
+# количество строк, подгружаемых за раз, строк в блоке форматирования
+# и количество отформатированных блоков в кэше
+TABLE_PRECISION = 6
+TABLE_FETCH_ROWS = 10000
+TABLE_BLOCK_ROWS = 256
+TABLE_CACHE_BLOCKS = 1024
+# Производные столбцы: строк в блоке поэлементного вычисления выражения
+# (промежуточные результаты блока помещаются в кэш процессора) и количество потоков
+EXPRESSION_CHUNK_ROWS = 65536
+EXPRESSION_WORKERS = 4
+# Объем памяти под вычисленные значения производных столбцов (байт)
+DERIVED_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# Поиск пересечений порога: столбцов в блоке и объем значений блока строк (байт)
+CROSSING_BLOCK_COLUMNS = 256
+CROSSING_CHUNK_BYTES = 64 * 1024 * 1024
 SIZING = [
     "отн. ед",
     "rel. units",
@@ -0,0 +1,527 @@
+"""
+В этом файле содержится набор данных сеанса с ленивыми производными столбцами.
+
+Производный столбец задается выражением (src/core/expressions.py), имя столбца
+совпадает с текстом выражения ("$(A)+(B)$"). Значения вычисляются при первом
+обращении (график, таблица, экспорт) и запоминаются в кэше ограниченного объема:
+при превышении объема вытесняются давно не использованные столбцы, при следующем
+обращении они вычисляются заново. При изменении исходного столбца сбрасываются
+все зависящие от него производные столбцы.
+
+Исходные столбцы хранятся отдельными непрерывными массивами с общим индексом
+времени (хранилище столбцов), а не в DataFrame: добавление столбца - O(1),
+без фрагментации блоков pandas и копирования остальных столбцов. Для остального
+кода набор данных выглядит как DataFrame: columns, data[имя], len(data), index,
+"имя" in data; DataFrame строится только там, где он нужен (to_frame).
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from src.core.constants import DERIVED_CACHE_MAX_BYTES
+from src.core.expressions import (
+    ExpressionError,
+    dependency_levels,
+    evaluate_expressions,
+    evaluate_node,
+    expression_columns,
+    parse_expression,
+)
+from src.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+def compile_derived(text: str, names: set) -> tuple[object, set]:
+    """
+    Разбирает выражение производного столбца.
+
+    Args:
+        text (str): Выражение (оно же имя столбца).
+        names (set): Имена доступных столбцов.
+
+    Returns:
+        tuple: (дерево выражения, столбцы, на которые оно ссылается).
+
+    Raises:
+        ExpressionError: Выражение не разбирается или ссылается
+            на отсутствующий столбец.
+    """
+    node = parse_expression(text, names)
+    inputs = expression_columns(node)
+    missing = [name for name in inputs if name not in names or name == text]
+    if missing:
+        raise ExpressionError(f"Нет столбца: {missing[0]}")
+    return node, inputs
+
+
+def evaluate_derived(name: str, node, data) -> np.ndarray:
+    """
+    Значения производного столбца. Ошибка вычисления (например, убывающее время
+    для функций обработки сигналов) пишется в журнал, а столбец заполняется NaN:
+    столбцы вычисляются при показе в таблице и на графике, где исключение
+    завершило бы приложение
+    """
+    try:
+        return evaluate_node(node, data)
+    except Exception as e:
+        logger.error(f"Ошибка вычисления столбца {name}: {str(e)}")
+        return np.full(len(data), np.nan)
+
+
+class Dataset:
+    """
+    Набор данных: исходные столбцы и производные столбцы, вычисляемые по требованию.
+
+    Attributes:
+        max_bytes (int): Объем кэша значений производных столбцов.
+    """
+
+    def __init__(
+        self, frame: pd.DataFrame, max_bytes: int = DERIVED_CACHE_MAX_BYTES
+    ) -> None:
+        """
+        Args:
+            frame (pd.DataFrame): Исходные столбцы (первый - время). Столбцы
+                берутся без копирования, если они уже непрерывны в памяти.
+        """
+        self._index = frame.index
+        # Исходные столбцы: имя -> непрерывный массив значений
+        self._arrays: dict[str, np.ndarray] = {
+            name: np.ascontiguousarray(frame[name].to_numpy())
+            for name in frame.columns
+        }
+        self.max_bytes = max_bytes
+        # Производные столбцы: имя -> дерево выражения
+        self._derived: dict[str, object] = {}
+        # Столбцы, от которых зависит производный столбец
+        self._inputs: dict[str, set] = {}
+        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._cache_bytes = 0
+        self._generation = 0
+        self._lock = threading.RLock()
+        self._listeners = []
+        self._columns = None
+
+    # Интерфейс DataFrame
+    @property
+    def columns(self) -> pd.Index:
+        if self._columns is None:
+            self._columns = pd.Index(list(self._arrays) + list(self._derived))
+        return self._columns
+
+    @property
+    def index(self) -> pd.Index:
+        return self._index
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self._index), len(self.columns)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def __contains__(self, name) -> bool:
+        return name in self._derived or name in self._arrays
+
+    def __getitem__(self, key):
+        if isinstance(key, list):
+            return self.to_frame(key)
+        return pd.Series(self.column(key), index=self._index, name=key, copy=False)
+
+    def __setitem__(self, name: str, values) -> None:
+        """Добавляет или заменяет исходный столбец"""
+        with self._lock:
+            self._set_array(name, values)
+        self.invalidate(name)
+
+    def _set_array(self, name: str, values) -> None:
+        if name in self._derived:
+            self._remove(name)
+        values = np.ascontiguousarray(
+            values.to_numpy() if isinstance(values, pd.Series) else values
+        )
+        if values.shape != (len(self._index),):
+            raise ValueError(
+                f"Длина столбца {name} ({len(values)}) не совпадает "
+                f"с длиной набора данных ({len(self._index)})"
+            )
+        self._arrays[name] = values
+        self._columns = None
+
+    # Производные столбцы
+    def is_derived(self, name: str) -> bool:
+        return name in self._derived
+
+    @property
+    def base_columns(self) -> list:
+        return list(self._arrays)
+
+    @property
+    def derived_names(self) -> list[str]:
+        return list(self._derived)
+
+    @property
+    def cache_bytes(self) -> int:
+        """Объем вычисленных значений производных столбцов в кэше"""
+        return self._cache_bytes
+
+    def add_derived(self, text: str) -> None:
+        """
+        Добавляет производный столбец (значения не вычисляются).
+
+        Raises:
+            ExpressionError: Выражение не разбирается или ссылается
+                на отсутствующий столбец.
+        """
+        if text in self._arrays:
+            raise ExpressionError(f"Столбец уже есть в данных: {text}")
+        node, inputs = compile_derived(text, set(self.columns))
+        with self._lock:
+            replaced = text in self._derived
+            self._derived[text] = node
+            self._inputs[text] = inputs
+            self._columns = None
+        if replaced:
+            self.invalidate(text)
+
+    def add_derived_many(self, texts: list[str]) -> dict[str, str]:
+        """
+        Добавляет производные столбцы в порядке зависимостей между ними
+        (выражение может ссылаться на следующее в списке).
+
+        Returns:
+            dict: {выражение: текст ошибки} для недобавленных.
+        """
+        pending = [text for text in dict.fromkeys(texts) if text not in self]
+        errors = {}
+        while pending:
+            errors = {}
+            rest = []
+            for text in pending:
+                try:
+                    self.add_derived(text)
+                except ExpressionError as e:
+                    errors[text] = str(e)
+                    rest.append(text)
+            if len(rest) == len(pending):
+                break
+            pending = rest
+        return errors
+
+    def apply_changes(self, columns: dict, derived: list[str]) -> None:
+        """
+        Добавляет изменения таблицы данных одной операцией: исходные столбцы
+        (значения) и производные столбцы (выражения). Если какое-либо выражение
+        не добавляется, набор данных не изменяется.
+
+        Raises:
+            ExpressionError: Ошибка в выражении.
+        """
+        with self._lock:
+            names = set(self.columns) | set(columns) | set(derived)
+            compiled = {text: compile_derived(text, names) for text in derived}
+            replaced = [name for name in columns if name in self]
+            for name, values in columns.items():
+                self._set_array(name, values)
+            for text, (node, inputs) in compiled.items():
+                self._derived[text] = node
+                self._inputs[text] = inputs
+            self._columns = None
+        for name in replaced:
+            self.invalidate(name)
+
+    def _remove(self, name: str) -> None:
+        del self._derived[name]
+        del self._inputs[name]
+        self._drop(name)
+        self._columns = None
+
+    def remove_derived(self, name: str) -> None:
+        """Удаляет производный столбец (зависящие от него тоже удаляются)"""
+        with self._lock:
+            names = self.dependents(name) | {name}
+            for other in names:
+                if other in self._derived:
+                    self._remove(other)
+            self._generation += 1
+        self._notify(sorted(names))
+
+    def inputs(self, name: str) -> set:
+        """Столбцы, на которые прямо ссылается выражение производного столбца"""
+        return set(self._inputs[name])
+
+    def dependents(self, name: str) -> set[str]:
+        """Производные столбцы, прямо или косвенно зависящие от столбца"""
+        result = set()
+        frontier = {name}
+        while frontier:
+            found = {
+                other
+                for other, inputs in self._inputs.items()
+                if inputs & frontier and other not in result
+            }
+            result |= found
+            frontier = found
+        return result
+
+    def with_dependencies(self, names: list[str]) -> list[str]:
+        """
+        Производные столбцы из names вместе со всеми производными столбцами,
+        от которых они зависят, в порядке вычисления.
+        """
+        required = set()
+        frontier = [name for name in names if name in self._derived]
+        while frontier:
+            name = frontier.pop()
+            if name in required:
+                continue
+            required.add(name)
+            frontier.extend(i for i in self._inputs[name] if i in self._derived)
+        levels = dependency_levels(
+            {name: self._inputs[name] & required for name in required}
+        )
+        order = {name: idx for idx, name in enumerate(self._derived)}
+        return [name for level in levels for name in sorted(level, key=order.get)]
+
+    # Значения
+    def column(self, name: str) -> np.ndarray:
+        """Значения столбца (производный столбец вычисляется при первом обращении)"""
+        if name not in self._derived:
+            return self._arrays[name]
+        with self._lock:
+            values = self._cache.get(name)
+            if values is not None:
+                self._cache.move_to_end(name)
+                return values
+            values = evaluate_derived(name, self._derived[name], self)
+            self._store(name, values)
+            return values
+
+    def materialize(self, names: list[str]) -> None:
+        """
+        Вычисляет еще не вычисленные производные столбцы из names сразу
+        (независимые столбцы - параллельно, см. evaluate_expressions).
+        """
+        with self._lock:
+            generation = self._generation
+            pending = [
+                name
+                for name in dict.fromkeys(names)
+                if name in self._derived and name not in self._cache
+            ]
+        if not pending:
+            return
+        values, errors = evaluate_expressions(self, pending, skip_existing=False)
+        with self._lock:
+            if generation == self._generation:
+                for name, array in values.items():
+                    self._store(name, array)
+        for name, error in errors.items():
+            logger.error(f"Ошибка вычисления столбца {name}: {error}")
+
+    def _store(self, name: str, values: np.ndarray) -> None:
+        self._drop(name)
+        self._cache[name] = values
+        self._cache_bytes += values.nbytes
+        # Вытеснение давно не использованных столбцов (кроме только что вычисленного)
+        while self._cache_bytes > self.max_bytes and len(self._cache) > 1:
+            _, old = self._cache.popitem(last=False)
+            self._cache_bytes -= old.nbytes
+
+    def _drop(self, name: str) -> None:
+        values = self._cache.pop(name, None)
+        if values is not None:
+            self._cache_bytes -= values.nbytes
+
+    def to_frame(self, columns: list | None = None) -> pd.DataFrame:
+        """DataFrame с указанными (по умолчанию всеми) столбцами"""
+        columns = list(self.columns) if columns is None else list(columns)
+        self.materialize(columns)
+        return pd.DataFrame(
+            {name: self.column(name) for name in columns},
+            index=self.index,
+            columns=columns,
+        )
+
+    def to_numpy(self, dtype=None) -> np.ndarray:
+        """Двумерный массив (строки x столбцы) в порядке столбцов Fortran"""
+        columns = list(self.columns)
+        self.materialize(columns)
+        arrays = [self.column(name) for name in columns]
+        if dtype is None:
+            dtype = np.result_type(*arrays) if arrays else np.float64
+        result = np.empty((len(self), len(columns)), dtype=dtype, order="F")
+        for idx, values in enumerate(arrays):
+            result[:, idx] = values
+        return result
+
+    # Изменение данных
+    def subscribe(self, callback) -> None:
+        """Подписка на сброс столбцов: callback(list[str]) с именами столбцов"""
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback) -> None:
+        """Отмена подписки callback (если он был подписан)"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, names: list[str]) -> None:
+        for callback in self._listeners:
+            callback(names)
+
+    def invalidate(self, name: str) -> None:
+        """Сбрасывает значения производных столбцов, зависящих от столбца"""
+        with self._lock:
+            names = {name} | self.dependents(name)
+            for other in names:
+                self._drop(other)
+            self._generation += 1
+        self._notify(sorted(names))
+
+    def append_rows(self, rows: pd.DataFrame) -> None:
+        """
+        Дописывает строки исходных столбцов (например, при чтении растущего файла).
+        Производные столбцы вычисляются заново при следующем обращении.
+        """
+        with self._lock:
+            self._arrays = {
+                name: np.concatenate([values, rows[name].to_numpy()])
+                for name, values in self._arrays.items()
+            }
+            self._index = self._index.append(rows.index)
+            self._cache.clear()
+            self._cache_bytes = 0
+            self._generation += 1
+        self._notify(list(self.columns))
+
+
+class DatasetOverlay:
+    """
+    Несохраненные изменения таблицы данных поверх набора данных сеанса.
+    Набор данных не копируется: чтение исходных столбцов идет из него,
+    добавленные столбцы хранятся в слое изменений. Сохранение переносит слой
+    в набор данных одной операцией (commit), отмена - просто отбрасывает слой.
+
+    Attributes:
+        base (Dataset): Набор данных сеанса.
+    """
+
+    def __init__(self, base: Dataset) -> None:
+        self.base = base
+        # Добавленные столбцы в порядке добавления: имя -> значения (None - выражение)
+        self._pending: dict[str, np.ndarray | None] = {}
+        self._derived: dict[str, object] = {}
+        self._values: dict[str, np.ndarray] = {}
+        self._columns = None
+
+    @property
+    def columns(self) -> pd.Index:
+        if self._columns is None:
+            base = [name for name in self.base.columns if name not in self._pending]
+            self._columns = pd.Index(base + list(self._pending))
+        return self._columns
+
+    @property
+    def index(self) -> pd.Index:
+        return self.base.index
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.base), len(self.columns)
+
+    @property
+    def pending(self) -> list[str]:
+        """Добавленные (несохраненные) столбцы"""
+        return list(self._pending)
+
+    def __len__(self) -> int:
+        return len(self.base)
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def __contains__(self, name) -> bool:
+        return name in self._pending or name in self.base
+
+    def __getitem__(self, key):
+        if isinstance(key, list):
+            return pd.DataFrame(
+                {name: self.column(name) for name in key}, index=self.index, columns=key
+            )
+        if key not in self._pending:
+            return self.base[key]
+        return pd.Series(self.column(key), index=self.index, name=key, copy=False)
+
+    def __setitem__(self, name: str, values) -> None:
+        """Добавляет столбец значений"""
+        self._derived.pop(name, None)
+        self._values.pop(name, None)
+        self._pending[name] = np.asarray(values)
+        self._columns = None
+
+    def is_derived(self, name: str) -> bool:
+        return name in self._derived or (
+            name not in self._pending and self.base.is_derived(name)
+        )
+
+    def add_derived(self, text: str) -> None:
+        """
+        Добавляет производный столбец (вычисляется при первом обращении).
+
+        Raises:
+            ExpressionError: Ошибка в выражении.
+        """
+        if text in self:
+            raise ExpressionError(f"Столбец уже есть в данных: {text}")
+        self._derived[text], _ = compile_derived(text, set(self.columns))
+        self._pending[text] = None
+        self._columns = None
+
+    def column(self, name: str) -> np.ndarray:
+        if name not in self._pending:
+            return self.base.column(name)
+        values = self._pending[name]
+        if values is None:
+            values = self._values.get(name)
+            if values is None:
+                values = evaluate_derived(name, self._derived[name], self)
+                self._values[name] = values
+        return values
+
+    def remove(self, name: str) -> None:
+        """Удаляет добавленный столбец"""
+        self._pending.pop(name, None)
+        self._derived.pop(name, None)
+        self._values.pop(name, None)
+        self._columns = None
+
+    def commit(self) -> list[str]:
+        """
+        Переносит изменения в набор данных сеанса.
+
+        Returns:
+            list[str]: Добавленные столбцы.
+
+        Raises:
+            ExpressionError: Ошибка в выражении (набор данных не изменяется).
+        """
+        names = self.pending
+        columns = {
+            name: values for name, values in self._pending.items() if values is not None
+        }
+        self.base.apply_changes(columns, list(self._derived))
+        self.discard()
+        return names
+
+    def discard(self) -> None:
+        """Отбрасывает изменения"""
+        self._pending.clear()
+        self._derived.clear()
+        self._values.clear()
+        self._columns = None
@@ -0,0 +1,107 @@
+"""
+В этом файле содержатся функции прореживания (децимации) данных для быстрой отрисовки графиков.
+Прореживание выполняется методом min/max: в каждом интервале сохраняются минимальная и максимальная
+точки, поэтому пики и провалы на графике не теряются.
+"""
+import numpy as np
+
+
+def minmax_indices(y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """
+    Возвращает отсортированные индексы точек, оставляемых после min/max прореживания.
+
+    Args:
+        y (np.ndarray): Значения параметра.
+        n_buckets (int): Количество интервалов прореживания.
+    """
+    n = y.size
+    if n_buckets is None or n <= 2 * n_buckets:
+        return np.arange(n)
+    size = n // n_buckets
+    m = size * n_buckets
+    blocks = y[:m].reshape(n_buckets, size)
+    offsets = np.arange(n_buckets) * size
+    # NaN попадает в argmin/argmax и сохраняет разрыв линии на графике
+    idx = [
+        np.array([0, n - 1]),
+        np.argmin(blocks, axis=1) + offsets,
+        np.argmax(blocks, axis=1) + offsets,
+    ]
+    if m < n:
+        tail = y[m:]
+        idx.append(np.array([np.argmin(tail) + m, np.argmax(tail) + m]))
+    return np.unique(np.concatenate(idx))
+
+
+def minmax_decimate(
+    x: np.ndarray, y: np.ndarray, n_buckets: int | None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Прореживает линию до 2 * n_buckets точек методом min/max.
+
+    Args:
+        x (np.ndarray): Значения по оси X (время).
+        y (np.ndarray): Значения параметра.
+        n_buckets (int | None): Количество интервалов. None - без прореживания.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    idx = minmax_indices(y, n_buckets)
+    if idx.size == y.size:
+        return x, y
+    return x[idx], y[idx]
+
+
+class SharedDecimation:
+    """
+    Общий прореженный индекс времени для нескольких параметров одного набора данных.
+    Интервалы прореживания одинаковы для всех параметров, поэтому ось X прореживается
+    один раз, а для каждого параметра вычисляются только min и max интервалов
+    (векторно, с кэшированием по имени столбца).
+
+    Attributes:
+        data (pd.DataFrame): Набор данных.
+        x (np.ndarray): Прореженные значения по оси X (по две точки на интервал).
+    """
+
+    def __init__(self, data, n_buckets: int | None) -> None:
+        self.data = data
+        x = data[data.columns[0]].to_numpy(dtype=np.float64)
+        n = x.size
+        self._columns = {}
+        if n_buckets is None or n <= 2 * n_buckets:
+            self._size = None
+            self.x = x
+            return
+        self._size = n // n_buckets
+        self._count = n_buckets
+        self._m = self._size * n_buckets
+        starts = x[: self._m : self._size]
+        if self._m < n:
+            starts = np.append(starts, x[self._m])
+        self.x = np.repeat(starts, 2)
+
+    def column(self, name: str) -> np.ndarray:
+        """Прореженные значения столбца: min и max каждого интервала"""
+        result = self._columns.get(name)
+        if result is None:
+            result = self.decimate(self.data[name].to_numpy(dtype=np.float64))
+            self._columns[name] = result
+        return result
+
+    def decimate(self, y: np.ndarray) -> np.ndarray:
+        """Прореживает значения параметра по общим интервалам"""
+        if self._size is None:
+            return y
+        # NaN в интервале дает NaN и сохраняет разрыв линии на графике
+        blocks = y[: self._m].reshape(self._count, self._size)
+        low = blocks.min(axis=1)
+        high = blocks.max(axis=1)
+        if self._m < y.size:
+            tail = y[self._m :]
+            low = np.append(low, tail.min())
+            high = np.append(high, tail.max())
+        result = np.empty(2 * low.size)
+        result[0::2] = low
+        result[1::2] = high
+        return result
@@ -0,0 +1,204 @@
+"""
+В этом файле содержится поиск пересечений порога параметрами набора данных.
+
+Столбцы обрабатываются блоками по CROSSING_BLOCK_COLUMNS, каждый блок - кусками
+строк, чтобы двумерный массив куска занимал не больше CROSSING_CHUNK_BYTES.
+Пересечения находятся сменой состояния "выше порога" между соседними строками
+сразу для всего куска. Состояние и последнее значение каждого столбца переносятся
+в следующий кусок, поэтому пересечения на границах кусков не теряются.
+Пропуски (NaN) не учитываются: значение после пропуска сравнивается с последним
+значением до него. Время пересечения - линейная интерполяция между этими точками.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+from src.core.constants import CROSSING_BLOCK_COLUMNS, CROSSING_CHUNK_BYTES
+from src.core.dataset import Dataset, DatasetOverlay
+
+# Направления пересечения: снизу вверх, сверху вниз, любое
+CROSSING_DIRECTIONS = ("up", "down", "both")
+
+
+def select_columns(columns: list[str], selection: str | list[str] | None = None):
+    """
+    Выбор параметров для поиска.
+
+    Args:
+        columns (list[str]): Параметры набора данных (без времени).
+        selection: None или "" - все параметры, строка - регулярное выражение
+            (re.search по имени), список - имена параметров.
+
+    Raises:
+        ValueError: Неверное регулярное выражение.
+    """
+    if not selection:
+        return list(columns)
+    if isinstance(selection, str):
+        try:
+            pattern = re.compile(selection)
+        except re.error as e:
+            raise ValueError(f"Неверное регулярное выражение: {str(e)}")
+        return [name for name in columns if pattern.search(str(name))]
+    chosen = set(selection)
+    return [name for name in columns if name in chosen]
+
+
+def _column_values(data, name: str) -> np.ndarray:
+    """Значения столбца без копирования (производный столбец Dataset вычисляется)"""
+    if isinstance(data, (Dataset, DatasetOverlay)):
+        return np.asarray(data.column(name))
+    return data[name].to_numpy()
+
+
+def _scan_block(
+    time: np.ndarray,
+    arrays: list[np.ndarray],
+    threshold: float,
+    direction: str,
+    first_only: bool,
+    rows: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Пересечения в блоке столбцов.
+
+    Returns:
+        tuple: (номер столбца в блоке, строка, время, True - пересечение вверх).
+    """
+    n, k = len(time), len(arrays)
+    # Состояние последней точки без пропуска: 1 - выше порога, 0 - нет, -1 - не было
+    state = np.full(k, -1, dtype=np.int8)
+    last_value = np.full(k, np.nan)
+    last_time = np.full(k, np.nan)
+    active = np.arange(k)
+    found = []
+    for start in range(0, n, rows):
+        if len(active) == 0:
+            break
+        stop = min(start + rows, n)
+        block = np.empty((stop - start, len(active)), order="F")
+        for m, j in enumerate(active):
+            block[:, m] = arrays[j][start:stop]
+        valid = ~np.isnan(block)
+        current = (block > threshold).view(np.int8)
+        gaps = not valid.all()
+        cols = np.arange(len(active))
+        # Предыдущая точка без пропуска для каждой строки: -1 - в прошлом куске
+        if gaps:
+            current = np.where(valid, current, np.int8(-1))
+            last_row = np.where(valid, np.arange(len(block))[:, None], -1)
+            np.maximum.accumulate(last_row, axis=0, out=last_row)
+            previous_row = np.empty_like(last_row)
+            previous_row[0] = -1
+            previous_row[1:] = last_row[:-1]
+            previous = np.where(
+                previous_row >= 0,
+                current[np.maximum(previous_row, 0), cols],
+                state[active],
+            )
+        else:
+            previous = np.empty_like(current)
+            previous[0] = state[active]
+            previous[1:] = current[:-1]
+        hit = (previous >= 0) & (current >= 0) & (previous != current)
+        if direction == "up":
+            hit &= current == 1
+        elif direction == "down":
+            hit &= current == 0
+        hit_rows, hit_cols = np.nonzero(hit)
+        if first_only and len(hit_rows):
+            # np.nonzero перечисляет строки по возрастанию: первое вхождение
+            # столбца - его первое пересечение
+            hit_cols, first = np.unique(hit_cols, return_index=True)
+            hit_rows = hit_rows[first]
+        if len(hit_rows):
+            p = previous_row[hit_rows, hit_cols] if gaps else hit_rows - 1
+            inside = p >= 0
+            p = np.maximum(p, 0)
+            y0 = np.where(inside, block[p, hit_cols], last_value[active[hit_cols]])
+            t0 = np.where(inside, time[start + p], last_time[active[hit_cols]])
+            y1 = block[hit_rows, hit_cols]
+            t1 = time[start + hit_rows]
+            crossing = t0 + (threshold - y0) * (t1 - t0) / (y1 - y0)
+            found.append(
+                (
+                    active[hit_cols],
+                    start + hit_rows,
+                    crossing,
+                    current[hit_rows, hit_cols] == 1,
+                )
+            )
+        # Перенос состояния в следующий кусок
+        end_row = last_row[-1] if gaps else np.full(len(active), len(block) - 1)
+        seen = end_row >= 0
+        end_row = np.maximum(end_row, 0)
+        state[active[seen]] = current[end_row, cols][seen]
+        last_value[active[seen]] = block[end_row, cols][seen]
+        last_time[active[seen]] = time[start + end_row][seen]
+        if first_only and len(hit_rows):
+            active = np.setdiff1d(active, active[hit_cols], assume_unique=True)
+    if not found:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, np.array([]), np.array([], dtype=bool)
+    return tuple(np.concatenate(part) for part in zip(*found))
+
+
+def find_crossings(
+    data,
+    threshold: float,
+    columns: list[str] | None = None,
+    direction: str = "up",
+    first_only: bool = False,
+    chunk_bytes: int = CROSSING_CHUNK_BYTES,
+) -> pd.DataFrame:
+    """
+    Ищет пересечения порога параметрами.
+
+    Args:
+        data: Набор данных (Dataset или pd.DataFrame), первый столбец - время.
+        threshold (float): Порог.
+        columns (list[str]): Параметры (None - все, кроме времени).
+            Нечисловые параметры пропускаются.
+        direction (str): Направление из CROSSING_DIRECTIONS.
+        first_only (bool): Только первое пересечение каждого параметра.
+        chunk_bytes (int): Объем значений куска строк блока.
+
+    Returns:
+        pd.DataFrame: Столбцы "column", "time", "row", "direction" ("up"/"down"),
+            пересечения упорядочены по параметрам и времени.
+    """
+    if direction not in CROSSING_DIRECTIONS:
+        raise ValueError(f"Неизвестное направление: {direction}")
+    time = np.asarray(_column_values(data, data.columns[0]), dtype=np.float64)
+    if columns is None:
+        columns = list(data.columns[1:])
+    names = []
+    arrays = []
+    for name in columns:
+        values = _column_values(data, name)
+        if values.dtype.kind in "biuf":
+            names.append(name)
+            arrays.append(values)
+    parts = []
+    for first in range(0, len(names), CROSSING_BLOCK_COLUMNS):
+        block = arrays[first : first + CROSSING_BLOCK_COLUMNS]
+        rows = max(2, chunk_bytes // (8 * len(block)))
+        index, row, when, up = _scan_block(
+            time, block, float(threshold), direction, first_only, rows
+        )
+        parts.append((index + first, row, when, up))
+    if parts:
+        index, row, when, up = (np.concatenate(part) for part in zip(*parts))
+    else:
+        index, row, when, up = [np.array([])] * 4
+    order = np.lexsort((row, index))
+    index = index[order].astype(np.int64)
+    return pd.DataFrame(
+        {
+            "column": np.asarray(names, dtype=object)[index],
+            "time": when[order],
+            "row": row[order].astype(np.int64),
+            "direction": np.where(up[order].astype(bool), "up", "down"),
+        }
+    )
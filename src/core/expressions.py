@@ -0,0 +1,534 @@
+"""
+В этом файле содержится вычисление производных столбцов по выражениям.
+
+Выражения хранятся в файле сохранения строками вида "$(A)+(B)$", "$Integral(X)$",
+"$Horizontal(5)$", "$MovingAverage((X), 10)$". Кроме них поддерживаются вложенные
+выражения, операции + - * / ^ между столбцами и числами и функции:
+    $(A)*((B)-(C))$, $abs([Давление, МПа])/2$, $Integral((A)*(B))$
+
+Ссылка на столбец:
+    (имя) - если текст в скобках совпадает с именем столбца или другого выражения,
+    [имя] - имя столбца произвольного вида,
+    имя - имя из букв, цифр и "_".
+
+Порядок вычисления:
+    1. Выражения разбираются в дерево, зависимости между ними упорядочиваются
+       топологически (уровнями).
+    2. Выражения одного уровня вычисляются параллельно в пуле потоков
+       (операции NumPy над большими массивами отпускают GIL).
+    3. Поэлементная часть выражения вычисляется за один проход по блокам строк:
+       промежуточные результаты блока помещаются в кэш процессора,
+       полноразмерные временные массивы не создаются. Функции над всем массивом
+       (Integral, Derivative, MovingAverage, ...) вычисляются до прохода
+       и участвуют в нем как готовые массивы.
+"""
+import re
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from src.core.constants import EXPRESSION_CHUNK_ROWS, EXPRESSION_WORKERS
+from src.core.integration import cumulative_integral
+from src.core import rolling, signal_ops
+from src.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class ExpressionError(ValueError):
+    """Ошибка разбора или вычисления выражения"""
+
+
+@dataclass(frozen=True)
+class Number:
+    value: float
+
+
+@dataclass(frozen=True)
+class Column:
+    name: str
+
+
+@dataclass(frozen=True)
+class Unary:
+    op: str
+    arg: object
+
+
+@dataclass(frozen=True)
+class Binary:
+    op: str
+    left: object
+    right: object
+
+
+@dataclass(frozen=True)
+class Call:
+    func: str
+    args: tuple
+
+
+@dataclass(frozen=True)
+class _Array:
+    """Готовый массив (столбец или результат функции над всем массивом)"""
+
+    values: np.ndarray
+
+
+_BINARY_UFUNCS = {
+    "+": np.add,
+    "-": np.subtract,
+    "*": np.multiply,
+    "/": np.divide,
+    "^": np.power,
+}
+
+# Поэлементные функции: имя (в нижнем регистре) -> (функция NumPy, число аргументов)
+ELEMENTWISE_FUNCTIONS = {
+    "abs": (np.abs, 1),
+    "sqrt": (np.sqrt, 1),
+    "exp": (np.exp, 1),
+    "log": (np.log, 1),
+    "log10": (np.log10, 1),
+    "sin": (np.sin, 1),
+    "cos": (np.cos, 1),
+    "tan": (np.tan, 1),
+    "min": (np.fmin, 2),
+    "max": (np.fmax, 2),
+}
+
+
+def _integral(context: "_Context", values: np.ndarray) -> np.ndarray:
+    return cumulative_integral(context.time(), values)
+
+
+def _horizontal(context: "_Context", value) -> np.ndarray:
+    return np.full(context.rows, value, dtype=np.float64)
+
+
+def _parameter(value) -> float:
+    """Параметр функции (ширина окна, постоянная времени, шаг) - число"""
+    if isinstance(value, np.ndarray):
+        raise ExpressionError("Параметр функции должен быть числом")
+    return float(value)
+
+
+def _signal(func, *options):
+    """
+    Функция над всем массивом из src/core/signal_ops.py или src/core/rolling.py
+    с числовым параметром
+    """
+
+    def call(context: "_Context", values: np.ndarray, param) -> np.ndarray:
+        return func(context.time(), values, _parameter(param), *options)
+
+    return call
+
+
+# Функции над всем массивом: имя (в нижнем регистре) -> (функция, число аргументов).
+# Функция получает контекст вычисления и аргументы (массивы или числа)
+ARRAY_FUNCTIONS = {
+    "integral": (_integral, 1),
+    "horizontal": (_horizontal, 1),
+    "derivative": (
+        lambda context, values: signal_ops.derivative(context.time(), values),
+        1,
+    ),
+    "movingaverage": (_signal(signal_ops.moving_average, True), 2),
+    "causalaverage": (_signal(signal_ops.moving_average, False), 2),
+    "smooth": (_signal(signal_ops.exponential_smoothing), 2),
+    "lag": (_signal(signal_ops.lag_filter), 2),
+    "resample": (_signal(signal_ops.resample), 2),
+    "rollingmin": (_signal(rolling.rolling_min), 2),
+    "rollingmax": (_signal(rolling.rolling_max), 2),
+    "rollingsum": (_signal(rolling.rolling_sum), 2),
+}
+
+_NUMBER = re.compile(r"(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+_IDENTIFIER = re.compile(r"[^\W\d]\w*")
+
+
+def _closing(text: str, start: int, opening: str, closing: str) -> int:
+    """Позиция скобки, закрывающей скобку text[start]"""
+    depth = 0
+    for pos in range(start, len(text)):
+        if text[pos] == opening:
+            depth += 1
+        elif text[pos] == closing:
+            depth -= 1
+            if depth == 0:
+                return pos
+    raise ExpressionError(f"Нет закрывающей скобки: {text}")
+
+
+class _Parser:
+    """Разбор выражения рекурсивным спуском"""
+
+    def __init__(self, text: str, names) -> None:
+        self.text = text
+        self.names = names
+        self.pos = 0
+
+    def parse(self):
+        node = self._expr()
+        self._skip()
+        if self.pos != len(self.text):
+            raise ExpressionError(
+                f"Лишние символы в позиции {self.pos + 1}: {self.text}"
+            )
+        return node
+
+    def _skip(self) -> None:
+        while self.pos < len(self.text) and self.text[self.pos].isspace():
+            self.pos += 1
+
+    def _peek(self) -> str:
+        self._skip()
+        return self.text[self.pos] if self.pos < len(self.text) else ""
+
+    def _expr(self):
+        node = self._term()
+        while self._peek() in ("+", "-"):
+            op = self.text[self.pos]
+            self.pos += 1
+            node = Binary(op, node, self._term())
+        return node
+
+    def _term(self):
+        node = self._unary()
+        while self._peek() in ("*", "/"):
+            if self.text.startswith("**", self.pos):
+                break
+            op = self.text[self.pos]
+            self.pos += 1
+            node = Binary(op, node, self._unary())
+        return node
+
+    def _unary(self):
+        if self._peek() in ("-", "+"):
+            op = self.text[self.pos]
+            self.pos += 1
+            arg = self._unary()
+            return Unary("-", arg) if op == "-" else arg
+        return self._power()
+
+    def _power(self):
+        node = self._atom()
+        self._skip()
+        if self.text.startswith("**", self.pos):
+            self.pos += 2
+            return Binary("^", node, self._unary())
+        if self._peek() == "^":
+            self.pos += 1
+            return Binary("^", node, self._unary())
+        return node
+
+    def _group(self, opening: str, closing: str) -> str:
+        """Текст в скобках от текущей позиции (позиция переходит за скобку)"""
+        end = _closing(self.text, self.pos, opening, closing)
+        inner = self.text[self.pos + 1 : end]
+        self.pos = end + 1
+        return inner
+
+    def _atom(self):
+        char = self._peek()
+        if not char:
+            raise ExpressionError(f"Неожиданный конец выражения: {self.text}")
+        if char == "(":
+            return self._operand(self._group("(", ")"))
+        if char == "[":
+            return Column(self._group("[", "]").strip())
+        match = _NUMBER.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+            return Number(float(match.group()))
+        match = _IDENTIFIER.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+            name = match.group()
+            if self._peek() == "(":
+                return self._call(name, self._group("(", ")"))
+            return Column(name)
+        raise ExpressionError(
+            f"Неожиданный символ '{char}' в позиции {self.pos + 1}: {self.text}"
+        )
+
+    def _operand(self, inner: str):
+        """Содержимое скобок: имя столбца (выражения) или вложенное выражение"""
+        if inner.strip() in self.names:
+            return Column(inner.strip())
+        try:
+            return parse_expression(inner, self.names)
+        except ExpressionError:
+            # Имя столбца, которого нет в данных: ошибка будет при вычислении
+            return Column(inner.strip())
+
+    def _call(self, name: str, inner: str):
+        key = name.lower()
+        if key in ELEMENTWISE_FUNCTIONS:
+            arity = ELEMENTWISE_FUNCTIONS[key][1]
+        elif key in ARRAY_FUNCTIONS:
+            arity = ARRAY_FUNCTIONS[key][1]
+        else:
+            raise ExpressionError(f"Неизвестная функция: {name}")
+        if inner.strip() in self.names:
+            args = (Column(inner.strip()),)
+        else:
+            args = tuple(self._operand(part) for part in _split_arguments(inner))
+        if len(args) != arity:
+            raise ExpressionError(
+                f"Функция {name} принимает аргументов: {arity}, передано: {len(args)}"
+            )
+        return Call(key, args)
+
+
+def _split_arguments(text: str) -> list[str]:
+    """Разделяет аргументы функции по запятым верхнего уровня"""
+    parts, depth, start = [], 0, 0
+    for pos, char in enumerate(text):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(text[start:pos])
+            start = pos + 1
+    parts.append(text[start:])
+    return parts
+
+
+def parse_expression(text: str, names=frozenset()):
+    """
+    Разбирает выражение в дерево.
+
+    Args:
+        text (str): Выражение (обрамляющие "$" необязательны).
+        names: Имена столбцов данных и выражений: текст в скобках,
+            совпадающий с именем, считается ссылкой на столбец.
+    """
+    body = text.strip()
+    if len(body) >= 2 and body[0] == "$" and body[-1] == "$":
+        body = body[1:-1]
+    if not body.strip():
+        raise ExpressionError("Пустое выражение")
+    return _Parser(body, names).parse()
+
+
+def expression_columns(node) -> set[str]:
+    """Имена столбцов, на которые ссылается выражение"""
+    if isinstance(node, Column):
+        return {node.name}
+    if isinstance(node, Unary):
+        return expression_columns(node.arg)
+    if isinstance(node, Binary):
+        return expression_columns(node.left) | expression_columns(node.right)
+    if isinstance(node, Call):
+        return set().union(*(expression_columns(arg) for arg in node.args))
+    return set()
+
+
+def dependency_levels(dependencies: dict[str, set]) -> list[list[str]]:
+    """
+    Топологическое упорядочивание выражений по уровням: выражения уровня зависят
+    только от выражений предыдущих уровней.
+
+    Raises:
+        ExpressionError: Циклическая зависимость.
+    """
+    remaining = {name: set(deps) for name, deps in dependencies.items()}
+    levels = []
+    while remaining:
+        level = [name for name, deps in remaining.items() if not deps]
+        if not level:
+            raise ExpressionError(
+                f"Циклическая зависимость выражений: {', '.join(remaining)}"
+            )
+        levels.append(level)
+        for name in level:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(level)
+    return levels
+
+
+class _Context:
+    """Доступ к столбцам данных и вычисленных выражений"""
+
+    def __init__(self, data: pd.DataFrame, results: dict) -> None:
+        self.data = data
+        self.rows = len(data)
+        self.results = results
+        self._arrays = {}
+
+    def column(self, name: str) -> np.ndarray:
+        if name in self.results:
+            return self.results[name]
+        values = self._arrays.get(name)
+        if values is None:
+            if name not in self.data.columns:
+                raise ExpressionError(f"Нет столбца: {name}")
+            try:
+                values = self.data[name].to_numpy(dtype=np.float64)
+            except (TypeError, ValueError):
+                raise ExpressionError(f"Столбец не числовой: {name}")
+            self._arrays[name] = values
+        return values
+
+    def time(self) -> np.ndarray:
+        return self.column(self.data.columns[0])
+
+
+def _prepare(node, context: _Context):
+    """
+    Заменяет ссылки на столбцы и вызовы функций над всем массивом готовыми
+    массивами. Остается поэлементное дерево для вычисления по блокам.
+    """
+    if isinstance(node, Column):
+        return _Array(context.column(node.name))
+    if isinstance(node, Unary):
+        return Unary(node.op, _prepare(node.arg, context))
+    if isinstance(node, Binary):
+        return Binary(
+            node.op, _prepare(node.left, context), _prepare(node.right, context)
+        )
+    if isinstance(node, Call):
+        args = tuple(_prepare(arg, context) for arg in node.args)
+        if node.func in ARRAY_FUNCTIONS:
+            func = ARRAY_FUNCTIONS[node.func][0]
+            values = [
+                arg.value if isinstance(arg, Number) else _evaluate(arg, context.rows)
+                for arg in args
+            ]
+            return _Array(np.asarray(func(context, *values), dtype=np.float64))
+        return Call(node.func, args)
+    return node
+
+
+def _chunk(node, sl: slice):
+    """Вычисляет поэлементное дерево на блоке строк"""
+    if isinstance(node, _Array):
+        return node.values[sl]
+    if isinstance(node, Number):
+        return node.value
+    if isinstance(node, Unary):
+        return np.negative(_chunk(node.arg, sl))
+    if isinstance(node, Binary):
+        return _BINARY_UFUNCS[node.op](_chunk(node.left, sl), _chunk(node.right, sl))
+    func = ELEMENTWISE_FUNCTIONS[node.func][0]
+    return func(*(_chunk(arg, sl) for arg in node.args))
+
+
+def _evaluate(node, rows: int) -> np.ndarray:
+    """Вычисляет подготовленное дерево в новый массив"""
+    if isinstance(node, _Array):
+        return node.values.copy()
+    out = np.empty(rows, dtype=np.float64)
+    for start in range(0, rows, EXPRESSION_CHUNK_ROWS):
+        sl = slice(start, min(start + EXPRESSION_CHUNK_ROWS, rows))
+        out[sl] = _chunk(node, sl)
+    return out
+
+
+def evaluate_node(node, data: pd.DataFrame, results: dict | None = None) -> np.ndarray:
+    """
+    Вычисляет дерево выражения.
+
+    Args:
+        node: Дерево (parse_expression).
+        data (pd.DataFrame): Данные, первый столбец - время.
+        results (dict): Уже вычисленные выражения {имя: массив}.
+    """
+    context = _Context(data, results or {})
+    with np.errstate(all="ignore"):
+        return _evaluate(_prepare(node, context), context.rows)
+
+
+def evaluate_expressions(
+    data: pd.DataFrame,
+    texts: list[str],
+    workers: int = EXPRESSION_WORKERS,
+    skip_existing: bool = True,
+) -> tuple[dict[str, np.ndarray], dict[str, str]]:
+    """
+    Вычисляет производные столбцы.
+
+    Args:
+        data (pd.DataFrame): Данные, первый столбец - время.
+        texts (list[str]): Выражения (они же имена производных столбцов).
+        workers (int): Количество потоков.
+        skip_existing (bool): Не вычислять выражения, имена которых уже есть
+            в данных (False - для ленивых производных столбцов Dataset).
+
+    Returns:
+        tuple: ({имя: значения} вычисленных выражений в порядке texts,
+            {имя: текст ошибки} невычисленных).
+    """
+    pending = [
+        text
+        for text in dict.fromkeys(texts)
+        if not (skip_existing and text in data.columns)
+    ]
+    names = set(data.columns) | set(pending)
+    errors = {}
+    trees = {}
+    dependencies = {}
+    for text in pending:
+        try:
+            trees[text] = parse_expression(text, names)
+        except ExpressionError as e:
+            errors[text] = str(e)
+            continue
+        dependencies[text] = expression_columns(trees[text]) & set(pending)
+        dependencies[text].discard(text)
+
+    # Выражение, зависящее от невычисляемого, тоже не вычисляется
+    failed = set(errors)
+    changed = True
+    while changed:
+        changed = False
+        for text, deps in list(dependencies.items()):
+            broken = deps & failed
+            if broken:
+                errors[text] = f"Не вычислено выражение: {next(iter(broken))}"
+                failed.add(text)
+                del dependencies[text]
+                changed = True
+    try:
+        levels = dependency_levels(dependencies)
+    except ExpressionError as e:
+        for text in dependencies:
+            errors[text] = str(e)
+        levels = []
+
+    results = {}
+    context = _Context(data, results)
+
+    def run(text: str) -> np.ndarray:
+        with np.errstate(all="ignore"):
+            return _evaluate(_prepare(trees[text], context), context.rows)
+
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="expressions"
+    ) as executor:
+        for level in levels:
+            futures = {}
+            for text in level:
+                broken = dependencies[text] & failed
+                if broken:
+                    errors[text] = f"Не вычислено выражение: {next(iter(broken))}"
+                    failed.add(text)
+                else:
+                    futures[text] = executor.submit(run, text)
+            for text, future in futures.items():
+                try:
+                    results[text] = future.result()
+                except Exception as e:
+                    logger.error(f"Ошибка вычисления выражения {text}: {str(e)}")
+                    errors[text] = str(e)
+                    failed.add(text)
+    for text in failed:
+        errors.setdefault(text, "Не вычислено")
+    ordered = {text: results[text] for text in pending if text in results}
+    return ordered, errors
@@ -0,0 +1,87 @@
+"""
+В этом файле содержится кодирование отрисованных страниц (RGBA) в PNG через Pillow.
+Изображение не более чем из 256 цветов сохраняется без потерь с точной палитрой
+(8 бит на пиксель) вместо 32-битного RGBA. Индексы палитры строятся напрямую
+по цветам пикселей: Image.quantize с заданной палитрой сопоставляет цвета
+с пониженной точностью и искажает их.
+Сглаживание линий и текста обычно дает больше 256 цветов. Такие изображения
+сохраняются в RGB или, если включено PNG_OPTIONS["quantize"], сводятся
+к 256 цветам (с потерями на полутонах краев линий).
+Замер: benchmarks/png_size.py.
+"""
+from io import BytesIO
+
+import numpy as np
+from PIL import Image
+
+from src.core.constants import PNG_OPTIONS
+
+
+def palette_image(rgb: np.ndarray) -> Image.Image:
+    """
+    Изображение с точной палитрой из изображения RGB не более чем из 256 цветов.
+
+    Args:
+        rgb (np.ndarray): Изображение (высота, ширина, 3), uint8.
+    """
+    height, width = rgb.shape[:2]
+    # Цвет пикселя одним числом: уникальные значения одномерного массива
+    # находятся намного быстрее, чем уникальные строки (np.unique(..., axis=0))
+    packed = rgb.reshape(-1, 3).astype(np.uint32)
+    packed = (packed[:, 0] << 16) | (packed[:, 1] << 8) | packed[:, 2]
+    colors, index = np.unique(packed, return_inverse=True)
+    if len(colors) > 256:
+        raise ValueError(f"Цветов в изображении больше 256: {len(colors)}")
+    palette = np.stack(
+        [(colors >> 16) & 0xFF, (colors >> 8) & 0xFF, colors & 0xFF], axis=1
+    ).astype(np.uint8)
+    # putpalette переводит изображение индексов (режим "L") в режим "P"
+    image = Image.fromarray(index.astype(np.uint8).reshape(height, width))
+    image.putpalette(palette.ravel().tobytes())
+    return image
+
+
+def to_image(rgba: np.ndarray, palette: bool = True, quantize: bool = False) -> Image.Image:
+    """
+    Преобразует изображение RGBA в изображение Pillow минимальной разрядности.
+
+    Args:
+        rgba (np.ndarray): Изображение (высота, ширина, 4), uint8.
+        palette (bool): Использовать точную палитру, если цветов не больше 256.
+        quantize (bool): Если цветов больше 256, сводить их к 256 (с потерями).
+    """
+    image = Image.fromarray(np.ascontiguousarray(rgba), "RGBA")
+    if rgba[..., 3].min() == 255:
+        # Фон фигуры непрозрачный: альфа-канал не нужен
+        image = image.convert("RGB")
+    if not palette or image.mode != "RGB":
+        return image
+    if image.getcolors(256) is not None:
+        # Все цвета изображения помещаются в палитру - преобразование без потерь
+        return palette_image(rgba[..., :3])
+    if quantize:
+        return image.quantize(
+            colors=256, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE
+        )
+    return image
+
+
+def encode_png(rgba: np.ndarray, dpi: float, options: dict = PNG_OPTIONS) -> bytes:
+    """
+    Кодирует изображение RGBA в PNG.
+
+    Args:
+        rgba (np.ndarray): Изображение (высота, ширина, 4), uint8.
+        dpi (float): Разрешение, записываемое в файл.
+        options (dict): compress_level (0-9), palette, quantize (см. to_image).
+    """
+    image = to_image(rgba, options["palette"], options["quantize"])
+    buffer = BytesIO()
+    image.save(
+        buffer,
+        format="PNG",
+        compress_level=options["compress_level"],
+        dpi=(dpi, dpi),
+    )
+    return buffer.getvalue()
+
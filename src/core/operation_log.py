@@ -0,0 +1,198 @@
+"""
+В этом файле содержится журнал операций над данными.
+
+Каждое преобразование (арифметика, интеграл, горизонтальная линия, ...) хранится
+записью: операция, входные столбцы, параметры и имя результата. Результат -
+производный столбец набора данных (src/core/dataset.py), его выражение строится
+по записи. Отмена и повтор удаляют и снова добавляют производный столбец,
+снимки данных не хранятся. Журнал сохраняется в файл состояния вместо
+списка выражений "_Additional_data" (старый формат читается).
+"""
+from src.core.expressions import ExpressionError
+from src.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+def _binary(symbol: str):
+    return lambda inputs, params: f"$({inputs[0]}){symbol}({inputs[1]})$"
+
+
+def _constant(symbol: str):
+    return lambda inputs, params: f"$({inputs[0]}){symbol}({params['constant']})$"
+
+
+def _signal(func: str, param: str):
+    return lambda inputs, params: f"${func}(({inputs[0]}), {params[param]})$"
+
+
+# Операции: имя -> (название, построение выражения результата по входам и параметрам)
+OPERATIONS = {
+    "add_columns": ("Сложение столбцов", _binary("+")),
+    "subtract_columns": ("Вычитание столбцов", _binary("-")),
+    "add_constant": ("Сложение с константой", _constant("+")),
+    "subtract_constant": ("Вычитание константы", _constant("-")),
+    "multiply_constant": ("Умножение на константу", _constant("*")),
+    "divide_constant": ("Деление на константу", _constant("/")),
+    "integral": ("Интеграл", lambda inputs, params: f"$Integral({inputs[0]})$"),
+    "horizontal": (
+        "Горизонтальная линия",
+        lambda inputs, params: f"$Horizontal({params['constant']})$",
+    ),
+    "derivative": (
+        "Производная",
+        lambda inputs, params: f"$Derivative({inputs[0]})$",
+    ),
+    "moving_average": (
+        "Скользящее среднее",
+        _signal("MovingAverage", "window"),
+    ),
+    "causal_average": (
+        "Скользящее среднее (причинное)",
+        _signal("CausalAverage", "window"),
+    ),
+    "exponential_smoothing": ("Экспоненциальное сглаживание", _signal("Smooth", "tau")),
+    "lag_filter": ("Инерционное звено", _signal("Lag", "tau")),
+    "resample": ("Передискретизация", _signal("Resample", "step")),
+    "rolling_min": ("Скользящий минимум", _signal("RollingMin", "window")),
+    "rolling_max": ("Скользящий максимум", _signal("RollingMax", "window")),
+    "rolling_sum": ("Скользящая сумма", _signal("RollingSum", "window")),
+    # Произвольное выражение (в том числе из старых файлов состояния)
+    "expression": ("Выражение", lambda inputs, params: params["expression"]),
+}
+
+
+def make_operation(op: str, inputs: list | None = None, **params) -> dict:
+    """
+    Создает запись журнала.
+
+    Args:
+        op (str): Имя операции из OPERATIONS.
+        inputs (list): Входные столбцы.
+        **params: Параметры операции.
+
+    Raises:
+        ExpressionError: Неизвестная операция.
+    """
+    if op not in OPERATIONS:
+        raise ExpressionError(f"Неизвестная операция: {op}")
+    inputs = [str(name) for name in inputs or []]
+    entry = {"op": op, "inputs": inputs, "params": params}
+    entry["output"] = OPERATIONS[op][1](inputs, params)
+    return entry
+
+
+def operation_title(entry: dict) -> str:
+    """Текст записи для подсказок меню"""
+    return f"{OPERATIONS[entry['op']][0]}: {entry['output']}"
+
+
+def _entry_from_state(item) -> dict | None:
+    """
+    Запись журнала из файла состояния. Неизвестная операция (файл другой версии
+    программы) или запись с неверными параметрами восстанавливается выражением
+    по сохраненному имени результата; запись без результата пропускается.
+    """
+    try:
+        entry = make_operation(
+            item["op"], item.get("inputs"), **(item.get("params") or {})
+        )
+    except (ExpressionError, KeyError, TypeError, AttributeError, ValueError) as e:
+        output = item.get("output") if isinstance(item, dict) else None
+        if not output:
+            logger.warning(f"Пропущена запись журнала операций {item}: {str(e)}")
+            return None
+        logger.warning(
+            f"Запись журнала операций {item} загружена как выражение: {str(e)}"
+        )
+        return make_operation("expression", expression=str(output))
+    # Имя результата хранится явно: выражение могло быть записано другой версией
+    # программы
+    entry["output"] = str(item.get("output") or entry["output"])
+    return entry
+
+
+class OperationLog:
+    """
+    Журнал операций с отменой и повтором.
+    Записи после позиции - отмененные операции, доступные для повтора;
+    новая операция их удаляет.
+
+    Attributes:
+        entries (list[dict]): Записи журнала.
+        position (int): Количество действующих (не отмененных) записей.
+    """
+
+    def __init__(self, entries: list[dict] | None = None) -> None:
+        self.entries = list(entries or [])
+        self.position = len(self.entries)
+
+    @property
+    def active(self) -> list[dict]:
+        """Действующие записи"""
+        return self.entries[: self.position]
+
+    def record(self, entry: dict) -> None:
+        del self.entries[self.position :]
+        self.entries.append(entry)
+        self.position += 1
+
+    def extend(self, entries: list[dict]) -> None:
+        for entry in entries:
+            self.record(entry)
+
+    def can_undo(self) -> bool:
+        return self.position > 0
+
+    def can_redo(self) -> bool:
+        return self.position < len(self.entries)
+
+    def undo(self) -> dict | None:
+        """Отменяет последнюю операцию и возвращает ее запись"""
+        if not self.can_undo():
+            return None
+        self.position -= 1
+        return self.entries[self.position]
+
+    def redo(self) -> dict | None:
+        """Повторяет отмененную операцию и возвращает ее запись"""
+        if not self.can_redo():
+            return None
+        self.position += 1
+        return self.entries[self.position - 1]
+
+    def clear(self) -> None:
+        self.entries = []
+        self.position = 0
+
+    def to_state(self) -> list[dict]:
+        """Действующие записи для файла состояния"""
+        return [
+            {
+                "op": entry["op"],
+                "inputs": list(entry["inputs"]),
+                "params": dict(entry["params"]),
+                "output": entry["output"],
+            }
+            for entry in self.active
+        ]
+
+    @classmethod
+    def from_state(cls, state: dict) -> "OperationLog":
+        """
+        Журнал из файла состояния: записи "operations" или, для старых файлов,
+        выражения "_Additional_data".
+        """
+        if state.get("operations"):
+            entries = []
+            for item in state["operations"]:
+                entry = _entry_from_state(item)
+                if entry is not None:
+                    entries.append(entry)
+            return cls(entries)
+        return cls(
+            [
+                make_operation("expression", expression=text)
+                for text in state.get("_Additional_data", None) or []
+            ]
+        )
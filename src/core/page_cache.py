@@ -0,0 +1,79 @@
+"""
+В этом файле содержится кэш отрисованных изображений страниц (графиков).
+Изображение страницы хранится в виде массива RGBA и ищется по хэшу настроек страницы,
+версии набора данных и размеру холста.
+"""
+import json
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+# Ключи состояния страницы, не влияющие на изображение графика
+NON_VISUAL_KEYS = ("id", "alternative_caption")
+
+
+def page_key(state: dict, data_version: int, size: tuple[int, int]) -> str:
+    """
+    Возвращает ключ кэша для страницы.
+
+    Args:
+        state (dict): Состояние страницы в формате файла сохранения.
+        data_version (int): Версия набора данных.
+        size (tuple[int, int]): Размер холста в физических пикселях (ширина, высота).
+    """
+    visual = {k: v for k, v in state.items() if k not in NON_VISUAL_KEYS}
+    payload = json.dumps(
+        [visual, data_version, list(size)], sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class PageBitmapCache:
+    """
+    LRU-кэш изображений страниц с ограничением по памяти.
+
+    Attributes:
+        max_bytes (int): Максимальный объем памяти под изображения.
+        nbytes (int): Текущий объем памяти, занятый изображениями.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._images: OrderedDict[str, np.ndarray] = OrderedDict()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._images
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def get(self, key: str) -> np.ndarray | None:
+        """Возвращает изображение и помечает его как недавно использованное"""
+        image = self._images.get(key)
+        if image is not None:
+            self._images.move_to_end(key)
+        return image
+
+    def put(self, key: str, image: np.ndarray) -> None:
+        """Добавляет изображение, вытесняя давно не использованные при превышении лимита"""
+        if image.nbytes > self.max_bytes:
+            return
+        self.discard(key)
+        self._images[key] = image
+        self.nbytes += image.nbytes
+        while self.nbytes > self.max_bytes:
+            _, old = self._images.popitem(last=False)
+            self.nbytes -= old.nbytes
+
+    def discard(self, key: str) -> None:
+        """Удаляет изображение из кэша"""
+        image = self._images.pop(key, None)
+        if image is not None:
+            self.nbytes -= image.nbytes
+
+    def clear(self) -> None:
+        """Очищает кэш"""
+        self._images.clear()
+        self.nbytes = 0
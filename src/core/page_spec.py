@@ -0,0 +1,121 @@
+"""
+В этом файле содержатся функции работы со спецификацией страницы (графика).
+Спецификация - обычный словарь в формате файла сохранения (.yaml): выбранные линии,
+настройки осей, альтернативная подпись и ID. Виджеты главного окна только отображают
+спецификацию видимой страницы, поэтому память и время загрузки проекта почти
+не зависят от количества страниц.
+"""
+import re
+import copy
+
+from src.core.constants import (
+    LINES_PER_PAGE,
+    MANY_LINES_MAX,
+    PAGE_MODES,
+    DEFAULT_GRID_LAYOUT,
+)
+
+
+def new_page_spec(page_id: str) -> dict:
+    """Возвращает спецификацию новой (пустой) страницы"""
+    return {
+        "id": page_id,
+        "Symbol_Y": ["", ""],
+        "Symbol_X": ["s", "t"],
+        "Axis_settings": {
+            "X": "auto",
+            "Y": "auto",
+            "Frequency": "auto",
+            "X_grid_lines": "4",
+        },
+        "Lists": [""] * LINES_PER_PAGE,
+        "Mode": "lines",
+        "Legend": False,
+        "Grid": DEFAULT_GRID_LAYOUT,
+        "alternative_caption": "",
+    }
+
+
+def pad_lines(lists: list[str], mode: str) -> list[str]:
+    """
+    Приводит список линий к режиму страницы: в обычном режиме ровно LINES_PER_PAGE линий,
+    в режиме 'много линий' - не меньше LINES_PER_PAGE и не больше MANY_LINES_MAX.
+    """
+    limit = MANY_LINES_MAX if mode == "many" else LINES_PER_PAGE
+    lists = list(lists)[:limit]
+    return lists + [""] * (LINES_PER_PAGE - len(lists))
+
+
+def spec_from_state(page_state: dict, page_id: str) -> dict:
+    """
+    Формирует спецификацию страницы из состояния, прочитанного из файла сохранения.
+    Отсутствующие поля заполняются значениями по умолчанию.
+
+    Args:
+        page_state (dict): Состояние страницы из файла сохранения.
+        page_id (str): ID страницы, если он не задан в файле.
+    """
+    spec = new_page_spec(str(page_state.get("id", page_id)))
+    symbol_y = page_state.get("Symbol_Y", spec["Symbol_Y"])
+    symbol_x = page_state.get("Symbol_X", spec["Symbol_X"])
+    spec["Symbol_Y"] = [str(symbol_y[0]), str(symbol_y[1])]
+    spec["Symbol_X"] = [str(symbol_x[0]), str(symbol_x[1])]
+    for key, value in page_state.get("Axis_settings", {}).items():
+        spec["Axis_settings"][key] = str(value)
+    mode = str(page_state.get("Mode", "lines"))
+    spec["Mode"] = mode if mode in PAGE_MODES else "lines"
+    spec["Legend"] = bool(page_state.get("Legend", False))
+    spec["Grid"] = str(page_state.get("Grid", DEFAULT_GRID_LAYOUT))
+    spec["Lists"] = pad_lines(
+        [str(text) for text in page_state.get("Lists", [])], spec["Mode"]
+    )
+    spec["alternative_caption"] = str(page_state.get("alternative_caption") or "")
+    return spec
+
+
+def next_page_number(specs: list[dict]) -> int:
+    """Номер, начиная с которого ID новых страниц (graph_N) не совпадут с имеющимися"""
+    numbers = [
+        int(match.group(1))
+        for spec in specs
+        if (match := re.fullmatch(r"graph_(\d+)", spec["id"]))
+    ]
+    return max(numbers, default=-1) + 1
+
+
+def clear_page_spec(spec: dict) -> None:
+    """
+    Очищает страницу так же, как кнопка 'Очистить график':
+    сбрасываются линии, обозначения оси Y и границы осей.
+    """
+    spec["Lists"] = [""] * LINES_PER_PAGE
+    spec["Symbol_Y"] = ["", ""]
+    spec["Axis_settings"]["X"] = "auto"
+    spec["Axis_settings"]["Y"] = "auto"
+    spec["Axis_settings"]["Frequency"] = "auto"
+
+
+def copy_page_spec(spec: dict) -> dict:
+    """Возвращает независимую копию спецификации страницы"""
+    return copy.deepcopy(spec)
+
+
+def spec_labels(spec: dict) -> list[str]:
+    """Подписи линий страницы для документа Word"""
+    return [text.split(",")[0].strip() for text in spec["Lists"] if text]
+
+
+def derived_columns(specs: list[dict]) -> list[str]:
+    """Вычисляемые параметры ($...$), используемые на страницах, без повторов"""
+    result = []
+    for spec in specs:
+        for text in spec["Lists"]:
+            if (
+                text not in result
+                and text.startswith("$")
+                and text.endswith("$")
+                and text != ""
+                and text != " "
+            ):
+                result.append(text)
+    return result
@@ -0,0 +1,653 @@
+"""
+В этом файле содержатся функции оформления и отрисовки графика страницы без виджетов Qt.
+Оформление совпадает с графиком главного окна (PlotArea), поэтому страницу можно
+отрисовать вне экрана (Agg) по её состоянию в формате файла сохранения.
+"""
+import os
+import re
+import math
+import colorsys
+import threading
+
+import numpy as np
+import matplotlib as mpl
+from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+
+from src.core.constants import (
+    COLORS,
+    MARKERS,
+    UNITS,
+    MANY_LINES_BUCKETS,
+    MANY_LINES_MARKERS,
+    LINES_PER_PAGE,
+    DEFAULT_GRID_LAYOUT,
+    GRID_BUCKETS,
+    VECTOR_FORMATS,
+    VECTOR_EXPORT_DPI,
+    VECTOR_RC,
+    PNG_OPTIONS,
+)
+from src.core.decimation import minmax_decimate, SharedDecimation
+from src.core.image_encoding import encode_png
+
+# Отрисовка matplotlib (в том числе разбор mathtext) не потокобезопасна,
+# поэтому все отрисовки фигур выполняются под общей блокировкой
+RENDER_LOCK = threading.RLock()
+
+GREEK_LETTERS = {
+    "alpha": r"\alpha",
+    "beta": r"\beta",
+    "gamma": r"\gamma",
+    "delta": r"\delta",
+    "pi": r"\pi",
+    "rho": r"\rho",
+    "tau": r"\tau",
+    "phi": r"\phi",
+    "omega": r"\omega",
+    "DeltaC": r"\Delta C",
+    "Phi": r"\Phi",
+}
+
+
+def x_label_text(group_x: str, sizing_x: str) -> str:
+    """Формирует текст в формате Latex для подписи оси X"""
+    unit_tex = "" if sizing_x == "" else r"\text{" + sizing_x + "}"
+    char_tex = "" if group_x == "" else r"\text{" + group_x + "}"
+    if char_tex != "" and unit_tex != "":
+        return rf"$\frac{{{unit_tex}}}{{{char_tex}}}$"
+    elif char_tex != "" and unit_tex == "":
+        return rf"${char_tex}$"
+    elif char_tex == "" and unit_tex != "":
+        return rf"${unit_tex}$"
+    return ""
+
+
+def y_label_text(group: str, sizing: str) -> str:
+    """Формирует текст в формате Latex для подписи оси Y"""
+    if sizing in UNITS:
+        unit_tex = UNITS[sizing]
+    elif sizing == "":
+        unit_tex = ""
+    else:
+        # Если пользователь ввел свое значение, экранируем его как текст.
+        unit_tex = r"\text{" + sizing + "}"
+    if group == "":
+        char_tex = ""
+    elif group in GREEK_LETTERS:
+        char_tex = GREEK_LETTERS[group]
+    else:
+        char_tex = r"\text{" + group + "}"
+    if char_tex != "" and unit_tex != "":
+        return rf"$\frac{{{char_tex}}}{{{unit_tex}}}$"
+    elif char_tex != "" and unit_tex == "":
+        return rf"${char_tex}$"
+    elif char_tex == "" and unit_tex != "":
+        return rf"${unit_tex}$"
+    return ""
+
+
+def x_axis_limit(text: str, time_max: float) -> float:
+    """
+    Возвращает правую границу оси X по тексту настройки.
+    Вызывает ValueError при неверном формате.
+    """
+    if text.isalpha() or text == "":
+        return time_max
+    return int(text)
+
+
+def parse_y_limits(text: str) -> tuple[float, float] | None:
+    """
+    Возвращает границы оси Y по тексту настройки или None для 'auto'.
+    Вызывает ValueError/IndexError при неверном формате.
+    """
+    text = text.strip().lower()
+    if text in ["auto", ""]:
+        return None
+    min_y = float(text.split(",")[0])
+    max_y = float(text.split(",")[1])
+    return min_y, max_y
+
+
+def y_autoscale_limits(
+    stats: list[dict], margin: float
+) -> tuple[float, float] | None:
+    """
+    Границы оси Y по статистике столбцов линий (как автомасштаб matplotlib с полями margin).
+    Возвращает None, если границы определить нельзя.
+    """
+    mins = [s["min"] for s in stats if s is not None and s["min"] is not None]
+    maxs = [s["max"] for s in stats if s is not None and s["max"] is not None]
+    if not mins:
+        return None
+    low, high = min(mins), max(maxs)
+    if low == high:
+        return None
+    pad = (high - low) * margin
+    return low - pad, high + pad
+
+
+def parse_grid_layout(text: str) -> tuple[int, int]:
+    """
+    Возвращает расположение панелей (строки, столбцы) по тексту вида '3x4'.
+    Вызывает ValueError при неверном формате или если панелей больше, чем линий на странице.
+    """
+    match = re.fullmatch(r"\s*(\d+)\s*[xхX×*]\s*(\d+)\s*", text)
+    if match is None:
+        raise ValueError(f"Неверное расположение панелей: {text}")
+    rows, cols = int(match.group(1)), int(match.group(2))
+    if rows < 1 or cols < 1 or rows * cols > LINES_PER_PAGE:
+        raise ValueError(f"Неверное расположение панелей: {text}")
+    return rows, cols
+
+
+def grid_layout(state: dict) -> tuple[int, int]:
+    """Расположение панелей страницы (при неверной настройке - по умолчанию)"""
+    try:
+        return parse_grid_layout(state.get("Grid", DEFAULT_GRID_LAYOUT))
+    except ValueError:
+        return parse_grid_layout(DEFAULT_GRID_LAYOUT)
+
+
+def marker_frequency(text: str, x_max: float) -> int | None:
+    """Возвращает частоту маркеров по тексту настройки или None при неверном формате"""
+    if text.isdigit() and int(text) > 0:
+        return int(text)
+    elif text in "auto" or text.startswith("0"):
+        return int(x_max / 10)
+    return None
+
+
+# Шаг оттенка (золотое сечение): соседние сгенерированные цвета не похожи друг на друга
+_HUE_STEP = 0.618033988749895
+
+
+def line_color(line_idx: int) -> str:
+    """
+    Цвет линии по её номеру.
+    Первые линии используют предопределенные цвета, для остальных цвет генерируется
+    по оттенку с шагом золотого сечения и чередующейся яркостью.
+    """
+    if line_idx < len(COLORS):
+        return COLORS[line_idx]
+    k = line_idx - len(COLORS)
+    hue = (k * _HUE_STEP) % 1.0
+    value = (0.85, 0.6, 0.4)[k % 3]
+    r, g, b = colorsys.hsv_to_rgb(hue, 0.9, value)
+    return f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
+
+
+def line_marker(line_idx: int):
+    """
+    Маркер линии по её номеру.
+    После предопределенных маркеров генерируются маркеры matplotlib вида
+    (число вершин, стиль: многоугольник/звезда/звездочка, угол поворота).
+    """
+    if line_idx < len(MARKERS):
+        return MARKERS[line_idx]
+    k = line_idx - len(MARKERS)
+    return (3 + k % 6, (k // 6) % 3, (k // 18) * 15 % 360)
+
+
+def draw_grid(ax) -> None:
+    """Основная сетка графика"""
+    ax.grid(
+        True,
+        which="major",
+        axis="both",
+        linestyle="-",
+        linewidth=0.5,
+        color="black",
+    )
+
+
+def style_axes(ax, x_label: str, y_label: str) -> None:
+    """Оформление осей: подписи, размеры шрифтов и форматы делений"""
+    ax.tick_params(axis="both", which="major", labelsize=12)
+    ax.xaxis.label.set_fontsize(14)
+    ax.yaxis.label.set_fontsize(14)
+    ax.set_xlabel(x_label, loc="right")
+    ax.set_ylabel(
+        y_label,
+        loc="top",
+        rotation=0,
+        labelpad=-10,
+    )
+    ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda val, loc: f"{val:.0f}"))
+    ax.yaxis.set_major_formatter(plt.ScalarFormatter(useMathText=True, useOffset=False))
+
+
+def set_x_limit(ax, x_limit: float, grid_lines: int) -> None:
+    """Устанавливает границы оси X и шаг вертикальных линий сетки"""
+    ax.set_xlim(0.0, x_limit)
+    ax.xaxis.set_major_locator(plt.MultipleLocator(x_limit / grid_lines))
+
+
+def update_legend(ax, quantity_lines: int) -> None:
+    """Перестраивает легенду графика"""
+    handles, labels = ax.get_legend_handles_labels()
+    if quantity_lines >= 7:
+        ncols = 2
+        fz = 9
+    else:
+        ncols = 1
+        fz = 10
+    if len(handles) > 1:
+        ax.legend(handles, labels, fontsize=fz, ncols=ncols)
+    else:
+        legend = ax.get_legend()
+        if legend is not None:
+            legend.remove()
+
+
+def apply_markers(ax, lines: dict, marker_freq: int) -> None:
+    """Расставляет маркеры на линиях и обновляет легенду"""
+    quantity_lines = len(lines)
+    if quantity_lines > 1:
+        step = int(math.sqrt(marker_freq))
+        for line_idx, line in lines.items():
+            line.set_marker(line_marker(line_idx))
+            line.set_markevery(marker_freq + line_idx * step)
+    update_legend(ax, quantity_lines)
+    ax.tick_params(axis="both", which="major", labelsize=12)
+
+
+def setup_page_axes(ax, state: dict, data) -> None:
+    """Оформление осей страницы: сетка, подписи и граница оси X"""
+    time = data.columns[0]
+    settings = state["Axis_settings"]
+    draw_grid(ax)
+    style_axes(
+        ax,
+        x_label_text(state["Symbol_X"][0], state["Symbol_X"][1]),
+        y_label_text(state["Symbol_Y"][0], state["Symbol_Y"][1]),
+    )
+    time_max = float(np.nanmax(data[time].to_numpy())) if len(data) else 0.0
+    try:
+        x_limit = x_axis_limit(settings["X"], time_max)
+    except ValueError:
+        x_limit = time_max
+    set_x_limit(ax, x_limit, int(settings["X_grid_lines"]))
+
+
+def page_marker_frequency(ax, state: dict) -> int:
+    """Частота маркеров страницы ('auto' и неверный формат - по границе оси X)"""
+    marker_freq = marker_frequency(state["Axis_settings"]["Frequency"], ax.get_xlim()[1])
+    if marker_freq is None:
+        marker_freq = int(ax.get_xlim()[1] / 10)
+    return marker_freq
+
+
+def apply_y_settings(ax, state: dict) -> None:
+    """Устанавливает границы оси Y по настройке страницы (для 'auto' - автомасштаб)"""
+    try:
+        y_limits = parse_y_limits(state["Axis_settings"]["Y"])
+    except (ValueError, IndexError):
+        y_limits = None
+    if y_limits is not None:
+        ax.set_ylim(*y_limits)
+    else:
+        ax.set_autoscaley_on(True)
+        ax.autoscale_view(scalex=False)
+
+
+def sparse_markers(ax, x, curves: dict, marker_freq: int) -> list:
+    """
+    Расставляет редкие маркеры на линиях режима 'много линий'.
+    На каждой линии не больше MANY_LINES_MARKERS маркеров со сдвигом фазы по номеру линии,
+    маркеры одной формы всех линий выводятся одной коллекцией.
+
+    Args:
+        ax (Axes): Оси matplotlib.
+        x (np.ndarray): Значения по оси X.
+        curves (dict): {номер линии: значения параметра}.
+        marker_freq (int): Частота маркеров (в точках данных).
+
+    Returns:
+        list: Коллекции маркеров.
+    """
+    if len(curves) < 2 or x.size == 0:
+        return []
+    step = max(int(marker_freq), x.size // MANY_LINES_MARKERS, 1)
+    groups = {}
+    for line_idx, y in curves.items():
+        phase = int((line_idx * _HUE_STEP) % 1.0 * step)
+        idx = np.arange(phase, x.size, step)
+        ys = np.asarray(y, dtype=np.float64)[idx]
+        xs = x[idx]
+        finite = np.isfinite(xs) & np.isfinite(ys)
+        if not finite.any():
+            continue
+        group = groups.setdefault(line_marker(line_idx), ([], [], []))
+        group[0].append(xs[finite])
+        group[1].append(ys[finite])
+        group[2].extend([line_color(line_idx)] * int(np.count_nonzero(finite)))
+    collections = []
+    for marker, (xs, ys, colors) in groups.items():
+        collections.append(
+            ax.scatter(
+                np.concatenate(xs),
+                np.concatenate(ys),
+                s=30,
+                marker=marker,
+                c=colors,
+                zorder=3,
+            )
+        )
+    return collections
+
+
+def many_lines_legend(ax, columns: dict) -> None:
+    """
+    Строит легенду режима 'много линий' по заместителям линий.
+    Вызывается только когда легенда включена, чтобы не создавать сотни артистов зря.
+    """
+    if len(columns) < 2:
+        return
+    handles = [
+        Line2D([], [], color=line_color(idx), marker=line_marker(idx), linewidth=1.0)
+        for idx in columns
+    ]
+    labels = [str(idx + 1) for idx in columns]
+    ax.legend(
+        handles,
+        labels,
+        fontsize=8,
+        ncols=math.ceil(len(handles) / 20),
+        handlelength=1.5,
+        columnspacing=0.8,
+    )
+
+
+def plot_many_lines(
+    ax, state: dict, data, n_buckets: int | None = MANY_LINES_BUCKETS
+) -> dict:
+    """
+    Строит линии страницы режима 'много линий' одной коллекцией LineCollection.
+    Каждая линия прореживается методом min/max, маркеры расставляются редко,
+    легенда строится только если включена в состоянии страницы.
+
+    Args:
+        ax (Axes): Оси с уже выполненным оформлением (setup_page_axes).
+        state (dict): Состояние страницы в формате файла сохранения.
+        data (pd.DataFrame): Данные для построения графика.
+        n_buckets (int | None): Количество интервалов прореживания линии.
+
+    Returns:
+        dict: collection - коллекция линий, markers - коллекции маркеров,
+            columns - {номер линии: имя столбца}.
+    """
+    x = data[data.columns[0]].to_numpy(dtype=np.float64)
+    segments, colors, columns, curves = [], [], {}, {}
+    for line_idx, column_name in enumerate(state["Lists"]):
+        if not column_name or column_name not in data.columns:
+            continue
+        y = data[column_name].to_numpy(dtype=np.float64)
+        xs, ys = minmax_decimate(x, y, n_buckets)
+        segments.append(np.column_stack([xs, ys]))
+        colors.append(line_color(line_idx))
+        columns[line_idx] = column_name
+        curves[line_idx] = y
+    collection = LineCollection(segments, colors=colors, linewidths=1.0)
+    ax.add_collection(collection)
+    apply_y_settings(ax, state)
+    markers = sparse_markers(ax, x, curves, page_marker_frequency(ax, state))
+    if state.get("Legend"):
+        many_lines_legend(ax, columns)
+    ax.tick_params(axis="both", which="major", labelsize=12)
+    return {"collection": collection, "markers": markers, "columns": columns}
+
+
+def plot_page(ax, state: dict, data) -> dict:
+    """
+    Строит график страницы на осях по её состоянию.
+
+    Args:
+        ax (Axes): Оси matplotlib.
+        state (dict): Состояние страницы в формате файла сохранения.
+        data (pd.DataFrame): Данные для построения графика.
+
+    Returns:
+        dict: Словарь линий {номер линии: Line2D}. В режиме 'много линий' пуст.
+    """
+    setup_page_axes(ax, state, data)
+    if state.get("Mode") == "many":
+        plot_many_lines(ax, state, data)
+        return {}
+    time = data.columns[0]
+    lines = {}
+    x = data[time].to_numpy()
+    for line_idx, column_name in enumerate(state["Lists"]):
+        if not column_name or column_name not in data.columns:
+            continue
+        (line,) = ax.plot(
+            x,
+            data[column_name].to_numpy(),
+            label=str(line_idx + 1),
+            color=line_color(line_idx),
+            linewidth=1.5,
+        )
+        lines[line_idx] = line
+    apply_y_settings(ax, state)
+    apply_markers(ax, lines, page_marker_frequency(ax, state))
+    return lines
+
+
+def plot_grid(fig, state: dict, data, decimation: SharedDecimation | None = None) -> dict:
+    """
+    Строит страницу с панелями: каждый параметр на своих осях с общей осью X.
+    Все панели строятся по одному прореженному индексу времени.
+
+    Args:
+        fig (Figure): Фигура matplotlib (очищается).
+        state (dict): Состояние страницы в формате файла сохранения.
+        data (pd.DataFrame): Данные для построения графика.
+        decimation (SharedDecimation | None): Общий прореженный индекс набора данных.
+            Если не задан, создается для этой отрисовки.
+
+    Returns:
+        dict: axes - список осей панелей, lines - {номер линии: Line2D}.
+    """
+    if decimation is None or decimation.data is not data:
+        decimation = SharedDecimation(data, GRID_BUCKETS)
+    rows, cols = grid_layout(state)
+    fig.clear()
+    grid = fig.subplots(
+        rows,
+        cols,
+        sharex=True,
+        squeeze=False,
+        gridspec_kw={"hspace": 0.35, "wspace": 0.3},
+    )
+    axes = list(grid.flat)
+    setup_page_axes(axes[0], state, data)
+    x_label = axes[0].get_xlabel()
+    lines = {}
+    for line_idx, ax in enumerate(axes):
+        column_name = state["Lists"][line_idx]
+        draw_grid(ax)
+        ax.tick_params(axis="both", which="major", labelsize=8)
+        ax.yaxis.set_major_formatter(
+            plt.ScalarFormatter(useMathText=True, useOffset=False)
+        )
+        ax.yaxis.get_offset_text().set_fontsize(8)
+        # Обозначение оси Y выводится одно на всю фигуру
+        ax.set_ylabel("")
+        if line_idx >= len(axes) - cols:
+            ax.set_xlabel(x_label, loc="right", fontsize=10)
+        else:
+            ax.set_xlabel("")
+        if not column_name or column_name not in data.columns:
+            continue
+        ax.set_title(column_name.split(",")[0], fontsize=9, loc="left")
+        (line,) = ax.plot(
+            decimation.x,
+            decimation.column(column_name),
+            color=line_color(line_idx),
+            linewidth=1.0,
+        )
+        lines[line_idx] = line
+        apply_y_settings(ax, state)
+    y_label = y_label_text(state["Symbol_Y"][0], state["Symbol_Y"][1])
+    if y_label:
+        fig.supylabel(y_label, fontsize=12)
+    return {"axes": axes, "lines": lines}
+
+
+def plot_figure(fig, state: dict, data) -> None:
+    """Строит страницу на пустой фигуре с учетом режима страницы"""
+    if state.get("Mode") == "grid":
+        plot_grid(fig, state, data)
+    else:
+        plot_page(fig.add_subplot(111), state, data)
+
+
+def render_page(state: dict, data, size: tuple[int, int], dpi: float) -> np.ndarray:
+    """
+    Отрисовывает страницу вне экрана (Agg) и возвращает изображение RGBA.
+
+    Args:
+        state (dict): Состояние страницы в формате файла сохранения.
+        data (pd.DataFrame): Данные для построения графика.
+        size (tuple[int, int]): Размер изображения в пикселях (ширина, высота).
+        dpi (float): Разрешение фигуры.
+    """
+    width, height = size
+    fig = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    plot_figure(fig, state, data)
+    with RENDER_LOCK:
+        canvas.draw()
+        return np.array(canvas.buffer_rgba(), copy=True)
+
+
+def decimate_to_output(fig, dpi: float) -> None:
+    """
+    Прореживает линии фигуры до физического разрешения вывода: не больше двух точек
+    (min и max) на пиксель ширины осей с учетом видимой части данных.
+    Используется для векторных форматов, где каждая точка становится вершиной пути.
+    """
+    width_in = fig.get_figwidth()
+    for ax in fig.axes:
+        pixels = ax.get_position().width * width_in * dpi
+        x0, x1 = ax.get_xlim()
+        for line in ax.lines:
+            x, y = line.get_data()
+            x = np.asarray(x, dtype=np.float64)
+            if x.size < 4:
+                continue
+            span = float(np.nanmax(x) - np.nanmin(x))
+            visible = abs(x1 - x0)
+            # Часть данных вне видимой области тоже делится на интервалы
+            scale = max(1.0, span / visible) if visible > 0 else 1.0
+            n_buckets = max(1, int(pixels * scale))
+            if x.size > 2 * n_buckets:
+                line.set_data(*minmax_decimate(x, np.asarray(y), n_buckets))
+
+
+def page_figure(state: dict, data, size_inches: tuple[float, float]) -> Figure:
+    """Строит фигуру страницы вне экрана (Agg)"""
+    fig = Figure(figsize=size_inches)
+    FigureCanvasAgg(fig)
+    plot_figure(fig, state, data)
+    return fig
+
+
+def figure_rgba(fig, dpi: float) -> np.ndarray:
+    """Отрисовывает фигуру с разрешением dpi и возвращает изображение RGBA"""
+    fig.set_dpi(dpi)
+    with RENDER_LOCK:
+        fig.canvas.draw()
+        return np.asarray(fig.canvas.buffer_rgba())
+
+
+def write_output(fname, data: bytes) -> None:
+    """Записывает содержимое файла по пути или в файлоподобный объект"""
+    if hasattr(fname, "write"):
+        fname.write(data)
+    else:
+        with open(fname, "wb") as f:
+            f.write(data)
+
+
+def save_page(
+    state: dict,
+    data,
+    fname,
+    size_inches: tuple[float, float],
+    dpi: float,
+    format: str = "png",
+) -> None:
+    """
+    Отрисовывает страницу вне экрана и сохраняет её в файл.
+    PNG кодируется из буфера RGBA через Pillow (см. image_encoding), для векторных
+    форматов линии прореживаются до разрешения VECTOR_EXPORT_DPI и упрощаются,
+    чтобы размер файла не зависел от количества точек данных.
+
+    Args:
+        state (dict): Состояние страницы в формате файла сохранения.
+        data (pd.DataFrame): Данные для построения графика.
+        fname: Путь к файлу или файлоподобный объект.
+        size_inches (tuple[float, float]): Размер фигуры в дюймах.
+        dpi (float): Разрешение изображения.
+        format (str): Формат файла.
+    """
+    fig = page_figure(state, data, size_inches)
+    if format == "png":
+        write_output(fname, encode_png(figure_rgba(fig, dpi), dpi, PNG_OPTIONS))
+        return
+    vector = format in VECTOR_FORMATS
+    if vector:
+        decimate_to_output(fig, VECTOR_EXPORT_DPI)
+    with RENDER_LOCK, mpl.rc_context(VECTOR_RC if vector else {}):
+        fig.canvas.print_figure(fname, format=format, dpi=dpi)
+
+
+def save_pages_pdf(
+    states: list[dict],
+    data,
+    path,
+    size_inches: tuple[float, float],
+    on_page=None,
+    is_canceled=None,
+) -> bool:
+    """
+    Сохраняет страницы в один многостраничный PDF.
+    Страницы строятся и записываются по одной, поэтому память не растет
+    с количеством страниц.
+
+    Args:
+        states (list[dict]): Состояния страниц в формате файла сохранения.
+        data (pd.DataFrame): Данные для построения графиков.
+        path: Путь к файлу PDF.
+        size_inches (tuple[float, float]): Размер страницы в дюймах.
+        on_page (callable | None): Вызывается с номером записанной страницы (с 0).
+        is_canceled (callable | None): Возвращает True, если экспорт нужно прервать.
+
+    Returns:
+        bool: False, если экспорт отменен (недописанный файл удаляется).
+    """
+    canceled = False
+    with PdfPages(path) as pdf:
+        for idx, state in enumerate(states):
+            if is_canceled is not None and is_canceled():
+                canceled = True
+                break
+            fig = page_figure(state, data, size_inches)
+            decimate_to_output(fig, VECTOR_EXPORT_DPI)
+            with RENDER_LOCK, mpl.rc_context(VECTOR_RC):
+                pdf.savefig(fig)
+            if on_page is not None:
+                on_page(idx)
+    if canceled:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return False
+    return True
@@ -0,0 +1,194 @@
+"""
+В этом файле содержится дисковый кэш экспортированных изображений страниц.
+Ключ - хэш SHA-256 содержимого: визуальные настройки страницы, отпечатки
+используемых столбцов данных, размер, разрешение и формат изображения.
+Неизмененная страница при повторном экспорте берется из кэша без отрисовки.
+Объем кэша ограничен, при превышении удаляются давно не использованные файлы.
+"""
+import os
+import json
+import shutil
+import hashlib
+from pathlib import Path
+
+from src.core.constants import PNG_OPTIONS
+from src.core.page_cache import NON_VISUAL_KEYS
+from src.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+# Версия формата ключа: увеличивается при изменении оформления графиков
+RENDER_KEY_VERSION = 2
+
+
+def page_columns(state: dict, data) -> list[str]:
+    """Столбцы данных, от которых зависит изображение страницы (время и линии)"""
+    columns = [data.columns[0]]
+    for text in state["Lists"]:
+        if text and text not in columns:
+            columns.append(text)
+    return columns
+
+
+def render_key(
+    state: dict,
+    fingerprints: dict,
+    size_inches,
+    dpi: float,
+    format: str = "png",
+    view=None,
+) -> str:
+    """
+    Возвращает ключ кэша изображения страницы.
+
+    Args:
+        state (dict): Состояние страницы в формате файла сохранения.
+        fingerprints (dict): {столбец: отпечаток} для столбцов page_columns
+            (None - столбца нет в наборе данных).
+        size_inches: Размер фигуры в дюймах.
+        dpi (float): Разрешение изображения.
+        format (str): Формат файла.
+        view: Границы осей, если изображение сохраняется с текущим масштабом графика.
+    """
+    visual = {k: v for k, v in state.items() if k not in NON_VISUAL_KEYS}
+    payload = json.dumps(
+        [
+            RENDER_KEY_VERSION,
+            visual,
+            sorted((str(k), v) for k, v in fingerprints.items()),
+            list(size_inches),
+            float(dpi),
+            format,
+            # Настройки кодирования меняют содержимое файла PNG
+            PNG_OPTIONS if format == "png" else None,
+            view,
+        ],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """
+    Дисковый кэш изображений страниц с ограничением объема и вытеснением LRU.
+    Время последнего использования файла хранится в его mtime.
+
+    Attributes:
+        directory (Path): Папка кэша.
+        max_bytes (int): Максимальный объем кэша.
+        hits (int): Количество попаданий за сеанс.
+        misses (int): Количество промахов за сеанс.
+    """
+
+    def __init__(self, directory, max_bytes: int) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._total = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key
+
+    def _files(self) -> list[os.DirEntry]:
+        if not self.directory.exists():
+            return []
+        return [entry for entry in os.scandir(self.directory) if entry.is_file()]
+
+    @property
+    def total_bytes(self) -> int:
+        """Текущий объем кэша (подсчитывается один раз, далее ведется)"""
+        if self._total is None:
+            self._total = sum(entry.stat().st_size for entry in self._files())
+        return self._total
+
+    def get_path(self, key: str) -> Path | None:
+        """Путь к изображению в кэше или None. Попадание обновляет время использования"""
+        path = self._path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def get(self, key: str) -> bytes | None:
+        """Содержимое изображения из кэша или None"""
+        path = self.get_path(key)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def copy_to(self, key: str, destination) -> bool:
+        """Копирует изображение из кэша в файл. Возвращает False при промахе"""
+        path = self.get_path(key)
+        if path is None:
+            return False
+        try:
+            shutil.copyfile(path, destination)
+        except OSError as e:
+            logger.warning(f"Ошибка копирования из кэша изображений: {str(e)}")
+            return False
+        return True
+
+    def put(self, key: str, data: bytes) -> None:
+        """Сохраняет изображение в кэш"""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            old_size = path.stat().st_size if path.exists() else 0
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Ошибка записи в кэш изображений: {str(e)}")
+            return
+        self._total = self.total_bytes - old_size + len(data)
+        self.evict()
+
+    def put_file(self, key: str, source) -> None:
+        """Сохраняет в кэш изображение из файла"""
+        try:
+            data = Path(source).read_bytes()
+        except OSError as e:
+            logger.warning(f"Ошибка чтения изображения для кэша: {str(e)}")
+            return
+        self.put(key, data)
+
+    def evict(self) -> None:
+        """Удаляет давно не использованные изображения сверх ограничения объема"""
+        if self.total_bytes <= self.max_bytes:
+            return
+        entries = sorted(self._files(), key=lambda entry: entry.stat().st_mtime)
+        total = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            size = entry.stat().st_size
+            try:
+                os.remove(entry.path)
+            except OSError:
+                continue
+            total -= size
+        self._total = total
+
+    def clear(self) -> None:
+        """Удаляет все изображения кэша"""
+        for entry in self._files():
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+        self._total = 0
+
+
+def hit_rate_text(hits: int, total: int) -> str:
+    """Текст доли страниц, взятых из кэша"""
+    percent = 100 * hits / total if total else 0
+    return f"Из кэша: {hits} из {total} ({percent:.0f}%)"
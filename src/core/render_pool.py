@@ -0,0 +1,169 @@
+"""
+В этом файле содержится пул рабочих процессов для отрисовки страниц вне экрана (Agg).
+Страница строится по своей спецификации функциями render.py, поэтому оформление
+совпадает с графиком главного окна. Набор данных один раз помещается в разделяемую
+память, рабочие процессы подключаются к ней без копирования и остаются запущенными
+до смены набора данных.
+"""
+import io
+import os
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from src.core.render import save_page
+
+# Набор данных рабочего процесса (задается при запуске процесса)
+_DATA = None
+_SHM = None
+
+
+def _open_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Подключается к разделяемой памяти без её учета в рабочем процессе"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13: параметра track нет
+        return shared_memory.SharedMemory(name=name)
+
+
+class SharedDataset:
+    """
+    Набор данных в разделяемой памяти.
+    Значения хранятся по столбцам (порядок Fortran), поэтому DataFrame в рабочем
+    процессе строится поверх памяти без копирования.
+    Нечисловой набор данных передается рабочим процессам копией.
+
+    Attributes:
+        descriptor (tuple): Описание набора для подключения в рабочем процессе.
+    """
+
+    def __init__(self, data, columns: list | None = None) -> None:
+        """
+        Args:
+            data: Набор данных (Dataset или DataFrame).
+            columns (list): Передаваемые столбцы (по умолчанию все).
+        """
+        self._shm = None
+        columns = list(data.columns) if columns is None else list(columns)
+        arrays = [data[name].to_numpy() for name in columns]
+        if any(values.dtype.kind not in "biuf" for values in arrays):
+            self.descriptor = (
+                "frame",
+                pd.DataFrame(dict(zip(columns, arrays)), columns=columns),
+            )
+            return
+        # Столбцы копируются в разделяемую память по одному, без общей копии набора
+        shape = (len(data), len(columns))
+        size = max(np.dtype(np.float64).itemsize * shape[0] * shape[1], 1)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        array = np.ndarray(shape, dtype=np.float64, buffer=shm.buf, order="F")
+        for idx, values in enumerate(arrays):
+            array[:, idx] = values
+        self._shm = shm
+        self.descriptor = ("shm", shm.name, shape, columns)
+
+    def close(self) -> None:
+        """Освобождает разделяемую память"""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+
+def attach_dataset(descriptor: tuple):
+    """
+    Подключается к набору данных по его описанию.
+
+    Returns:
+        tuple: (SharedMemory | None, pd.DataFrame).
+    """
+    if descriptor[0] == "frame":
+        return None, descriptor[1]
+    _, name, shape, columns = descriptor
+    shm = _open_shared_memory(name)
+    array = np.ndarray(shape, dtype=np.float64, buffer=shm.buf, order="F")
+    return shm, pd.DataFrame(array, columns=columns, copy=False)
+
+
+def _init_worker(descriptor: tuple) -> None:
+    """Инициализация рабочего процесса: подключение к набору данных"""
+    global _DATA, _SHM
+    _SHM, _DATA = attach_dataset(descriptor)
+
+
+def _save_task(state: dict, fname, size_inches, dpi: float, format: str):
+    """Отрисовка и сохранение страницы в рабочем процессе"""
+    save_page(state, _DATA, fname, size_inches, dpi, format=format)
+    return fname
+
+
+def _render_task(state: dict, size_inches, dpi: float, format: str) -> bytes:
+    """Отрисовка страницы в рабочем процессе в буфер памяти"""
+    buffer = io.BytesIO()
+    save_page(state, _DATA, buffer, size_inches, dpi, format=format)
+    return buffer.getvalue()
+
+
+class RenderPool:
+    """
+    Пул рабочих процессов отрисовки страниц.
+    Процессы запускаются при первой отрисовке и переиспользуются,
+    пока не изменится версия набора данных.
+
+    Attributes:
+        workers (int): Количество рабочих процессов.
+    """
+
+    def __init__(self, workers: int | None = None) -> None:
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self._executor = None
+        self._dataset = None
+        self._version = None
+
+    def prepare(self, data, version, columns: list | None = None) -> None:
+        """
+        Запускает процессы для набора данных (если они запущены для другой версии).
+        columns - передаваемые процессам столбцы (по умолчанию все).
+        """
+        if self._executor is not None and self._version == version:
+            return
+        self.shutdown()
+        self._dataset = SharedDataset(data, columns)
+        # spawn: дочерний процесс не наследует состояние Qt и потоков главного окна
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self._dataset.descriptor,),
+        )
+        self._version = version
+
+    def is_ready(self, version) -> bool:
+        """Процессы запущены для этой версии набора данных"""
+        return self._executor is not None and self._version == version
+
+    def submit_save(
+        self, state: dict, fname, size_inches, dpi: float, format: str = "png"
+    ) -> Future:
+        """Ставит в очередь отрисовку страницы в файл"""
+        return self._executor.submit(_save_task, state, fname, size_inches, dpi, format)
+
+    def submit_render(
+        self, state: dict, size_inches, dpi: float, format: str = "png"
+    ) -> Future:
+        """Ставит в очередь отрисовку страницы в память (результат - содержимое файла)"""
+        return self._executor.submit(_render_task, state, size_inches, dpi, format)
+
+    def shutdown(self) -> None:
+        """Останавливает рабочие процессы и освобождает набор данных"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._dataset is not None:
+            self._dataset.close()
+            self._dataset = None
+        self._version = None
@@ -0,0 +1,144 @@
+"""
+В этом файле содержатся скользящие статистики по временным окнам: минимум,
+максимум, среднее и сумма значений за ширину окна в секундах (а не за число
+точек) при неравномерном времени.
+
+Границы окон находятся бинарным поиском по времени один раз для всех столбцов.
+Сумма и среднее окна - разность накопленных сумм (O(n) независимо от ширины
+окна). Минимум и максимум - по таблице экстремумов отрезков длиной 2^k:
+окно покрывается двумя такими отрезками, таблица строится удвоением целыми
+массивами NumPy, уровней - log2 от наибольшего числа точек в окне.
+
+Значения - массив (n,), массив (n, k) или список массивов (n,) с общим временем.
+Пропуски (NaN) в окне не учитываются, в точке пропуска результат - NaN.
+"""
+import numpy as np
+
+
+def check_time(t: np.ndarray) -> np.ndarray:
+    """Время в виде массива float64 (ValueError, если время убывает)"""
+    t = np.asarray(t, dtype=np.float64)
+    if len(t) > 1 and np.any(np.diff(t) < 0):
+        raise ValueError("Время должно возрастать")
+    return t
+
+
+def apply_columns(y, func):
+    """Применяет func(столбец) к массиву (n,) или к каждому столбцу (n, k) или списка"""
+    if isinstance(y, (list, tuple)):
+        return [func(np.asarray(values, dtype=np.float64)) for values in y]
+    y = np.asarray(y, dtype=np.float64)
+    if y.ndim == 1:
+        return func(y)
+    result = np.empty(y.shape, order="F")
+    for j in range(y.shape[1]):
+        result[:, j] = func(y[:, j])
+    return result
+
+
+def window_bounds(
+    t: np.ndarray, window: float, centered: bool = False
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Границы временных окон для каждой точки: окно точки i - строки [lo[i], hi[i]).
+
+    Args:
+        t (np.ndarray): Возрастающее время.
+        window (float): Ширина окна, с.
+        centered (bool): Окно [t - w/2, t + w/2] или причинное окно [t - w, t].
+    """
+    t = check_time(t)
+    if window < 0:
+        raise ValueError("Ширина окна не может быть отрицательной")
+    if centered:
+        lo = np.searchsorted(t, t - window / 2, side="left")
+        hi = np.searchsorted(t, t + window / 2, side="right")
+    else:
+        lo = np.searchsorted(t, t - window, side="left")
+        hi = np.arange(1, len(t) + 1)
+    return lo, hi
+
+
+def _window_sums(values: np.ndarray, lo: np.ndarray, hi: np.ndarray):
+    """Суммы и количества значений без пропусков в окнах (накопленные суммы)"""
+    finite = np.isfinite(values)
+    sums = np.zeros(len(values) + 1)
+    np.cumsum(np.where(finite, values, 0.0), out=sums[1:])
+    counts = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum(finite, out=counts[1:])
+    return sums[hi] - sums[lo], counts[hi] - counts[lo], finite
+
+
+def rolling_sum(t: np.ndarray, y, window: float, centered: bool = False) -> np.ndarray:
+    """Скользящая сумма по временному окну (NaN, если в окне нет значений)"""
+    lo, hi = window_bounds(t, window, centered)
+
+    def column(values):
+        total, count, finite = _window_sums(values, lo, hi)
+        total[(count == 0) | ~finite] = np.nan
+        return total
+
+    return apply_columns(y, column)
+
+
+def rolling_mean(t: np.ndarray, y, window: float, centered: bool = False) -> np.ndarray:
+    """Скользящее среднее по временному окну"""
+    lo, hi = window_bounds(t, window, centered)
+
+    def column(values):
+        total, count, finite = _window_sums(values, lo, hi)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = total / count
+        result[~finite] = np.nan
+        return result
+
+    return apply_columns(y, column)
+
+
+def _levels(lo: np.ndarray, hi: np.ndarray) -> list[np.ndarray]:
+    """
+    Точки, сгруппированные по уровню k = floor(log2(длина окна)):
+    элемент k - номера точек, окно которых покрывается двумя отрезками 2^k.
+    Точки с пустым окном не входят ни в одну группу.
+    """
+    length = hi - lo
+    valid = np.flatnonzero(length > 0)
+    if len(valid) == 0:
+        return []
+    # frexp(m) = (f, e), m = f * 2^e, 0.5 <= f < 1: floor(log2(m)) = e - 1
+    level = np.frexp(length[valid].astype(np.float64))[1] - 1
+    order = np.argsort(level, kind="stable")
+    bounds = np.searchsorted(level[order], np.arange(level.max() + 2))
+    return [valid[order[bounds[k] : bounds[k + 1]]] for k in range(len(bounds) - 1)]
+
+
+def _rolling_extreme(t: np.ndarray, y, window: float, centered: bool, func):
+    lo, hi = window_bounds(t, window, centered)
+    levels = _levels(lo, hi)
+
+    def column(values):
+        n = len(values)
+        result = np.full(n, np.nan)
+        # current[i] - экстремум отрезка [i, i + span) (для i + span <= n)
+        current = values.copy()
+        span = 1
+        for k, points in enumerate(levels):
+            if len(points):
+                result[points] = func(current[lo[points]], current[hi[points] - span])
+            if k + 1 < len(levels):
+                current[: n - span] = func(current[: n - span], current[span:])
+                span *= 2
+        result[~np.isfinite(values)] = np.nan
+        return result
+
+    return apply_columns(y, column)
+
+
+def rolling_min(t: np.ndarray, y, window: float, centered: bool = False) -> np.ndarray:
+    """Скользящий минимум по временному окну"""
+    return _rolling_extreme(t, y, window, centered, np.fmin)
+
+
+def rolling_max(t: np.ndarray, y, window: float, centered: bool = False) -> np.ndarray:
+    """Скользящий максимум по временному окну"""
+    return _rolling_extreme(t, y, window, centered, np.fmax)
@@ -0,0 +1,81 @@
+"""
+В этом файле содержится отсортированный индекс по времени для получения значений
+параметров в произвольный момент времени: двоичный поиск (searchsorted) за O(log n)
+и линейная интерполяция между соседними точками.
+"""
+import numpy as np
+
+
+class SortedIndex:
+    """
+    Отсортированный индекс по оси времени.
+    Если время монотонно (обычный случай), массив используется без копирования,
+    иначе один раз строится порядок сортировки. Точки с NaN во времени не участвуют в поиске.
+
+    Attributes:
+        size (int): Количество точек, участвующих в поиске.
+    """
+
+    def __init__(self, x, monotonic: bool | None = None) -> None:
+        x = np.asarray(x, dtype=np.float64)
+        if monotonic is None:
+            monotonic = bool(np.all(np.diff(x) >= 0))
+        if monotonic:
+            self._order = None
+            self._x = x
+        else:
+            # argsort помещает NaN в конец
+            self._order = np.argsort(x, kind="stable")
+            self._x = x[self._order]
+        self.size = int(self._x.size - np.count_nonzero(np.isnan(self._x)))
+
+    def bounds(self) -> tuple[float, float] | None:
+        """Диапазон времени индекса"""
+        if self.size == 0:
+            return None
+        return float(self._x[0]), float(self._x[self.size - 1])
+
+    def locate(self, t: float) -> tuple[int, int, float] | None:
+        """
+        Находит соседние точки для момента t.
+
+        Returns:
+            tuple | None: (индекс левой точки, индекс правой точки, вес правой точки)
+                в исходном порядке данных или None, если t вне диапазона.
+        """
+        x = self._x
+        n = self.size
+        if n == 0 or not (x[0] <= t <= x[n - 1]):
+            return None
+        right = int(np.searchsorted(x[:n], t, side="left"))
+        if x[right] == t or right == 0:
+            left, weight = right, 0.0
+        else:
+            left = right - 1
+            weight = float((t - x[left]) / (x[right] - x[left]))
+        if self._order is not None:
+            left, right = int(self._order[left]), int(self._order[right])
+        return left, right, weight
+
+    def value_at(self, y, t: float) -> float:
+        """Значение параметра y в момент t (NaN вне диапазона)"""
+        position = self.locate(t)
+        if position is None:
+            return np.nan
+        left, right, weight = position
+        y0, y1 = float(y[left]), float(y[right])
+        if weight == 0.0:
+            return y0
+        return y0 + (y1 - y0) * weight
+
+    def values_at(self, ys: list, t: float) -> list[float]:
+        """Значения нескольких параметров в момент t с одним двоичным поиском"""
+        position = self.locate(t)
+        if position is None:
+            return [np.nan] * len(ys)
+        left, right, weight = position
+        values = []
+        for y in ys:
+            y0, y1 = float(y[left]), float(y[right])
+            values.append(y0 if weight == 0.0 else y0 + (y1 - y0) * weight)
+        return values
@@ -0,0 +1,159 @@
+"""
+В этом файле содержатся векторизованные операции обработки сигналов по времени:
+производная, скользящие средние, экспоненциальное сглаживание, инерционное звено
+первого порядка и передискретизация с фиксированным шагом.
+
+Время может быть неравномерным, но должно возрастать. Значения - массив (n,),
+массив (n, k) или список массивов (n,): k столбцов с общим временем
+обрабатываются за один вызов, данные, зависящие только от времени (границы окон,
+шаги), вычисляются один раз для всех столбцов. Список не требует сборки общего
+двумерного массива и возвращается списком. Пропуски (NaN) не распространяются
+на соседние точки: в точке пропуска результат - NaN.
+"""
+import numpy as np
+
+from src.core.rolling import apply_columns, check_time, rolling_mean
+
+# Максимальный показатель экспоненты в блоке рекурсивного фильтра:
+# множители exp(±показатель) остаются в пределах float64
+_MAX_EXPONENT = 500.0
+
+
+def derivative(t: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Производная по времени (центральные разности второго порядка, np.gradient)"""
+    t = check_time(t)
+
+    def column(values):
+        if len(t) < 2:
+            return np.full(len(values), np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.gradient(values, t)
+
+    return apply_columns(y, column)
+
+
+def moving_average(
+    t: np.ndarray, y: np.ndarray, window: float, centered: bool = True
+) -> np.ndarray:
+    """Скользящее среднее по временному окну, по умолчанию центрированному"""
+    return rolling_mean(t, y, window, centered)
+
+
+def _first_order(
+    decay: np.ndarray, drive: np.ndarray, elapsed: np.ndarray, start: float
+) -> np.ndarray:
+    """
+    Решает рекурсию s[i] = decay[i] * s[i-1] + drive[i], s[0] = start.
+
+    Рекурсия развертывается в накопленную сумму: при decay[i] = exp(-a[i]),
+    A[i] = a[1] + ... + a[i] (elapsed), s[i] = exp(-A[i]) * (start
+    + sum(drive[j] * exp(A[j]))). Чтобы множители не выходили за пределы float64,
+    вычисление идет блоками, в которых A растет не более чем на _MAX_EXPONENT.
+    """
+    n = len(drive)
+    result = np.empty(n)
+    result[0] = start
+    begin = 1
+    while begin < n:
+        base = elapsed[begin - 1]
+        end = int(np.searchsorted(elapsed, base + _MAX_EXPONENT, side="right"))
+        end = min(max(end, begin + 1), n)
+        exponent = elapsed[begin:end] - base
+        with np.errstate(over="ignore", invalid="ignore"):
+            acc = np.cumsum(drive[begin:end] * np.exp(exponent))
+            acc += result[begin - 1]
+            result[begin:end] = acc * np.exp(-exponent)
+        # Переполнение в блоке (скачок времени) - рекурсия напрямую
+        bad = ~np.isfinite(result[begin:end])
+        if bad.any():
+            for i in range(begin, end):
+                result[i] = decay[i] * result[i - 1] + drive[i]
+        begin = end
+    return result
+
+
+def _filter(t: np.ndarray, y: np.ndarray, tau: float, linear_input: bool):
+    t = check_time(t)
+    if tau <= 0:
+        raise ValueError("Постоянная времени должна быть положительной")
+    dt = np.diff(t)
+
+    def column(values):
+        if len(values) == 0:
+            return values.copy()
+        finite = np.isfinite(values)
+        if not finite.any():
+            return np.full(len(values), np.nan)
+        # В пропусках состояние фильтра сохраняется: шаг времени не учитывается
+        step = np.zeros(len(values))
+        step[1:] = np.where(finite[1:], dt, 0.0)
+        a = step / tau
+        decay = np.exp(-a)
+        held = np.where(finite, values, 0.0)
+        first = int(np.argmax(finite))
+        held[:first] = values[first]
+        # Значение входа в предыдущей точке без пропуска
+        last = np.maximum.accumulate(np.where(finite, np.arange(len(values)), first))
+        previous = np.empty(len(values))
+        previous[0] = held[0]
+        previous[1:] = held[last[:-1]]
+        drive = (1.0 - decay) * held
+        if linear_input:
+            # Вход линейно меняется между точками (точное решение для звена 1 порядка)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = np.where(a > 0, (1.0 - decay) / a, 1.0)
+            drive = (1.0 - ratio) * held + (ratio - decay) * previous
+        drive[~finite] = 0.0
+        result = _first_order(decay, drive, np.cumsum(a), held[0])
+        result[~finite] = np.nan
+        return result
+
+    return apply_columns(y, column)
+
+
+def exponential_smoothing(t: np.ndarray, y: np.ndarray, tau: float) -> np.ndarray:
+    """
+    Экспоненциальное сглаживание с постоянной времени tau для неравномерного
+    шага: s[i] = s[i-1] + (1 - exp(-dt/tau)) * (y[i] - s[i-1]).
+    """
+    return _filter(t, y, tau, linear_input=False)
+
+
+def lag_filter(t: np.ndarray, y: np.ndarray, tau: float) -> np.ndarray:
+    """
+    Инерционное (апериодическое) звено первого порядка T*s' + s = y
+    с линейной интерполяцией входа между точками.
+    """
+    return _filter(t, y, tau, linear_input=True)
+
+
+def resample_grid(t: np.ndarray, step: float) -> np.ndarray:
+    """Равномерная сетка времени с шагом step от первой до последней точки"""
+    t = check_time(t)
+    if step <= 0:
+        raise ValueError("Шаг должен быть положительным")
+    if len(t) == 0:
+        return t
+    count = int(np.floor((t[-1] - t[0]) / step)) + 1
+    return t[0] + step * np.arange(count)
+
+
+def resample(t: np.ndarray, y: np.ndarray, step: float) -> np.ndarray:
+    """
+    Передискретизация с фиксированным шагом на исходное время: значение
+    в точке - значение сигнала (линейная интерполяция) в последнем узле
+    равномерной сетки, удерживаемое до следующего узла.
+    Так производный столбец показывает сигнал, записанный с шагом step.
+    """
+    t = check_time(t)
+    grid = resample_grid(t, step)
+    if len(grid) > 0:
+        node = np.minimum(((t - t[0]) // step).astype(np.int64), len(grid) - 1)
+
+    def column(values):
+        finite = np.isfinite(values)
+        if len(grid) == 0 or not finite.any():
+            return np.full(len(values), np.nan)
+        return np.interp(grid, t[finite], values[finite])[node]
+
+    return apply_columns(y, column)
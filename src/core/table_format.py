@@ -0,0 +1,98 @@
+"""
+В этом файле содержится форматирование значений таблицы данных.
+Ячейки форматируются не по одной, а блоками строк столбца за один вызов NumPy.
+Отформатированные блоки хранятся в ограниченном кэше (LRU), поэтому при прокрутке
+таблицы каждая видимая ячейка преобразуется в текст один раз.
+"""
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from src.core.constants import TABLE_BLOCK_ROWS, TABLE_CACHE_BLOCKS, TABLE_PRECISION
+from src.core.dataset import Dataset, DatasetOverlay
+
+
+def format_values(values: np.ndarray, precision: int) -> list[str]:
+    """
+    Преобразует значения в текст.
+
+    Args:
+        values (np.ndarray): Значения блока.
+        precision (int): Количество значащих цифр для чисел с плавающей точкой.
+    """
+    if values.dtype.kind == "f":
+        return np.char.mod(f"%.{precision}g", values).tolist()
+    return [str(value) for value in values.tolist()]
+
+
+class BlockFormatCache:
+    """
+    Кэш текстов ячеек, сгруппированных в блоки по TABLE_BLOCK_ROWS строк столбца.
+
+    Attributes:
+        precision (int): Количество значащих цифр.
+        block_rows (int): Строк в блоке.
+        max_blocks (int): Максимальное количество блоков в кэше.
+    """
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        precision: int = TABLE_PRECISION,
+        block_rows: int = TABLE_BLOCK_ROWS,
+        max_blocks: int = TABLE_CACHE_BLOCKS,
+    ) -> None:
+        self.precision = precision
+        self.block_rows = block_rows
+        self.max_blocks = max_blocks
+        self._data = data
+        # Массивы столбцов по номеру (без копирования, где это возможно)
+        self._arrays = {}
+        self._blocks = OrderedDict()
+
+    def array(self, col: int) -> np.ndarray:
+        """Массив значений столбца по номеру"""
+        values = self._arrays.get(col)
+        if values is None:
+            name = self._data.columns[col]
+            if isinstance(self._data, (Dataset, DatasetOverlay)) and (
+                self._data.is_derived(name)
+            ):
+                # Значения производного столбца хранит кэш набора данных
+                return self._data.column(name)
+            values = self._data[name].to_numpy()
+            self._arrays[col] = values
+        return values
+
+    def text(self, row: int, col: int) -> str:
+        """Текст ячейки"""
+        block = row // self.block_rows
+        key = (col, block)
+        texts = self._blocks.get(key)
+        if texts is None:
+            start = block * self.block_rows
+            texts = format_values(
+                self.array(col)[start : start + self.block_rows], self.precision
+            )
+            self._blocks[key] = texts
+            if len(self._blocks) > self.max_blocks:
+                self._blocks.popitem(last=False)
+        else:
+            self._blocks.move_to_end(key)
+        return texts[row - block * self.block_rows]
+
+    def set_precision(self, precision: int) -> None:
+        """Изменяет количество значащих цифр (кэш текстов сбрасывается)"""
+        self.precision = precision
+        self._blocks.clear()
+
+    def invalidate(self, col: int | None = None) -> None:
+        """Сбрасывает кэш столбца (или всех столбцов) после изменения данных"""
+        if col is None:
+            self._arrays.clear()
+            self._blocks.clear()
+            return
+        self._arrays.pop(col, None)
+        for key in [key for key in self._blocks if key[0] == col]:
+            del self._blocks[key]
@@ -2,6 +2,8 @@
 В этом файле содержатся все стили QSS применяемые в программе для различных виджетов
 """
 
+import re
+
 from src.utils import resources
 
 SPIN_BOX_STYLE = str(
@@ -328,3 +330,40 @@ QStackedWidget > QWidget {
 }
 """
 )
+LINE_LABEL_STYLE = str(
+    "QLabel#lineLabel {\n"
+    "font-size: 14px; \n"
+    "font-weight: 500;\n"
+    "color: black;\n"
+    "min-width: 90px;\n"
+    "}\n"
+)
+SETTINGS_LABEL_STYLE = str(
+    "QLabel#settingsLabel {\n"
+    "    color: black;\n"
+    "    font-family: 'Segoe UI', sans-serif; \n"
+    "    font-size: 14px;\n"
+    "    font-weight: 400; /* Уменьшаем жирность */\n"
+    "    background-color: transparent;\n"
+    "    padding: 2px 0; /* Добавляем небольшой отступ */\n"
+    "}\n"
+)
+
+
+def scoped_style(style: str, widget: str, name: str) -> str:
+    """Ограничивает стиль виджетами класса widget с объектным именем name"""
+    return re.sub(rf"\b{widget}\b(?!#)", f"{widget}#{name}", style)
+
+
+# Общий стиль приложения: устанавливается один раз через QApplication.setStyleSheet,
+# виджеты страниц выбираются по objectName и не разбирают собственные стили при создании
+APP_STYLE = "\n".join(
+    [
+        LINE_LABEL_STYLE,
+        scoped_style(COMBO_STYLE_LEFT, "QComboBox", "lineCombo"),
+        SETTINGS_LABEL_STYLE,
+        scoped_style(COMBO_STYLE, "QComboBox", "settingsCombo"),
+        scoped_style(LINE_EDIT_STYLE, "QLineEdit", "settingsEdit"),
+        scoped_style(SPIN_BOX_STYLE, "QSpinBox", "settingsSpinBox"),
+    ]
+)
@@ -1,43 +1,57 @@
 from PyQt5.QtWidgets import QComboBox, QCompleter
 from PyQt5.QtCore import QStringListModel, Qt, pyqtSignal
 
+
+class ColumnModel(QStringListModel):
+    """
+    Общая модель имен столбцов данных.
+    Одна модель используется всеми выпадающими списками параметров,
+    поэтому загрузка файла или добавление столбца выполняется один раз.
+    """
+
+    def set_columns(self, columns):
+        """Заменяет список столбцов"""
+        self.setStringList([str(column) for column in columns])
+
+    def append_columns(self, columns):
+        """Добавляет столбцы в конец списка, пропуская уже имеющиеся"""
+        existing = set(self.stringList())
+        new_columns = [str(column) for column in columns if str(column) not in existing]
+        if not new_columns:
+            return
+        row = self.rowCount()
+        self.insertRows(row, len(new_columns))
+        for offset, column in enumerate(new_columns):
+            self.setData(self.index(row + offset), column)
+
+
 class MyComboBox(QComboBox):
     """Кастомный выпадающий список"""
     cleared = pyqtSignal()
 
-    def __init__(self, parent=None):
+    def __init__(self, model: QStringListModel = None, parent=None):
         super().__init__(parent)
         self.setEditable(True)
+        # Введенный текст не добавляется в модель: она может быть общей
+        self.setInsertPolicy(QComboBox.NoInsert)
         self.setPlaceholderText("Параметр, кг")
         self.setMaxVisibleItems(30)
-        self.model = QStringListModel()
-        self.completer = QCompleter()
-        self.completer.setModel(self.model)
+        if model is None:
+            model = ColumnModel(self)
+        self.setModel(model)
+        self.completer = QCompleter(self)
+        self.completer.setModel(model)
         self.completer.setCompletionMode(QCompleter.PopupCompletion)
         self.completer.setFilterMode(Qt.MatchContains)
         self.completer.setCaseSensitivity(Qt.CaseInsensitive)
         self.completer.setMaxVisibleItems(30)
         self.setCompleter(self.completer)
-        self._original_items = []
         self.currentTextChanged.connect(self._on_text_changed)
 
     def wheelEvent(self, event):
         """Обработчик события прокрутки колеса мыши - отключение"""
         event.ignore()
 
-    def addItems(self, list: list):
-        super().addItems(list)
-        self._original_items.extend(list)
-        self._update_model()
-
-    def insertItems(self, index: int, list: list):
-        super().insertItems(index, list)
-        self._original_items.extend(list)
-        self._update_model()
-
-    def _update_model(self):
-        self.model.setStringList(self._original_items)
-
     def _on_text_changed(self, text):
         if not text:
             self.cleared.emit()
@@ -48,4 +62,4 @@ class MyComboBox(QComboBox):
 
     def leaveEvent(self, event):
         super().leaveEvent(event)
-        self.setToolTip("")
\ No newline at end of file
+        self.setToolTip("")
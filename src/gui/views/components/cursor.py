@@ -0,0 +1,178 @@
+"""Модуль перекрестия с показаниями линий графика под курсором"""
+import numpy as np
+from PyQt5.QtCore import QTimer
+
+from src.core.constants import CURSOR_MAX_ROWS
+from src.core.render import line_color
+from src.core.sampling import SortedIndex
+from src.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class CursorReadout:
+    """
+    Перекрестие (вертикальная линия) с показаниями всех линий графика в момент времени
+    под курсором мыши. Значения находятся двоичным поиском по отсортированному индексу
+    времени с линейной интерполяцией, перерисовываются только перекрестие и подпись (blitting).
+
+    Attributes:
+        plot_area (PlotArea): Область графика.
+        enabled (bool): Режим перекрестия включен.
+        time (float | None): Текущий момент времени перекрестия.
+    """
+
+    def __init__(self, plot_area):
+        self.plot_area = plot_area
+        self.canvas = plot_area.canvas
+        self.enabled = False
+        self.time = None
+        self._cids = []
+        self._artists = None
+        self._background = None
+        self._index = None
+        self._index_version = None
+
+    def set_enabled(self, enabled: bool):
+        """Включает или выключает режим перекрестия"""
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        if enabled:
+            self._cids = [
+                self.canvas.mpl_connect("motion_notify_event", self._on_motion),
+                self.canvas.mpl_connect("draw_event", self._on_draw),
+            ]
+        else:
+            for cid in self._cids:
+                self.canvas.mpl_disconnect(cid)
+            self._cids = []
+            self._remove_artists()
+        self._background = None
+        self.canvas.draw_idle()
+
+    def reset(self):
+        """Сбрасывает фон и артисты (после очистки осей или перепривязки страницы)"""
+        self._artists = None
+        self._background = None
+
+    def show_time(self, t: float | None):
+        """Показывает перекрестие в момент t (например, переданный с другой страницы)"""
+        self.time = t
+        if not self.enabled:
+            return
+        if self.plot_area.stale:
+            # Показан кэш изображения: после перестроения перекрестие выведется в _on_draw
+            self.plot_area.ensure_current()
+        elif self._background is not None:
+            self._update_artists()
+            self._blit()
+
+    def _on_motion(self, event):
+        """Перемещение мыши над графиком"""
+        if event.button is not None or event.inaxes is not self.canvas.ax:
+            return
+        main_window = self.plot_area.main_window
+        if main_window.cursor_sync:
+            main_window.cursor_time = event.xdata
+        self.show_time(event.xdata)
+
+    def _on_draw(self, event):
+        """Запоминает фон после полной отрисовки графика"""
+        if getattr(self.canvas, "_is_saving", False):
+            # Отрисовка при сохранении в файл не относится к экрану
+            return
+        self._ensure_artists()
+        self._background = self.canvas.copy_from_bbox(self.canvas.ax.bbox)
+        # Перекрестие выводится после отрисовки, чтобы не попасть в кэш изображений страниц
+        QTimer.singleShot(0, self._refresh)
+
+    def _refresh(self):
+        if self.enabled and self._background is not None:
+            self._update_artists()
+            self._blit()
+
+    def _ensure_artists(self):
+        """Создает артисты перекрестия, если оси были очищены"""
+        if self._artists is not None and self._artists[0].axes is self.canvas.ax:
+            return
+        ax = self.canvas.ax
+        vline = ax.axvline(0.0, color="dimgray", linewidth=0.8, animated=True)
+        points = ax.scatter([], [], s=25, zorder=5, animated=True)
+        text = ax.text(
+            0.01,
+            0.99,
+            "",
+            transform=ax.transAxes,
+            ha="left",
+            va="top",
+            fontsize=9,
+            animated=True,
+            bbox=dict(facecolor="white", alpha=0.8, edgecolor="gray"),
+        )
+        self._artists = (vline, points, text)
+
+    def _remove_artists(self):
+        if self._artists is not None:
+            for artist in self._artists:
+                if artist.axes is not None:
+                    artist.remove()
+        self._artists = None
+
+    def _time_index(self) -> SortedIndex:
+        """Отсортированный индекс времени текущего набора данных (строится один раз)"""
+        main_window = self.plot_area.main_window
+        if self._index is None or self._index_version != main_window.data_version:
+            data = self.plot_area.data
+            time = data.columns[0]
+            stats = main_window.column_stats[time]
+            monotonic = stats["monotonic"] and not stats["nan"] and not stats["inf"]
+            self._index = SortedIndex(data[time].to_numpy(), monotonic)
+            self._index_version = main_window.data_version
+        return self._index
+
+    def _update_artists(self):
+        """Обновляет положение перекрестия и значения линий"""
+        self._ensure_artists()
+        vline, points, text = self._artists
+        t = self.time
+        spec = self.plot_area.spec
+        if t is None or spec is None:
+            for artist in self._artists:
+                artist.set_visible(False)
+            return
+        index = self._time_index()
+        data = self.plot_area.data
+        columns = {
+            line_idx: column
+            for line_idx, column in sorted(self.plot_area.line_columns().items())
+            if column in data.columns
+        }
+        values = index.values_at([data[c].to_numpy() for c in columns.values()], t)
+        rows = [f"t = {t:.6g}"]
+        # На странице с панелями точки линий вне первой панели не показываются
+        single_axes = len(self.canvas.figure.axes) == 1
+        offsets = []
+        colors = []
+        for line_idx, value in zip(columns, values):
+            if len(rows) <= CURSOR_MAX_ROWS:
+                rows.append(f"{line_idx + 1}: {value:.6g}")
+            if single_axes and np.isfinite(value):
+                offsets.append((t, value))
+                colors.append(line_color(line_idx))
+        if len(columns) > CURSOR_MAX_ROWS:
+            rows.append(f"… ещё {len(columns) - CURSOR_MAX_ROWS}")
+        vline.set_xdata([t, t])
+        points.set_offsets(np.array(offsets).reshape(-1, 2))
+        points.set_color(colors)
+        text.set_text("\n".join(rows))
+        for artist in self._artists:
+            artist.set_visible(True)
+
+    def _blit(self):
+        """Вывод перекрестия поверх сохраненного фона"""
+        canvas = self.canvas
+        canvas.restore_region(self._background)
+        for artist in self._artists:
+            canvas.ax.draw_artist(artist)
+        canvas.blit(canvas.ax.bbox)
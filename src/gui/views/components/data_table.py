@@ -12,11 +12,20 @@ from PyQt5.QtWidgets import (
     QMessageBox,
     QHeaderView,
     QTableView,
+    QShortcut,
 )
-from PyQt5.QtGui import QIcon
+from PyQt5.QtGui import QIcon, QKeySequence
 
 from src.utils.logger import Logger
-from src.core.constants import ICONS_DIR
+from src.core.constants import ICONS_DIR, TABLE_FETCH_ROWS, TABLE_PRECISION
+from src.core.column_stats import ColumnStats, format_column_stats
+from src.core.table_format import BlockFormatCache
+from src.core.integration import cumulative_integral
+from src.core import rolling, signal_ops
+from src.core.rolling import check_time
+from src.core.dataset import Dataset, DatasetOverlay, compile_derived
+from src.core.expressions import ExpressionError
+from src.core.operation_log import OperationLog, make_operation, operation_title
 
 logger = Logger.get_logger(__name__)
 
@@ -61,42 +70,263 @@ class DataOperations:
     @staticmethod
     def integral(df: pd.DataFrame, time_col: str, param_col: str) -> pd.Series:
         """
-        Вычисляет интеграл параметра по времени
+        Вычисляет накопленный интеграл параметра по времени (метод трапеций)
         """
         try:
-            result = []
-            for i in range(len(df)):
-                area = np.trapezoid(
-                    y=df[param_col].values[: i + 1], x=df[time_col].values[: i + 1]
-                )
-                result.append(area)
+            result = cumulative_integral(
+                df[time_col].to_numpy(), df[param_col].to_numpy()
+            )
             return pd.Series(result, index=df.index, name=f"Интеграл_{param_col}")
 
         except Exception as e:
             logger.error(f"Ошибка при вычислении интеграла: {str(e)}")
             return pd.Series([], name=f"Интеграл_{param_col}")
 
+    @staticmethod
+    def integrals(
+        df: pd.DataFrame, time_col: str, param_cols: list[str], method: str = "trapezoid"
+    ) -> pd.DataFrame:
+        """
+        Вычисляет накопленные интегралы нескольких параметров по общему времени
+        """
+        result = cumulative_integral(
+            df[time_col].to_numpy(), df[param_cols].to_numpy(), method=method
+        )
+        return pd.DataFrame(result, index=df.index, columns=param_cols)
+
     @staticmethod
     def horizontal(df: pd.DataFrame, const: np.float64) -> pd.Series:
         arr = np.full(shape=df.shape[0], fill_value=np.float64(const))
         return pd.Series(data=arr, name=str(const))
 
+    # Обработка сигналов (src/core/signal_ops.py). Операции принимают несколько
+    # столбцов с общим временем и возвращают DataFrame с теми же именами столбцов.
+    # Столбцы передаются списком массивов: общий двумерный массив не собирается
+
+    @staticmethod
+    def _signal_columns(df: pd.DataFrame, param_cols: list[str]) -> list[np.ndarray]:
+        return [df[col].to_numpy(dtype=np.float64) for col in param_cols]
+
+    @staticmethod
+    def _signal_frame(
+        df: pd.DataFrame, param_cols: list[str], values: list[np.ndarray]
+    ) -> pd.DataFrame:
+        return pd.DataFrame(dict(zip(param_cols, values)), index=df.index)
+
+    @staticmethod
+    def derivative(
+        df: pd.DataFrame, time_col: str, param_cols: list[str]
+    ) -> pd.DataFrame:
+        """Производная параметров по времени"""
+        values = signal_ops.derivative(
+            df[time_col].to_numpy(), DataOperations._signal_columns(df, param_cols)
+        )
+        return DataOperations._signal_frame(df, param_cols, values)
+
+    @staticmethod
+    def moving_average(
+        df: pd.DataFrame, time_col: str, param_cols: list[str], window: float
+    ) -> pd.DataFrame:
+        """Скользящее среднее по центрированному окну шириной window секунд"""
+        values = signal_ops.moving_average(
+            df[time_col].to_numpy(),
+            DataOperations._signal_columns(df, param_cols),
+            window,
+            centered=True,
+        )
+        return DataOperations._signal_frame(df, param_cols, values)
+
+    @staticmethod
+    def causal_average(
+        df: pd.DataFrame, time_col: str, param_cols: list[str], window: float
+    ) -> pd.DataFrame:
+        """Скользящее среднее по предшествующим window секундам"""
+        values = signal_ops.moving_average(
+            df[time_col].to_numpy(),
+            DataOperations._signal_columns(df, param_cols),
+            window,
+            centered=False,
+        )
+        return DataOperations._signal_frame(df, param_cols, values)
+
+    @staticmethod
+    def exponential_smoothing(
+        df: pd.DataFrame, time_col: str, param_cols: list[str], tau: float
+    ) -> pd.DataFrame:
+        """Экспоненциальное сглаживание с постоянной времени tau"""
+        values = signal_ops.exponential_smoothing(
+            df[time_col].to_numpy(),
+            DataOperations._signal_columns(df, param_cols),
+            tau,
+        )
+        return DataOperations._signal_frame(df, param_cols, values)
+
+    @staticmethod
+    def lag_filter(
+        df: pd.DataFrame, time_col: str, param_cols: list[str], tau: float
+    ) -> pd.DataFrame:
+        """Инерционное звено первого порядка с постоянной времени tau"""
+        values = signal_ops.lag_filter(
+            df[time_col].to_numpy(),
+            DataOperations._signal_columns(df, param_cols),
+            tau,
+        )
+        return DataOperations._signal_frame(df, param_cols, values)
+
+    @staticmethod
+    def resample(
+        df: pd.DataFrame, time_col: str, param_cols: list[str], step: float
+    ) -> pd.DataFrame:
+        """
+        Передискретизация с шагом step без изменения времени таблицы: значения
+        в узлах равномерной сетки удерживаются до следующего узла.
+        Новая таблица на равномерной сетке - resample_to_grid
+        """
+        values = signal_ops.resample(
+            df[time_col].to_numpy(),
+            DataOperations._signal_columns(df, param_cols),
+            step,
+        )
+        return DataOperations._signal_frame(df, param_cols, values)
+
+    # Скользящие статистики по временному окну (src/core/rolling.py): по умолчанию
+    # окно [t - window, t], centered=True - окно [t - window/2, t + window/2]
+
+    @staticmethod
+    def rolling_min(
+        df: pd.DataFrame,
+        time_col: str,
+        param_cols: list[str],
+        window: float,
+        centered: bool = False,
+    ) -> pd.DataFrame:
+        """Скользящий минимум за window секунд"""
+        values = rolling.rolling_min(
+            df[time_col].to_numpy(),
+            DataOperations._signal_columns(df, param_cols),
+            window,
+            centered,
+        )
+        return DataOperations._signal_frame(df, param_cols, values)
+
+    @staticmethod
+    def rolling_max(
+        df: pd.DataFrame,
+        time_col: str,
+        param_cols: list[str],
+        window: float,
+        centered: bool = False,
+    ) -> pd.DataFrame:
+        """Скользящий максимум за window секунд"""
+        values = rolling.rolling_max(
+            df[time_col].to_numpy(),
+            DataOperations._signal_columns(df, param_cols),
+            window,
+            centered,
+        )
+        return DataOperations._signal_frame(df, param_cols, values)
+
+    @staticmethod
+    def rolling_mean(
+        df: pd.DataFrame,
+        time_col: str,
+        param_cols: list[str],
+        window: float,
+        centered: bool = False,
+    ) -> pd.DataFrame:
+        """Скользящее среднее за window секунд"""
+        values = rolling.rolling_mean(
+            df[time_col].to_numpy(),
+            DataOperations._signal_columns(df, param_cols),
+            window,
+            centered,
+        )
+        return DataOperations._signal_frame(df, param_cols, values)
+
+    @staticmethod
+    def rolling_sum(
+        df: pd.DataFrame,
+        time_col: str,
+        param_cols: list[str],
+        window: float,
+        centered: bool = False,
+    ) -> pd.DataFrame:
+        """Скользящая сумма за window секунд"""
+        values = rolling.rolling_sum(
+            df[time_col].to_numpy(),
+            DataOperations._signal_columns(df, param_cols),
+            window,
+            centered,
+        )
+        return DataOperations._signal_frame(df, param_cols, values)
+
+    @staticmethod
+    def resample_to_grid(
+        df: pd.DataFrame, time_col: str, param_cols: list[str], step: float
+    ) -> pd.DataFrame:
+        """Новая таблица на равномерной сетке времени с шагом step"""
+        time = df[time_col].to_numpy(dtype=np.float64)
+        grid = signal_ops.resample_grid(time, step)
+        result = pd.DataFrame({time_col: grid})
+        for col in param_cols:
+            values = df[col].to_numpy(dtype=np.float64)
+            finite = np.isfinite(values)
+            result[col] = (
+                np.interp(grid, time[finite], values[finite])
+                if finite.any()
+                else np.nan
+            )
+        return result
+
+
+# Параметры операций обработки сигналов: операция -> (имя параметра, подпись,
+# значение по умолчанию)
+SIGNAL_PARAMETERS = {
+    "moving_average": ("window", "Ширина окна, с:", 1.0),
+    "causal_average": ("window", "Ширина окна, с:", 1.0),
+    "exponential_smoothing": ("tau", "Постоянная времени, с:", 1.0),
+    "lag_filter": ("tau", "Постоянная времени, с:", 1.0),
+    "resample": ("step", "Шаг, с:", 1.0),
+    "rolling_min": ("window", "Ширина окна, с:", 10.0),
+    "rolling_max": ("window", "Ширина окна, с:", 10.0),
+    "rolling_sum": ("window", "Ширина окна, с:", 10.0),
+}
+
 
 class DataModel(QAbstractTableModel):
     """
     Виджет для отображения данных в формате таблицы.
 
     Attributes:
-        _data (pd.DataFrame): DataFrame содержащий данные для отображения
+        _data (DatasetOverlay): Набор данных для отображения со слоем изменений.
+            Результаты операций добавляются в слой производными столбцами
+            и вычисляются при показе
         _operations (DataOperations): Класс для выполнения операций над данными
+        _stats (ColumnStats): Кэш статистики столбцов для подсказок заголовков
+        _format (BlockFormatCache): Кэш текстов ячеек, форматируемых блоками
+        _loaded_rows (int): Количество строк, переданных представлению (подгружаются
+            по мере прокрутки через canFetchMore/fetchMore)
+        _log (OperationLog): Операции сеанса таблицы (отмена и повтор)
     """
 
     dataChanged = pyqtSignal()
 
-    def __init__(self, data: pd.DataFrame):
+    def __init__(
+        self,
+        data: DatasetOverlay,
+        stats: ColumnStats = None,
+        precision: int = TABLE_PRECISION,
+    ):
         super().__init__()
+        if not isinstance(data, (Dataset, DatasetOverlay)):
+            data = Dataset(data)
         self._data = data
+        self._stats = stats.copy_for(data) if stats is not None else ColumnStats(data)
+        self._format = BlockFormatCache(data, precision)
+        self._loaded_rows = min(len(data), TABLE_FETCH_ROWS)
+        self._log = OperationLog()
         self._operations = DataOperations()
+        self._menu_column = None
         self._init_context_menu()
 
     def _init_context_menu(self) -> None:
@@ -146,6 +376,33 @@ class DataModel(QAbstractTableModel):
         self.hor_line_action = QAction(
             QIcon(os.path.join(ICONS_DIR, "icons", "")), "Горизонтальная линия", self
         )
+        # Подменю обработки сигналов
+        self.signal_menu = QMenu("Обработка сигнала")
+        self.signal_actions = {
+            "derivative": QAction("Производная", self),
+            "moving_average": QAction("Скользящее среднее", self),
+            "causal_average": QAction("Скользящее среднее (причинное)", self),
+            "exponential_smoothing": QAction("Экспоненциальное сглаживание", self),
+            "lag_filter": QAction("Инерционное звено 1-го порядка", self),
+            "resample": QAction("Передискретизация", self),
+            "rolling_min": QAction("Скользящий минимум", self),
+            "rolling_max": QAction("Скользящий максимум", self),
+            "rolling_sum": QAction("Скользящая сумма", self),
+        }
+        for name, action in self.signal_actions.items():
+            # Столбец берется из _menu_column, заданного при показе меню
+            action.triggered.connect(
+                lambda checked=False, name=name: self._handle_signal_operation(
+                    getattr(self._operations, name), self._menu_column
+                )
+            )
+            self.signal_menu.addAction(action)
+        self.precision_action = QAction("Точность отображения...", self)
+        self.precision_action.triggered.connect(self._handle_precision)
+        self.undo_action = QAction("Отменить", self)
+        self.undo_action.triggered.connect(self.undo)
+        self.redo_action = QAction("Повторить", self)
+        self.redo_action.triggered.connect(self.redo)
         # Добавление действий в подменю
         self.arithmetic_menu.addAction(self.add_constant_action)
         self.arithmetic_menu.addAction(self.subtract_constant_action)
@@ -156,67 +413,99 @@ class DataModel(QAbstractTableModel):
         self.arithmetic_menu.addAction(self.integral_action)
         # Добавление подменю в основное меню
         self.context_menu.addMenu(self.arithmetic_menu)
+        self.context_menu.addMenu(self.signal_menu)
         self.context_menu.addAction(self.hor_line_action)
+        self.context_menu.addSeparator()
+        self.context_menu.addAction(self.undo_action)
+        self.context_menu.addAction(self.redo_action)
+        self.context_menu.addSeparator()
+        self.context_menu.addAction(self.precision_action)
 
-    def add_column(self, column_name: str, data: pd.Series) -> None:
-        """Добавление нового столбца в таблицу"""
+    def _insert_derived(self, expression: str) -> bool:
+        """
+        Добавление производного столбца по выражению (src/core/expressions.py).
+        Значения вычисляются при первом обращении: показ в таблице, график, экспорт
+        """
+        if expression in self._data:
+            return False
         last_column = self.columnCount()
+        # Выражение проверяется до beginInsertColumns: представления не должны
+        # видеть новый столбец раньше времени, а отмененная вставка недопустима
+        try:
+            compile_derived(expression, set(self._data.columns))
+        except ExpressionError as e:
+            QMessageBox.warning(None, "Ошибка", f"Ошибка в выражении: {str(e)}")
+            logger.error(f"Ошибка в выражении {expression}: {str(e)}")
+            return False
         self.beginInsertColumns(QtCore.QModelIndex(), last_column, last_column)
-        self._data[column_name] = data
+        self._data.add_derived(expression)
+        self._stats.invalidate(expression)
+        self._format.invalidate(last_column)
         self.endInsertColumns()
+        self.dataChanged.emit()
+        return True
+
+    def _remove_derived(self, expression: str) -> None:
+        """Удаление добавленного в таблице производного столбца"""
+        if expression not in self._data.pending:
+            return
+        column = self._data.columns.get_loc(expression)
+        self.beginRemoveColumns(QtCore.QModelIndex(), column, column)
+        self._data.remove(expression)
+        self._stats.invalidate(expression)
+        # Номера следующих столбцов сдвигаются
+        self._format.invalidate()
+        self.endRemoveColumns()
+        self.dataChanged.emit()
+
+    def apply_operation(self, op: str, inputs: list | None = None, **params) -> None:
+        """Выполнение операции журнала (src/core/operation_log.py)"""
+        entry = make_operation(op, inputs, **params)
+        if self._insert_derived(entry["output"]):
+            self._log.record(entry)
+
+    def undo(self) -> None:
+        """Отмена последней операции"""
+        entry = self._log.undo()
+        if entry is not None:
+            self._remove_derived(entry["output"])
+
+    def redo(self) -> None:
+        """Повтор отмененной операции"""
+        entry = self._log.redo()
+        if entry is not None:
+            self._insert_derived(entry["output"])
+
+    def operations(self) -> list[dict]:
+        """Действующие операции сеанса таблицы"""
+        return self._log.active
 
     def perform_operation(
         self, operation: Callable, col1: str, col2: str = None, power: float = None
     ) -> None:
         """Выполнение операции над столбцами"""
-        try:
-            result = operation(self._data, col1, col2)
-            if operation == self._operations.add_columns:
-                new_col_name = f"$({col1})+({col2})$"
-            elif operation == self._operations.subtract_columns:
-                new_col_name = f"$({col1})-({col2})$"
-            else:
-                new_col_name = f"{col1}_{operation.__name__}_{col2}"
-            # Добавляем новый столбец с результатом
-            self.add_column(new_col_name, result)
-            self.dataChanged.emit()
-        except Exception as e:
-            QMessageBox.warning(
-                None, "Ошибка", f"Ошибка при выполнении операции: {str(e)}"
-            )
-            logger.error(f"Ошибка при выполнении операции: {str(e)}")
+        self.apply_operation(operation.__name__, [col1, col2])
 
     def perform_constant_operation(
         self, operation: Callable, col1: str, constant: float
     ) -> None:
         """Выполнение операции с константой"""
-        result = operation(self._data, col1, constant)
-        if operation == self._operations.add_constant:
-            new_col_name = f"$({col1})+({constant})$"
-        elif operation == self._operations.subtract_constant:
-            new_col_name = f"$({col1})-({constant})$"
-        elif operation == self._operations.multiply_constant:
-            new_col_name = f"$({col1})*({constant})$"
-        elif operation == self._operations.divide_constant:
-            new_col_name = f"$({col1})/({constant})$"
-        else:
-            new_col_name = f"{col1}_{operation.__name__}_{constant}"
-        self.add_column(new_col_name, result)
-        self.dataChanged.emit()
+        self.apply_operation(operation.__name__, [col1], constant=float(constant))
 
     def perform_horizontal(self, operation: Callable, constant: float):
-        result = operation(self._data, constant)
-        if operation == self._operations.horizontal:
-            new_col_name = f"$Horizontal({constant})$"
-        self.add_column(new_col_name, result)
-        self.dataChanged.emit()
+        self.apply_operation(operation.__name__, constant=float(constant))
 
     def perform_integral(self, operation: Callable, time_col: str, col1: str) -> None:
-        """Выполнение операции интеграла"""
-        result = operation(self._data, time_col, col1)
-        new_col_name = f"$Integral({col1})$"
-        self.add_column(new_col_name, result)
-        self.dataChanged.emit()
+        """Выполнение операции интеграла (время - первый столбец набора данных)"""
+        self.apply_operation(operation.__name__, [col1])
+
+    def perform_signal_operation(self, operation: Callable, col1: str, **params):
+        """Обработка сигнала столбца (время - первый столбец набора данных)"""
+        self.apply_operation(
+            operation.__name__,
+            [col1],
+            **{name: float(value) for name, value in params.items()},
+        )
 
     def show_context_menu(self, pos: QtCore.QPoint, header_index: int) -> None:
         """Показать контекстное меню для столбца"""
@@ -269,9 +558,27 @@ class DataModel(QAbstractTableModel):
         self.hor_line_action.triggered.connect(
             lambda: self._handle_horizontal_operation(self._operations.horizontal)
         )
+        self._menu_column = current_column
+        self.update_undo_actions()
         # Показываем меню
         self.context_menu.exec_(pos)
 
+    def update_undo_actions(self) -> None:
+        """Доступность и текст действий отмены и повтора"""
+        entries, position = self._log.entries, self._log.position
+        self.undo_action.setEnabled(self._log.can_undo())
+        self.redo_action.setEnabled(self._log.can_redo())
+        self.undo_action.setText(
+            f"Отменить ({operation_title(entries[position - 1])})"
+            if self._log.can_undo()
+            else "Отменить"
+        )
+        self.redo_action.setText(
+            f"Повторить ({operation_title(entries[position])})"
+            if self._log.can_redo()
+            else "Повторить"
+        )
+
     def _handle_binary_operation(self, operation: Callable, col1: str) -> None:
         """Обработка бинарной операции"""
         columns = list(self._data.columns)
@@ -333,9 +640,77 @@ class DataModel(QAbstractTableModel):
                 QMessageBox.warning(None, "Ошибка", "Некорректный ввод константы")
                 logger.error(f"Некорректный ввод константы: {constant}")
 
+    def _handle_signal_operation(self, operation: Callable, col1: str) -> None:
+        """Обработка операции над сигналом: запрос параметра операции"""
+        time_col = self._data.columns[0]
+        try:
+            check_time(self._data.column(time_col))
+        except (TypeError, ValueError) as e:
+            QMessageBox.warning(
+                None,
+                "Ошибка",
+                f"Операция требует возрастающего времени в столбце '{time_col}': "
+                f"{str(e)}",
+            )
+            logger.error(f"Время не возрастает, операция {operation.__name__}: {e}")
+            return
+        params = {}
+        if operation.__name__ in SIGNAL_PARAMETERS:
+            name, label, default = SIGNAL_PARAMETERS[operation.__name__]
+            value, ok = QInputDialog.getDouble(
+                None,
+                "Параметр операции",
+                f"Столбец '{col1}'\n{label}",
+                value=default,
+                min=1e-9,
+                max=1e9,
+                decimals=6,
+            )
+            if not ok:
+                return
+            params[name] = value
+        self.perform_signal_operation(operation, col1, **params)
+
+    def _handle_precision(self) -> None:
+        """Изменение количества значащих цифр в ячейках"""
+        precision, ok = QInputDialog.getInt(
+            None,
+            "Точность отображения",
+            "Количество значащих цифр:",
+            value=self._format.precision,
+            min=1,
+            max=17,
+        )
+        if ok:
+            self.set_precision(precision)
+
+    def set_precision(self, precision: int) -> None:
+        """Устанавливает количество значащих цифр в ячейках"""
+        self._format.set_precision(precision)
+        self.layoutChanged.emit()
+
     def rowCount(self, parent: Optional[Any] = None) -> int:
-        """Возвращает количество строк в таблице"""
-        return self._data.shape[0]
+        """Возвращает количество строк, переданных представлению"""
+        return self._loaded_rows
+
+    def canFetchMore(self, parent: QtCore.QModelIndex) -> bool:
+        """Есть ли еще не подгруженные строки"""
+        if parent.isValid():
+            return False
+        return self._loaded_rows < self._data.shape[0]
+
+    def fetchMore(self, parent: QtCore.QModelIndex) -> None:
+        """Подгружает следующую порцию строк при прокрутке к концу таблицы"""
+        if parent.isValid():
+            return
+        count = min(TABLE_FETCH_ROWS, self._data.shape[0] - self._loaded_rows)
+        if count <= 0:
+            return
+        self.beginInsertRows(
+            QtCore.QModelIndex(), self._loaded_rows, self._loaded_rows + count - 1
+        )
+        self._loaded_rows += count
+        self.endInsertRows()
 
     def columnCount(self, parent: Optional[Any] = None) -> int:
         """Возвращает количество столбцов в таблице"""
@@ -346,7 +721,7 @@ class DataModel(QAbstractTableModel):
         if not index.isValid():
             return None
         if role == Qt.DisplayRole:
-            return str(self._data.iloc[index.row(), index.column()])
+            return self._format.text(index.row(), index.column())
         return None
 
     def headerData(
@@ -357,7 +732,8 @@ class DataModel(QAbstractTableModel):
             if role == Qt.DisplayRole:
                 return str(header_text)
             elif role == Qt.ToolTipRole:
-                tooltip = f"{header_text}\nНомер: {section + 1}"
+                stats = format_column_stats(self._stats[self._data.columns[section]])
+                tooltip = f"{header_text}\nНомер: {section + 1}\n{stats}"
                 return tooltip
         elif orientation == Qt.Vertical:
             if role == Qt.DisplayRole:
@@ -406,11 +782,18 @@ class DataTableView(QTableView):
         self.horizontalHeader().customContextMenuRequested.connect(
             self._show_header_menu
         )
+        # Отмена и повтор операций таблицы
+        QShortcut(QKeySequence.Undo, self, activated=lambda: self.model.undo())
+        QShortcut(QKeySequence.Redo, self, activated=lambda: self.model.redo())
 
-    def set_data(self, data: pd.DataFrame) -> None:
-        """Установить данные для отображения"""
-        self._original_data = data.copy(deep=True)
-        self.model = DataModel(self._original_data.copy())
+    def set_data(self, data: Dataset, stats: ColumnStats = None) -> None:
+        """
+        Установить данные для отображения.
+        stats - уже вычисленная статистика столбцов набора данных (необязательно).
+        """
+        # Таблица работает поверх набора данных сеанса без копирования,
+        # добавленные столбцы хранятся в слое изменений до сохранения
+        self.model = DataModel(DatasetOverlay(data), stats)
         self.setModel(self.model)
         self._data_changed = False
         self.model.dataChanged.connect(self._on_data_changed)
@@ -424,8 +807,8 @@ class DataTableView(QTableView):
         global_pos = header.mapToGlobal(pos)
         self.model.show_context_menu(global_pos, index)
 
-    def get_data(self) -> pd.DataFrame:
-        """Получить текущие данные"""
+    def get_data(self) -> DatasetOverlay:
+        """Получить текущие данные (набор данных сеанса с изменениями таблицы)"""
         return self.model.get_data() if hasattr(self, "model") else None
 
     def _on_data_changed(self):
@@ -443,27 +826,26 @@ class DataTableView(QTableView):
                 QMessageBox.Save,
             )
             if reply == QMessageBox.Save:
-                # Передаем данные в главное окно
-                current_data = self.get_data()
-                new_columns = list(
-                    set(current_data.columns) - set(self._original_data.columns)
-                )
+                # Добавленные столбцы переносятся в набор данных одной операцией
+                operations = self.model.operations()
+                try:
+                    new_columns = self.get_data().commit()
+                except ExpressionError as e:
+                    QMessageBox.warning(
+                        self, "Ошибка", f"Изменения не сохранены: {str(e)}"
+                    )
+                    logger.error(f"Ошибка сохранения изменений таблицы: {str(e)}")
+                    event.ignore()
+                    return
                 if new_columns:
-                    # Добавляем только новые столбцы к оригинальным данным
-                    for col in new_columns:
-                        self.parent.data[col] = current_data[col]
-                last_index = len(self.parent.data.columns)
-                # Обновляем все страницы с комбобоксами и графиками
-                for page in self.parent.pages:
-                    for combo in page["left"].combos:
-                        combo.blockSignals(True)
-                        combo.insertItems(last_index, new_columns)
-                        combo.blockSignals(False)
-                    page["right"].data = self.parent.data
+                    # Операции сеанса таблицы добавляются в журнал главного окна
+                    self.parent.operation_log.extend(operations)
+                    # Новые столбцы добавляются в конец общей модели имен столбцов
+                    self.parent.sync_columns()
                 self.parent.update_graph()
                 event.accept()
             elif reply == QMessageBox.Discard:
-                self.parent.data = self._original_data
+                self.get_data().discard()
                 event.accept()
             else:
                 event.ignore()
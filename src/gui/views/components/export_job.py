@@ -0,0 +1,130 @@
+"""Модуль фонового экспорта страниц: пул рабочих процессов и поток записи PDF"""
+import threading
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from src.core.render import save_pages_pdf
+from src.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class ExportJob(QObject):
+    """
+    Экспорт набора страниц в пуле процессов отрисовки без блокировки потока GUI.
+    О завершении каждой страницы сообщается сигналом в потоке GUI.
+
+    Attributes:
+        total (int): Количество страниц.
+        done (int): Количество завершенных (или отмененных) страниц.
+        canceled (bool): Экспорт отменен пользователем.
+        errors (list): Тексты ошибок отрисовки.
+    """
+
+    # Завершено страниц, всего страниц
+    progress = pyqtSignal(int, int)
+    # Номер задачи и результат успешно отрисованной страницы
+    page_done = pyqtSignal(int, object)
+    # Экспорт отменен, список ошибок
+    finished = pyqtSignal(bool, list)
+    _task_done = pyqtSignal(object)
+
+    def __init__(self, futures: list, parent=None):
+        """
+        Args:
+            futures (list[Future]): Задачи пула процессов отрисовки
+                (RenderPool.submit_save или RenderPool.submit_render) по страницам.
+        """
+        super().__init__(parent)
+        self.total = len(futures)
+        self.done = 0
+        self.canceled = False
+        self.errors = []
+        # Обратные вызовы выполняются в служебном потоке пула - передаем их сигналом
+        self._task_done.connect(self._on_task_done)
+        self._futures = list(futures)
+        self._index = {future: idx for idx, future in enumerate(self._futures)}
+        # Сигналы задания испускаются не раньше следующего прохода цикла событий,
+        # когда вызывающий код уже подключился к ним
+        QTimer.singleShot(0, self._attach)
+
+    def _attach(self):
+        """
+        Подписка на завершение задач. Для уже завершенной задачи обратный вызов
+        выполняется сразу в потоке GUI, поэтому он откладывается до подключения
+        сигналов (см. __init__)
+        """
+        for future in self._futures:
+            future.add_done_callback(self._task_done.emit)
+        if not self._futures:
+            # Все страницы взяты из кэша
+            self.finished.emit(False, [])
+
+    def cancel(self):
+        """Отменяет еще не начатые страницы (начатые дорисовываются)"""
+        self.canceled = True
+        for future in self._futures:
+            future.cancel()
+
+    def _on_task_done(self, future):
+        self.done += 1
+        if not future.cancelled():
+            error = future.exception()
+            if error is not None:
+                logger.error(f"Ошибка отрисовки страницы: {str(error)}")
+                self.errors.append(str(error))
+            else:
+                self.page_done.emit(self._index[future], future.result())
+        self.progress.emit(self.done, self.total)
+        if self.done == self.total:
+            self.finished.emit(self.canceled, self.errors)
+
+
+class PdfExportJob(QObject):
+    """
+    Экспорт страниц в один многостраничный PDF в фоновом потоке.
+    Сигналы совпадают с ExportJob, поэтому окно прогресса подключается одинаково.
+
+    Attributes:
+        total (int): Количество страниц.
+        canceled (bool): Экспорт отменен пользователем.
+    """
+
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(bool, list)
+    _page_done = pyqtSignal(int)
+    _done = pyqtSignal(bool, list)
+
+    def __init__(self, states: list[dict], data, path, size_inches, parent=None):
+        super().__init__(parent)
+        self.total = len(states)
+        self.canceled = False
+        self._page_done.connect(lambda idx: self.progress.emit(idx + 1, self.total))
+        self._done.connect(self.finished.emit)
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(states, data, path, size_inches),
+            name="pdf-export",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def cancel(self):
+        """Прерывает экспорт после текущей страницы"""
+        self.canceled = True
+
+    def _run(self, states, data, path, size_inches):
+        try:
+            completed = save_pages_pdf(
+                states,
+                data,
+                path,
+                size_inches,
+                on_page=self._page_done.emit,
+                is_canceled=lambda: self.canceled,
+            )
+        except Exception as e:
+            logger.error(f"Ошибка экспорта в PDF: {str(e)}", exc_info=True)
+            self._done.emit(False, [str(e)])
+            return
+        self._done.emit(not completed, [])
@@ -4,13 +4,17 @@ from PyQt5.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QFormLayout,
+    QPushButton,
 )
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 
-from src.gui.styles import COMBO_STYLE_LEFT
+from src.core.constants import LINES_PER_PAGE
+from src.core.page_spec import pad_lines
+from src.core.render import grid_layout
 from src.utils.logger import Logger
 from src.gui.views.components.combo_box import MyComboBox
+from src.gui.views.dialogs.lines_dialog import LinesDialog
 
 logger = Logger.get_logger(__name__)
 
@@ -21,17 +25,23 @@ class LeftPanel(QWidget):
 
     Attributes:
         combos (list): Список выпадающих списков для выбора параметров.
+        labels (list): Подписи выпадающих списков.
+        lines_summary (QLabel): Количество линий в режиме 'много линий'.
+        lines_btn (QPushButton): Кнопка выбора линий в режиме 'много линий'.
         data (pd.DataFrame): Данные для отображения в выпадающих списках.
         main_window (QMainWindow): Ссылка на главное окно приложения.
         num_page (QLabel): Метка для отображения номера страницы.
+        spec (dict | None): Спецификация отображаемой страницы.
     """
 
     def __init__(self, data, main_window, parent=None):
         super().__init__(parent)
         logger.info("Инициализация LeftPanel")
         self.combos = []
+        self.labels = []
         self.data = data
         self.main_window = main_window
+        self.spec = None
         self.init_ui()
         logger.info("Инициализация LeftPanel завершена упешно")
 
@@ -47,32 +57,38 @@ class LeftPanel(QWidget):
             self.lbl_layout.addWidget(self.num_page)
             self.lbl_layout.setContentsMargins(0, 10, 0, 25)
             self.main_layout.addLayout(self.lbl_layout)
-            for i in range(15):
+            for i in range(LINES_PER_PAGE):
                 form = QFormLayout()
                 form.setHorizontalSpacing(15)
                 form.setVerticalSpacing(20)
                 self.main_layout.addLayout(form)
-                combo = MyComboBox()
+                combo = MyComboBox(self.main_window.column_model)
                 lbl = QLabel(f"Линия №{i+1}")
-                lbl.setStyleSheet(
-                    "QLabel {\n"
-                    "font-size: 14px; \n"
-                    "font-weight: 500;\n"
-                    "color: black;\n"
-                    "min-width: 90px;\n"
-                    "}\n"
-                )
-                combo.addItems(self.data.columns[1:])
+                lbl.setObjectName("lineLabel")
                 combo.setCurrentIndex(-1)
+                # Спецификация обновляется раньше перестроения графика
+                combo.currentTextChanged.connect(
+                    lambda text, idx=i: self.store_line(idx, text)
+                )
                 combo.currentIndexChanged.connect(
                     lambda _, idx=i: self.main_window.plot_selection(idx)
                 )
-                combo.setStyleSheet(COMBO_STYLE_LEFT)
+                combo.setObjectName("lineCombo")
                 combo.cleared.connect(
                     lambda idx=i: self.main_window.plot_selection(idx)
                 )
                 self.combos.append(combo)
+                self.labels.append(lbl)
                 form.addRow(lbl, combo)
+            # Режим 'много линий': линии выбираются списком вместо выпадающих списков
+            self.lines_summary = QLabel()
+            self.lines_summary.setObjectName("lineLabel")
+            self.lines_btn = QPushButton("Выбрать линии...")
+            self.lines_btn.clicked.connect(self.choose_lines)
+            self.main_layout.addWidget(self.lines_summary)
+            self.main_layout.addWidget(self.lines_btn)
+            self.lines_summary.hide()
+            self.lines_btn.hide()
             logger.info("Интерфейс LeftPanel успешно инициализирован")
         except Exception as e:
             logger.error(f"Ошибка при настройке пользовательского интерфейса LeftPanel: {str(e)}", exc_info=True)
@@ -86,3 +102,52 @@ class LeftPanel(QWidget):
         self.num_page.setText(
             f"График №{self.main_window.current_page + 1} из {len(self.main_window.pages)}"
         )
+
+    def bind(self, spec: dict):
+        """Отображает линии страницы без перестроения графика"""
+        self.spec = spec
+        for combo, text in zip(self.combos, spec["Lists"]):
+            combo.blockSignals(True)
+            combo.setCurrentIndex(-1)
+            combo.setCurrentText(text)
+            combo.blockSignals(False)
+        many = spec["Mode"] == "many"
+        if spec["Mode"] == "grid":
+            rows, cols = grid_layout(spec)
+            panels = rows * cols
+        else:
+            panels = len(self.combos)
+        for idx, (lbl, combo) in enumerate(zip(self.labels, self.combos)):
+            lbl.setVisible(not many)
+            combo.setVisible(not many)
+            # На странице с панелями используются только линии по числу панелей
+            combo.setEnabled(idx < panels)
+        self.lines_summary.setVisible(many)
+        self.lines_btn.setVisible(many)
+        self.update_lines_summary()
+        self.update_label()
+
+    def update_lines_summary(self):
+        """Обновляет количество выбранных линий режима 'много линий'"""
+        count = sum(1 for text in self.spec["Lists"] if text) if self.spec else 0
+        self.lines_summary.setText(f"Линий на графике: {count}")
+
+    def choose_lines(self):
+        """Выбор линий режима 'много линий' списком параметров"""
+        if self.spec is None:
+            return
+        dialog = LinesDialog(
+            self.main_window.column_model.stringList(),
+            [text for text in self.spec["Lists"] if text],
+            self,
+        )
+        if not dialog.exec_():
+            return
+        self.spec["Lists"] = pad_lines(dialog.selected_lines(), self.spec["Mode"])
+        self.bind(self.spec)
+        self.main_window.update_graph()
+
+    def store_line(self, line_idx: int, text: str):
+        """Записывает выбранный параметр линии в спецификацию страницы"""
+        if self.spec is not None:
+            self.spec["Lists"][line_idx] = text
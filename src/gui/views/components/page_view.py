@@ -0,0 +1,100 @@
+"""Модуль живых представлений страниц и их пула"""
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout
+
+from src.core.constants import PAGE_VIEW_POOL_SIZE
+from src.gui.views.components.left_panel import LeftPanel
+from src.gui.views.components.plot_area import PlotArea
+from src.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class PageView(QWidget):
+    """
+    Виджет страницы: левая панель с линиями и область графика.
+    Отображает спецификацию страницы, к которой привязан.
+
+    Attributes:
+        left (LeftPanel): Левая панель с выпадающими списками линий.
+        right (PlotArea): Область графика.
+        spec (dict | None): Спецификация отображаемой страницы.
+    """
+
+    def __init__(self, data, main_window, parent=None):
+        super().__init__(parent)
+        self.spec = None
+        layout = QHBoxLayout(self)
+        vlayout = QVBoxLayout()
+        self.left = LeftPanel(data, main_window)
+        self.right = PlotArea(data, main_window)
+        vlayout.addWidget(self.left, 1)
+        vlayout.addStretch(10)
+        layout.addLayout(vlayout, 1)
+        layout.addWidget(self.right, 4)
+
+    def bind(self, spec: dict):
+        """Привязывает представление к спецификации страницы"""
+        self.spec = spec
+        self.left.bind(spec)
+        self.right.bind(spec)
+
+    def unbind(self):
+        """Отвязывает представление от страницы"""
+        self.spec = None
+        self.left.spec = None
+        self.right.spec = None
+
+
+class PageViewPool:
+    """
+    Небольшой пул живых представлений страниц.
+    Представление, давно не использованное, перепривязывается к видимой странице,
+    поэтому количество виджетов не зависит от количества страниц.
+
+    Attributes:
+        size (int): Максимальное количество представлений.
+        views (list[PageView]): Представления в порядке использования (последнее - текущее).
+    """
+
+    def __init__(self, factory, size: int = PAGE_VIEW_POOL_SIZE):
+        self._factory = factory
+        self.size = size
+        self.views: list[PageView] = []
+
+    @property
+    def current(self) -> PageView | None:
+        """Представление видимой страницы"""
+        return self.views[-1] if self.views else None
+
+    def acquire(self, spec: dict) -> tuple[PageView, bool]:
+        """
+        Возвращает представление для страницы и признак перепривязки.
+        Если страница уже отображается одним из представлений, оно переиспользуется как есть.
+        """
+        view = next((v for v in self.views if v.spec is spec), None)
+        rebound = view is None
+        if rebound:
+            view = next((v for v in self.views if v.spec is None), None)
+            if view is None and len(self.views) < self.size:
+                view = self._factory()
+                logger.debug(f"Создано представление страницы №{len(self.views) + 1}")
+            elif view is None:
+                view = self.views[0]
+            view.bind(spec)
+        if view in self.views:
+            self.views.remove(view)
+        self.views.append(view)
+        return view, rebound
+
+    def release(self, spec: dict):
+        """Отвязывает представление, отображающее страницу"""
+        for view in self.views:
+            if view.spec is spec:
+                view.unbind()
+
+    def release_all(self, keep_current: bool = False):
+        """Отвязывает все представления (кроме текущего, если keep_current)"""
+        for view in self.views:
+            if keep_current and view is self.current:
+                continue
+            view.unbind()
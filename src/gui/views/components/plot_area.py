@@ -1,9 +1,11 @@
 import os
-import math
+from io import BytesIO
 from pathlib import Path
+from weakref import WeakKeyDictionary
 
+import numpy as np
 import pandas as pd
-from matplotlib import pyplot as plt
+import matplotlib as mpl
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from PyQt5.QtWidgets import (
@@ -20,21 +22,49 @@ from PyQt5.QtWidgets import (
     QSpinBox,
     QSizePolicy,
 )
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QIcon
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QIcon, QImage, QPainter
 
 from src.core.constants import (
     MAIN_CHARS,
-    UNITS,
     SIZING,
-    COLORS,
     DEFAULT_DIR,
-    MARKERS,
     ICONS_DIR,
+    PAGE_FIGURE_SIZE,
+    PAGE_MODES,
+    GRID_LAYOUTS,
+    LINES_PER_PAGE,
+    FULL_RENDER_PROFILE,
+    DRAFT_RENDER_PROFILE,
+    RENDER_IDLE_DELAY,
 )
-from src.gui.styles import COMBO_STYLE, LINE_EDIT_STYLE, LABEL_STYLE, SPIN_BOX_STYLE
+from src.core.decimation import minmax_decimate
+from src.core.render import (
+    RENDER_LOCK,
+    x_label_text,
+    y_label_text,
+    x_axis_limit,
+    parse_y_limits,
+    marker_frequency,
+    line_color,
+    draw_grid,
+    style_axes,
+    set_x_limit,
+    update_legend,
+    apply_markers,
+    y_autoscale_limits,
+    setup_page_axes,
+    plot_many_lines,
+    sparse_markers,
+    many_lines_legend,
+    apply_y_settings,
+    plot_grid,
+    write_output,
+)
+from src.core.image_encoding import encode_png
 
 from src.gui.views.components.toolbar import MyNavigationToolbar
+from src.gui.views.components.cursor import CursorReadout
 from src.gui.views.dialogs.message import MessageWindow
 from src.utils.logger import Logger
 
@@ -45,11 +75,21 @@ class PlotCanvas(FigureCanvas, QWidget):
     """
     Виджет для отображения графика.
 
+    Во время перетаскивания и ввода график рисуется в черновом профиле
+    (прореживание, без сглаживания и маркеров), после паузы - в полном качестве.
+    Сохранение в файл всегда выполняется в полном качестве.
+
     Attributes:
         fig (Figure): Объект фигуры matplotlib.
         ax (Axes): Объект осей matplotlib.
+        profile (dict): Текущий профиль качества отрисовки.
     """
 
+    # Испускается после отрисовки графика в полном качестве
+    rendered = pyqtSignal()
+    # Испускается, когда показанное изображение из кэша больше не подходит холсту
+    image_dropped = pyqtSignal()
+
     def __init__(self, parent=None):
         """
         Инициализация виджета графика.
@@ -58,31 +98,149 @@ class PlotCanvas(FigureCanvas, QWidget):
             parent: Родительский виджет.
         """
         logger.info("Инициализация PlotCanvas")
-        self.fig = Figure(figsize=(9, 5))
+        self.fig = Figure(figsize=PAGE_FIGURE_SIZE)
         self.ax = self.fig.add_subplot(111)
         super().__init__(self.fig)
-        self.ax.grid(
-            True,
-            which="major",
-            axis="both",
-            linestyle="-",
-            linewidth=0.5,
-            color="black",
-        )
+        draw_grid(self.ax)
         self.setParent(parent)
+        self.profile = FULL_RENDER_PROFILE
+        # Полные данные линий и их прореженные варианты
+        self._sources = WeakKeyDictionary()
+        self._decimated = WeakKeyDictionary()
+        self._applied = WeakKeyDictionary()
+        self._hidden_markers = WeakKeyDictionary()
+        # Коллекции режима 'много линий': True - коллекция маркеров
+        self._collections = WeakKeyDictionary()
+        self._cached_image = None
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(RENDER_IDLE_DELAY)
+        self._idle_timer.timeout.connect(self.end_interaction)
+        self.mpl_connect("button_press_event", self.begin_interaction)
+        self.mpl_connect("scroll_event", self.begin_interaction)
+        self.mpl_connect("motion_notify_event", self._on_motion)
         logger.info("Инициализация PlotCanvas успешно завершена")
 
+    def register_line(self, line, x, y):
+        """Запоминает полные данные линии для переключения профилей качества"""
+        self._sources[line] = (np.asarray(x), np.asarray(y))
+        self._decimated.pop(line, None)
+        self._applied[line] = None
+
+    def register_collection(self, collection, markers: bool = False):
+        """Запоминает коллекцию линий или маркеров для переключения профилей качества"""
+        self._collections[collection] = markers
+
+    def begin_interaction(self, *args):
+        """Переключает график в черновой профиль до наступления паузы"""
+        if self.profile is not DRAFT_RENDER_PROFILE:
+            self.profile = DRAFT_RENDER_PROFILE
+        self._idle_timer.start()
+
+    def end_interaction(self):
+        """Возвращает полный профиль и перерисовывает график"""
+        self._idle_timer.stop()
+        if self.profile is not FULL_RENDER_PROFILE:
+            self.profile = FULL_RENDER_PROFILE
+            self.draw_idle()
+
+    def _on_motion(self, event):
+        """Перемещение мыши с нажатой кнопкой считается перетаскиванием"""
+        if event.button is not None:
+            self.begin_interaction()
+
+    def reset_axes(self):
+        """Оставляет на фигуре одни пустые оси (после страницы с панелями)"""
+        self.fig.clear()
+        self.ax = self.fig.add_subplot(111)
+        draw_grid(self.ax)
+
+    def _apply_profile(self, profile: dict):
+        """Применяет профиль качества ко всем зарегистрированным линиям"""
+        max_points = profile["max_points"]
+        lines = [line for ax in self.fig.axes for line in ax.lines]
+        for line in lines:
+            source = self._sources.get(line)
+            if source is None:
+                continue
+            if self._applied.get(line) != max_points:
+                if max_points:
+                    cached = self._decimated.get(line)
+                    if cached is None or cached[0] != max_points:
+                        cached = (max_points, *minmax_decimate(*source, max_points))
+                        self._decimated[line] = cached
+                    line.set_data(cached[1], cached[2])
+                else:
+                    line.set_data(*source)
+                self._applied[line] = max_points
+            line.set_antialiased(profile["antialiased"])
+            if profile["markers"]:
+                marker = self._hidden_markers.pop(line, None)
+                if marker is not None and line.get_marker() == "None":
+                    line.set_marker(marker)
+            elif line.get_marker() not in ("None", None, "", " "):
+                self._hidden_markers[line] = line.get_marker()
+                line.set_marker("None")
+        for collection, markers in list(self._collections.items()):
+            if collection.axes is None:
+                continue
+            collection.set_antialiased(profile["antialiased"])
+            if markers:
+                collection.set_visible(profile["markers"])
+
+    def draw(self):
+        """Отрисовка графика в текущем профиле качества"""
+        self._cached_image = None
+        self._apply_profile(self.profile)
+        with RENDER_LOCK, mpl.rc_context(self.profile["rc"]):
+            super().draw()
+        if self.profile is FULL_RENDER_PROFILE:
+            self.rendered.emit()
+
+    def grab_image(self) -> np.ndarray:
+        """Возвращает копию отрисованного изображения в формате RGBA"""
+        return np.array(self.buffer_rgba(), copy=True)
+
+    def show_image(self, image: np.ndarray) -> bool:
+        """
+        Показывает готовое изображение вместо отрисовки графика.
+        Возвращает False, если размер изображения не совпадает с размером холста.
+        """
+        height, width = image.shape[:2]
+        if (width, height) != self.get_width_height(physical=True):
+            return False
+        self._cached_image = image
+        self.update()
+        return True
+
+    def paintEvent(self, event):
+        """Вывод готового изображения из кэша без перерисовки графика"""
+        image = self._cached_image
+        if image is None:
+            return super().paintEvent(event)
+        height, width = image.shape[:2]
+        if (width, height) != self.get_width_height(physical=True):
+            self._cached_image = None
+            self.image_dropped.emit()
+            return super().paintEvent(event)
+        painter = QPainter(self)
+        try:
+            qimage = QImage(image.data, width, height, 4 * width, QImage.Format_RGBA8888)
+            qimage.setDevicePixelRatio(self.device_pixel_ratio)
+            painter.eraseRect(event.rect())
+            painter.drawImage(0, 0, qimage)
+        finally:
+            painter.end()
+
+    def print_figure(self, *args, **kwargs):
+        """Сохранение графика в файл всегда выполняется в полном качестве"""
+        self._apply_profile(FULL_RENDER_PROFILE)
+        with RENDER_LOCK, mpl.rc_context(FULL_RENDER_PROFILE["rc"]):
+            return super().print_figure(*args, **kwargs)
+
     def clear_plot(self):
         """Метод очистки графика"""
-        self.ax.cla()
-        self.ax.grid(
-            True,
-            which="major",
-            axis="both",
-            linestyle="-",
-            linewidth=0.5,
-            color="black",
-        )
+        self.reset_axes()
         self.draw()
 
 
@@ -105,14 +263,24 @@ class PlotArea(QWidget):
         y_settings (QLineEdit): Поле ввода для настройки оси Y.
         markers (QComboBox): Выпадающий список для настройки частоты маркеров.
         x_axis_limit (int): Предел оси X.
+        stale (bool): График показан из кэша, линии требуют перестроения.
+        pending_capture (bool): Следующую отрисовку нужно сохранить в кэш.
+        spec (dict | None): Спецификация отображаемой страницы.
+        many (dict | None): Артисты режима 'много линий' (см. plot_many_lines).
+        grid (dict | None): Оси и линии страницы с панелями (см. plot_grid).
     """
 
     def __init__(self, data: pd.DataFrame, main_window, parent=None):
         super().__init__(parent)
         logger.info("Инициализация PlotArea")
         self.lines = {}
+        self.many = None
+        self.grid = None
         self.data = data
         self.main_window = main_window
+        self.stale = False
+        self.pending_capture = False
+        self.spec = None
         self.init_ui()
         logger.info("Инициализация PlotArea успешно завершена")
 
@@ -133,19 +301,19 @@ class PlotArea(QWidget):
             "Буквенное обозначение\nфизической величины.\nНапример: Q, P, T и т.д."
         )
         group_lbl_y.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        group_lbl_y.setStyleSheet(LABEL_STYLE)
+        group_lbl_y.setObjectName("settingsLabel")
         self.group = QComboBox()
         self.group.addItems(MAIN_CHARS)
-        self.group.setStyleSheet(COMBO_STYLE)
+        self.group.setObjectName("settingsCombo")
         self.group.setEditable(True)
         self.group.setCurrentIndex(-1)
         self.group.currentTextChanged.connect(self.main_window.update_graph)
         # Размерность
         sizing_lbl_y = QLabel("Размерность Y:")
         sizing_lbl_y.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        sizing_lbl_y.setStyleSheet(LABEL_STYLE)
+        sizing_lbl_y.setObjectName("settingsLabel")
         self.sizing_cmb = QComboBox()
-        self.sizing_cmb.setStyleSheet(COMBO_STYLE)
+        self.sizing_cmb.setObjectName("settingsCombo")
         self.sizing_cmb.addItems(SIZING)
         self.sizing_cmb.setEditable(True)
         self.sizing_cmb.setCurrentIndex(-1)
@@ -156,9 +324,9 @@ class PlotArea(QWidget):
             "Разрешенный тип данных - int\nПример: 'auto', '100', '300'"
         )
         x_ax_settings_lbl.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        x_ax_settings_lbl.setStyleSheet(LABEL_STYLE)
+        x_ax_settings_lbl.setObjectName("settingsLabel")
         self.x_settings = QComboBox()
-        self.x_settings.setStyleSheet(COMBO_STYLE)
+        self.x_settings.setObjectName("settingsCombo")
         self.x_settings.addItems(["auto", "300", "600", "1800", "3600"])
         self.x_settings.setEditable(True)
         self.x_settings.setCurrentIndex(0)
@@ -166,19 +334,19 @@ class PlotArea(QWidget):
         group_lbl_x = QLabel("Обозначение X:")
         group_lbl_x.setToolTip("Буквенное обозначение времени.\nНапример: t")
         group_lbl_x.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        group_lbl_x.setStyleSheet(LABEL_STYLE)
+        group_lbl_x.setObjectName("settingsLabel")
         sizing_lbl_x = QLabel("Размерность X:")
         sizing_lbl_x.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        sizing_lbl_x.setStyleSheet(LABEL_STYLE)
+        sizing_lbl_x.setObjectName("settingsLabel")
         self.sizing_cmb_x = QComboBox()
-        self.sizing_cmb_x.setStyleSheet(COMBO_STYLE)
+        self.sizing_cmb_x.setObjectName("settingsCombo")
         self.sizing_cmb_x.addItems(["t", "tau"])
         self.sizing_cmb_x.setEditable(True)
         self.sizing_cmb_x.currentTextChanged.connect(self.main_window.update_graph)
         self.sizing_cmb_x.setCurrentIndex(0)
         self.group_x = QComboBox()
         self.group_x.addItems(["s", "с", "h", "ч"])
-        self.group_x.setStyleSheet(COMBO_STYLE)
+        self.group_x.setObjectName("settingsCombo")
         self.group_x.setEditable(True)
         self.group_x.currentTextChanged.connect(self.main_window.update_graph)
         self.group_x.setCurrentIndex(0)
@@ -186,10 +354,10 @@ class PlotArea(QWidget):
         y_ax_settings_lbl = QLabel("Настройка оси Y:")
         y_ax_settings_lbl.setToolTip("Формат: min,max или auto\nПример: '0,100.5'")
         y_ax_settings_lbl.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        y_ax_settings_lbl.setStyleSheet(LABEL_STYLE)
+        y_ax_settings_lbl.setObjectName("settingsLabel")
         self.y_settings = QLineEdit()
         self.y_settings.setText("auto")
-        self.y_settings.setStyleSheet(LINE_EDIT_STYLE)
+        self.y_settings.setObjectName("settingsEdit")
         self.y_settings.editingFinished.connect(self.change_y_settings)
         # Распределение элементов по сетке
         self.top_controls_layout.addWidget(y_ax_settings_lbl, 0, 0, 1, 1)
@@ -207,9 +375,9 @@ class PlotArea(QWidget):
         marker_lbl = QLabel("Частота маркера:")
         marker_lbl.setToolTip("Устанавливает частоту маркеров\nна всех линиях графика")
         marker_lbl.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        marker_lbl.setStyleSheet(LABEL_STYLE)
+        marker_lbl.setObjectName("settingsLabel")
         self.markers = QComboBox()
-        self.markers.setStyleSheet(COMBO_STYLE)
+        self.markers.setObjectName("settingsCombo")
         self.markers.addItems(["auto", "300", "600", "2000", "3000"])
         self.markers.setEditable(True)
         self.markers.setCurrentIndex(0)
@@ -219,16 +387,33 @@ class PlotArea(QWidget):
             "Устанавливает количество вертикальных\nлиний сетки на графике"
         )
         x_spacing_grid_lbl.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        x_spacing_grid_lbl.setStyleSheet(LABEL_STYLE)
+        x_spacing_grid_lbl.setObjectName("settingsLabel")
         self.x_spacing_grid_spinBox = QSpinBox()
         self.x_spacing_grid_spinBox.setValue(4)
         self.x_spacing_grid_spinBox.setMinimum(2)
-        self.x_spacing_grid_spinBox.setStyleSheet(SPIN_BOX_STYLE)
+        self.x_spacing_grid_spinBox.setObjectName("settingsSpinBox")
         self.x_spacing_grid_spinBox.valueChanged.connect(self.change_x_settings)
         self.top_controls_layout.addWidget(marker_lbl, 0, 4, 1, 1)
         self.top_controls_layout.addWidget(self.markers, 0, 5, 1, 1)
         self.top_controls_layout.addWidget(x_spacing_grid_lbl, 1, 4, 1, 1)
         self.top_controls_layout.addWidget(self.x_spacing_grid_spinBox, 1, 5, 1, 1)
+        # Режим страницы
+        mode_lbl = QLabel("Режим:")
+        mode_lbl.setToolTip(
+            "'Много линий' - до сотен линий на одном графике,\n"
+            "линии выбираются списком на левой панели"
+        )
+        mode_lbl.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        mode_lbl.setObjectName("settingsLabel")
+        self.mode_cmb = QComboBox()
+        self.mode_cmb.setObjectName("settingsCombo")
+        for mode, title in PAGE_MODES.items():
+            self.mode_cmb.addItem(title, mode)
+        self.mode_cmb.currentIndexChanged.connect(
+            lambda idx: self.main_window.change_page_mode(self.mode_cmb.itemData(idx))
+        )
+        self.top_controls_layout.addWidget(mode_lbl, 2, 4, 1, 1)
+        self.top_controls_layout.addWidget(self.mode_cmb, 2, 5, 1, 1)
         # Добавляем панель в основной макет
         self.main_layout.addWidget(self.top_controls_panel)
         # Plot area
@@ -240,9 +425,16 @@ class PlotArea(QWidget):
         self.toolbar_and_buttons_layout.setContentsMargins(0, 0, 0, 0)
         self.canvas = PlotCanvas()
         self.canvas.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        self.canvas.rendered.connect(self._on_rendered)
+        self.canvas.image_dropped.connect(
+            lambda: QTimer.singleShot(0, self.ensure_current)
+        )
+        # Подключается до тулбара, чтобы линии перестраивались раньше панорамирования
+        self.canvas.mpl_connect("button_press_event", self._on_canvas_press)
         self.toolbar = MyNavigationToolbar(
             self.canvas, self.canvas, self, coordinates=False
         )
+        self.cursor = CursorReadout(self)
         self.clear_btn = QPushButton()
         self.clear_btn.setIcon(QIcon(os.path.join(ICONS_DIR, "icons", "clear.png")))
         self.clear_btn.setToolTip("Очистить график")
@@ -251,35 +443,139 @@ class PlotArea(QWidget):
         self.save_btn.setIcon(QIcon(os.path.join(ICONS_DIR, "icons", "save.png")))
         self.save_btn.setToolTip("Сохранить график")
         self.save_btn.setMaximumWidth(50)
-        self.toolbar.setFixedWidth(150)
+        self.legend_btn = QPushButton("Легенда")
+        self.legend_btn.setCheckable(True)
+        self.legend_btn.setToolTip("Показать легенду всех линий графика")
+        self.legend_btn.toggled.connect(self.set_legend_visible)
+        self.legend_btn.hide()
+        self.grid_cmb = QComboBox()
+        self.grid_cmb.addItems(GRID_LAYOUTS)
+        self.grid_cmb.setToolTip("Расположение панелей: строки x столбцы")
+        self.grid_cmb.currentTextChanged.connect(self.set_grid_layout)
+        self.grid_cmb.hide()
+        self.toolbar.setFixedWidth(260)
         self.clear_btn.clicked.connect(self.clear_graph)
         self.save_btn.clicked.connect(self.save)
         self.plot_layout.addWidget(self.canvas)
         # Добавляем toolbar и кнопки в новую панель
         self.toolbar_and_buttons_layout.addWidget(self.toolbar)
         self.toolbar_and_buttons_layout.addStretch(1)
+        self.toolbar_and_buttons_layout.addWidget(self.legend_btn)
+        self.toolbar_and_buttons_layout.addWidget(self.grid_cmb)
         self.toolbar_and_buttons_layout.addWidget(self.clear_btn)
         self.toolbar_and_buttons_layout.addWidget(self.save_btn)
         self.plot_layout.addWidget(self.toolbar_and_buttons_panel)
         self.main_layout.addWidget(self.bottom_panel)
         self.init_width, self.init_hight = self.canvas.fig.get_size_inches()
+        # Ввод текста в поля настроек переводит график в черновой профиль
+        for combo in self.setting_combos():
+            combo.lineEdit().textEdited.connect(self.canvas.begin_interaction)
+        self.y_settings.textEdited.connect(self.canvas.begin_interaction)
+        # Любое изменение настроек записывается в спецификацию страницы
+        for combo in self.setting_combos():
+            combo.currentTextChanged.connect(self.store_spec)
+        self.y_settings.textChanged.connect(self.store_spec)
+        self.x_spacing_grid_spinBox.valueChanged.connect(self.store_spec)
         logger.info(
             "Инициализация пользовательского интерфейса PlotArea успешно завершена"
         )
 
+    def setting_combos(self) -> tuple:
+        """Выпадающие списки настроек графика"""
+        return (
+            self.group,
+            self.sizing_cmb,
+            self.x_settings,
+            self.sizing_cmb_x,
+            self.group_x,
+            self.markers,
+        )
+
+    def bind(self, spec: dict):
+        """Отображает настройки страницы и очищает график без его перестроения"""
+        self.spec = spec
+        settings = spec["Axis_settings"]
+        values = {
+            self.group: spec["Symbol_Y"][0],
+            self.sizing_cmb: spec["Symbol_Y"][1],
+            self.group_x: spec["Symbol_X"][0],
+            self.sizing_cmb_x: spec["Symbol_X"][1],
+            self.x_settings: settings["X"],
+            self.markers: settings["Frequency"],
+        }
+        widgets = (
+            *values,
+            self.y_settings,
+            self.x_spacing_grid_spinBox,
+            self.mode_cmb,
+            self.legend_btn,
+            self.grid_cmb,
+        )
+        for widget in widgets:
+            widget.blockSignals(True)
+        for combo, text in values.items():
+            combo.setCurrentIndex(-1)
+            combo.setCurrentText(text)
+        self.y_settings.setText(settings["Y"])
+        self.x_spacing_grid_spinBox.setValue(int(settings["X_grid_lines"]))
+        self.mode_cmb.setCurrentIndex(self.mode_cmb.findData(spec["Mode"]))
+        self.legend_btn.setChecked(spec["Legend"])
+        self.legend_btn.setVisible(spec["Mode"] == "many")
+        self.grid_cmb.setCurrentText(spec["Grid"])
+        self.grid_cmb.setVisible(spec["Mode"] == "grid")
+        for widget in widgets:
+            widget.blockSignals(False)
+        self.lines = {}
+        self.many = None
+        self.grid = None
+        self.stale = False
+        self.pending_capture = False
+        self.canvas.reset_axes()
+        self.cursor.reset()
+        self.toolbar.view_history = {}
+        self.toolbar.update()
+
+    def store_spec(self, *args):
+        """Записывает настройки графика в спецификацию страницы"""
+        if self.spec is None:
+            return
+        self.spec["Symbol_Y"] = [self.group.currentText(), self.sizing_cmb.currentText()]
+        self.spec["Symbol_X"] = [
+            self.group_x.currentText(),
+            self.sizing_cmb_x.currentText(),
+        ]
+        self.spec["Axis_settings"] = {
+            "X": self.x_settings.currentText(),
+            "Y": self.y_settings.text(),
+            "Frequency": self.markers.currentText(),
+            "X_grid_lines": str(self.x_spacing_grid_spinBox.value()),
+        }
+
+    def _on_rendered(self):
+        """Сохраняет отрисованный график в кэш страниц"""
+        if self.pending_capture:
+            self.pending_capture = False
+            self.main_window.store_page_image(self)
+
+    def _on_canvas_press(self, event):
+        """Перестраивает линии графика, показанного из кэша, при работе с ним"""
+        self.ensure_current()
+
+    def ensure_current(self):
+        """Перестраивает график, если он был показан из кэша"""
+        if self.stale and self.main_window.plot_area is self:
+            self.stale = False
+            self.main_window.update_graph()
+
     def update_marker_frequency(self):
         """
         Обновляет частоту маркеров при изменении значения в комбобоксе.
         """
-        text = self.markers.currentText()
-        ax = self.canvas.ax
-        if text.isdigit() and int(text) > 0:
-            self.marker_freq = int(text)
-            self.redraw_markers()
-        elif text in "auto" or text.startswith("0"):
-            self.marker_freq = int(ax.get_xlim()[1] / 10)
-            self.redraw_markers()
-        else:
+        self.ensure_current()
+        marker_freq = marker_frequency(
+            self.markers.currentText(), self.canvas.ax.get_xlim()[1]
+        )
+        if marker_freq is None:
             QMessageBox.warning(
                 self,
                 "Неверный формат",
@@ -287,111 +583,113 @@ class PlotArea(QWidget):
             )
             self.markers.setCurrentIndex(0)  # Сбрасываем на 'auto'
             return
+        self.marker_freq = marker_freq
+        if self.many is not None:
+            self.redraw_sparse_markers()
+        else:
+            self.redraw_markers()
 
     def redraw_markers(self):
         """Перерисовывает маркеры на всех существующих линиях."""
-        markers = MARKERS
+        apply_markers(self.canvas.ax, self.lines, self.marker_freq)
+        self.canvas.draw_idle()
+
+    def redraw_sparse_markers(self):
+        """Заново расставляет маркеры режима 'много линий'"""
+        for collection in self.many["markers"]:
+            collection.remove()
+        x = self.data[self.data.columns[0]].to_numpy(dtype=np.float64)
+        curves = {
+            idx: self.data[column].to_numpy() for idx, column in self.many["columns"].items()
+        }
+        self.many["markers"] = sparse_markers(self.canvas.ax, x, curves, self.marker_freq)
+        for collection in self.many["markers"]:
+            self.canvas.register_collection(collection, markers=True)
+        self.canvas.draw_idle()
+
+    def plot_many_lines(self):
+        """Строит все линии страницы режима 'много линий' одной коллекцией"""
         ax = self.canvas.ax
-        quantity_lines = len(self.lines)
-        if quantity_lines == 1:
-            line = list(self.lines.values())[0]
-        elif quantity_lines > 1:
-            step = int(math.sqrt(self.marker_freq))
-            for line_idx, line in self.lines.items():
-                markevery = self.marker_freq + line_idx * step
-                line.set_marker(markers[line_idx])
-                line.set_markevery(markevery)
-        handles, labels = ax.get_legend_handles_labels()
-        if quantity_lines >= 7:
-            ncols = 2
-            fz = 9
-        else:
-            ncols = 1
-            fz = 10
-        if len(handles) > 1:
-            ax.legend(handles, labels, fontsize=fz, ncols=ncols)
-        else:
-            ax.legend().remove()
-        ax.tick_params(axis="both", which="major", labelsize=12)
+        ax.cla()
+        self.lines = {}
+        self.cursor.reset()
+        setup_page_axes(ax, self.spec, self.data)
+        self.many = plot_many_lines(ax, self.spec, self.data)
+        self.canvas.register_collection(self.many["collection"])
+        for collection in self.many["markers"]:
+            self.canvas.register_collection(collection, markers=True)
+        self.canvas.draw_idle()
+        QTimer.singleShot(0, self.toolbar.save_current_view)
+
+    def plot_grid(self):
+        """
+        Строит страницу с панелями на фигуре холста.
+        Оси X панелей общие, поэтому масштаб и панорамирование одной панели
+        переносятся на все панели и выводятся одной отрисовкой холста.
+        """
+        self.lines = {}
+        self.many = None
+        self.cursor.reset()
+        self.grid = plot_grid(
+            self.canvas.fig, self.spec, self.data, self.main_window.shared_decimation()
+        )
+        # Первая панель - основные оси для тулбара, настроек оси X и перекрестия
+        self.canvas.ax = self.grid["axes"][0]
+        self.canvas.draw_idle()
+        QTimer.singleShot(0, self.toolbar.save_current_view)
+
+    def set_grid_layout(self, text: str):
+        """Изменяет расположение панелей страницы"""
+        if self.spec is None:
+            return
+        self.spec["Grid"] = text
+        self.main_window.left_panel.bind(self.spec)
+        self.main_window.update_graph()
+
+    def set_legend_visible(self, visible: bool):
+        """Показывает легенду режима 'много линий' (строится только при включении)"""
+        if self.spec is None:
+            return
+        self.spec["Legend"] = visible
+        self.ensure_current()
+        if self.many is None:
+            return
+        legend = self.canvas.ax.get_legend()
+        if legend is not None:
+            legend.remove()
+        if visible:
+            many_lines_legend(self.canvas.ax, self.many["columns"])
         self.canvas.draw_idle()
 
+    def line_columns(self) -> dict:
+        """Построенные линии графика: {номер линии: имя столбца}"""
+        if self.many is not None:
+            return dict(self.many["columns"])
+        if self.spec is None:
+            return {}
+        if self.grid is not None:
+            return {idx: self.spec["Lists"][idx] for idx in self.grid["lines"]}
+        return {idx: self.spec["Lists"][idx] for idx in self.lines}
+
     def get_current_params(self):
         """
         Получает текущие выбранные параметры из выпадающих списков.
         """
-        params = []
-        for combo in self.main_window.pages[self.main_window.current_page][
-            "left"
-        ].combos:
-            params.append(combo.currentText())
-        return params
+        if self.spec is None:
+            return []
+        return list(self.spec["Lists"])
 
     def vis_x_label_text(self):
-        unit = self.sizing_cmb_x.currentText()
-        if unit == "":
-            unit_tex = ""
-        else:
-            unit_tex = r"\text{" + unit + "}"
-        char = self.group_x.currentText()
-        if char == "":
-            char_tex = ""
-        else:
-            char_tex = r"\text{" + char + "}"
-        if char_tex != "" and unit_tex != "":
-            x_label_text = rf"$\frac{{{unit_tex}}}{{{char_tex}}}$"
-        elif char_tex != "" and unit_tex == "":
-            x_label_text = rf"${char_tex}$"
-        elif char_tex == "" and unit_tex != "":
-            x_label_text = rf"${unit_tex}$"
-        else:
-            x_label_text = ""
-        return x_label_text
+        """
+        Формирует текст в формате Latex для подписи оси X.
+        """
+        return x_label_text(self.group_x.currentText(), self.sizing_cmb_x.currentText())
 
     def vis_y_label_text(self):
         """
         Формирует текст в формате Latex для подписи оси Y .
         """
-        greek_alf = {
-            "alpha": r"\alpha",
-            "beta": r"\beta",
-            "gamma": r"\gamma",
-            "delta": r"\delta",
-            "pi": r"\pi",
-            "rho": r"\rho",
-            "tau": r"\tau",
-            "phi": r"\phi",
-            "omega": r"\omega",
-            "DeltaC": r"\Delta C",
-            "Phi": r"\Phi",
-        }
-
-        units = UNITS
-        unit = self.sizing_cmb.currentText()
-        if unit in units:
-            unit_tex = units[unit]
-        elif unit == "":
-            unit_tex = ""
-        else:
-            unit_tex = (
-                r"\text{" + unit + "}"
-            )  # Если пользователь ввел свое значение, экранируем его как текст.
-        char = self.group.currentText()
-        if char == "":
-            char_tex = ""
-        elif char in greek_alf.keys():
-            char_tex = f"{greek_alf[char]}"
-        else:
-            char_tex = r"\text{" + char + "}"
-
-        if char_tex != "" and unit_tex != "":
-            y_label_text = rf"$\frac{{{char_tex}}}{{{unit_tex}}}$"
-        elif char_tex != "" and unit_tex == "":
-            y_label_text = rf"${char_tex}$"
-        elif char_tex == "" and unit_tex != "":
-            y_label_text = rf"${unit_tex}$"
-        else:
-            y_label_text = ""
-        return y_label_text
+        return y_label_text(self.group.currentText(), self.sizing_cmb.currentText())
 
     def update_plot(self, line_idx: int, column_name: str):
         """
@@ -404,34 +702,15 @@ class PlotArea(QWidget):
         if not column_name:
             return
 
-        colors = COLORS
         ax = self.canvas.ax
-        ax.tick_params(axis="both", which="major", labelsize=12)
-        ax.xaxis.label.set_fontsize(14)
-        ax.yaxis.label.set_fontsize(14)
-        x_label_text = self.vis_x_label_text()
-        ax.set_xlabel(x_label_text, loc="right")
-        y_label_text = self.vis_y_label_text()
-        ax.set_ylabel(
-            y_label_text,
-            loc="top",
-            rotation=0,
-            labelpad=-10,
-        )
+        style_axes(ax, self.vis_x_label_text(), self.vis_y_label_text())
         time = self.data.columns[0]
         self.change_x_settings()
-        self.change_y_settings()
-        ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda val, loc: f"{val:.0f}"))
-        ax.yaxis.set_major_formatter(
-            plt.ScalarFormatter(useMathText=True, useOffset=False)
-        )
 
         # Remove existing line if present
         if line_idx in self.lines:
             self.lines[line_idx].remove()
             del self.lines[line_idx]
-        ax.relim()
-        ax.autoscale_view()
         x = self.data[time]
         if column_name in self.data.columns:
             y = self.data[column_name]
@@ -441,38 +720,28 @@ class PlotArea(QWidget):
             x,
             y,
             label=str(line_idx + 1),
-            color=colors[line_idx % len(colors)],
+            color=line_color(line_idx),
             linewidth=1.5,
         )
         self.lines[line_idx] = line
-        # Update legend
-        handles, labels = ax.get_legend_handles_labels()
-        if len(handles) > 1:
-            ax.legend(handles, labels, fontsize=10)
-        else:
-            ax.legend().remove()
-        ax.grid(True, which="major", axis="both", linestyle="-", linewidth=0.5)
+        self.canvas.register_line(line, x, y)
+        self.change_y_settings()
+        draw_grid(ax)
         self.update_marker_frequency()
         self.canvas.draw_idle()
         QTimer.singleShot(0, self.toolbar.save_current_view)
 
     def change_x_settings(self):
         """Обработчик события изменения границ оси Х"""
+        self.ensure_current()
         ax = self.canvas.ax
         time = self.data.columns[0]
         try:
-            text = self.x_settings.currentText()
-            if text.isalpha() or text == "":
-                self.x_axis_limit = self.data[time].max()
-                ax.set_xlim(0.0, self.x_axis_limit)
-            else:
-                self.x_axis_limit = int(text)
-                ax.set_xlim(0.0, self.x_axis_limit)
-            ax.xaxis.set_major_locator(
-                plt.MultipleLocator(
-                    self.x_axis_limit / self.x_spacing_grid_spinBox.value()
-                )
+            self.x_axis_limit = x_axis_limit(
+                self.x_settings.currentText(),
+                self.main_window.column_stats.max(time),
             )
+            set_x_limit(ax, self.x_axis_limit, self.x_spacing_grid_spinBox.value())
             self.canvas.draw_idle()
         except ValueError:
             msg = MessageWindow(
@@ -485,16 +754,21 @@ class PlotArea(QWidget):
 
     def change_y_settings(self):
         """Обработчик события изменения границ оси У"""
+        self.ensure_current()
         ax = self.canvas.ax
         try:
-            text = self.y_settings.text().strip().lower()
-            if text in ["auto", ""]:
-                ax.set_ylim(auto=True)
+            y_limits = parse_y_limits(self.y_settings.text())
+            if self.grid is not None:
+                # Настройка относится к каждой панели
+                for panel in self.grid["axes"]:
+                    apply_y_settings(panel, self.spec)
+                if y_limits is None:
+                    self.y_settings.setText("auto")
+            elif y_limits is None:
+                self.autoscale_y()
                 self.y_settings.setText("auto")
             else:
-                max_y = float(self.y_settings.text().split(",")[1])
-                min_y = float(self.y_settings.text().split(",")[0])
-                ax.set_ylim(min_y, max_y)
+                ax.set_ylim(*y_limits)
             self.canvas.draw_idle()
         except Exception as e:
             print(str(e))
@@ -506,20 +780,34 @@ class PlotArea(QWidget):
             self.y_settings.setText("auto")
             return
 
+    def autoscale_y(self):
+        """Автоматические границы оси Y по кэшу статистики столбцов, без просмотра данных линий"""
+        ax = self.canvas.ax
+        stats = self.main_window.column_stats
+        columns = list(self.line_columns().values())
+        limits = y_autoscale_limits([stats.get(c) for c in columns], ax.margins()[1])
+        if limits is None:
+            ax.set_ylim(auto=True)
+        else:
+            ax.set_ylim(*limits)
+
     def clear_graph(self):
         """Обработчик события нажатия на кнопку Очистить график"""
         self.canvas.clear_plot()
         self.lines = {}
-        for combo in self.main_window.pages[self.main_window.current_page][
-            "left"
-        ].combos:
+        self.many = None
+        self.grid = None
+        for combo in self.main_window.left_panel.combos:
             combo.setCurrentIndex(-1)
-        right_panel = self.main_window.pages[self.main_window.current_page]["right"]
-        right_panel.group.setCurrentIndex(-1)
-        right_panel.sizing_cmb.setCurrentIndex(-1)
-        right_panel.y_settings.setText("auto")
-        right_panel.x_settings.setCurrentText("auto")
-        right_panel.markers.setCurrentText("auto")
+        if self.spec is not None:
+            # Линии режима 'много линий' сверх выпадающих списков
+            del self.spec["Lists"][LINES_PER_PAGE:]
+            self.main_window.left_panel.update_lines_summary()
+        self.group.setCurrentIndex(-1)
+        self.sizing_cmb.setCurrentIndex(-1)
+        self.y_settings.setText("auto")
+        self.x_settings.setCurrentText("auto")
+        self.markers.setCurrentText("auto")
         self.canvas.draw()
 
     def save(self):
@@ -548,6 +836,8 @@ class PlotArea(QWidget):
             return
         if not Path(directory).exists():
             Path(directory).mkdir(exist_ok=True)
+        # График, показанный из кэша изображений, перестраивается перед сохранением
+        self.ensure_current()
         number = self.main_window.current_page + 1
         x_axis_limit = self.canvas.ax.get_xlim()[1]
 
@@ -557,7 +847,22 @@ class PlotArea(QWidget):
         filename = (
             f"/grf_{number} из {len(self.main_window.pages)}_{int(x_axis_limit)}s.png"
         )
-        self.canvas.figure.savefig(directory + filename, format="png", dpi=600)
+        # Изображение сохраняется с текущим масштабом, поэтому границы осей входят в ключ
+        view = [[*ax.get_xlim(), *ax.get_ylim()] for ax in self.canvas.fig.axes]
+        key = self.main_window.export_key(
+            self.spec, (self.init_width, self.init_hight), 600, view=view
+        )
+        cache = self.main_window.render_cache
+        if not cache.copy_to(key, directory + filename):
+            # Отрисовка в буфер RGBA и кодирование PNG с палитрой (см. image_encoding)
+            buffer = BytesIO()
+            self.canvas.figure.savefig(buffer, format="rgba", dpi=600)
+            raw = np.frombuffer(buffer.getvalue(), dtype=np.uint8)
+            width = int(self.init_width * 600)
+            rgba = raw.reshape(-1, width, 4)
+            image = encode_png(rgba, 600)
+            write_output(directory + filename, image)
+            cache.put(key, image)
         self.canvas.figure.set_size_inches(current_width, current_hight)
         QMessageBox.information(
             self,
@@ -574,34 +879,8 @@ class PlotArea(QWidget):
             line = self.lines[combo_idx]
             line.remove()
             del self.lines[combo_idx]
-        handles, labels = self.canvas.ax.get_legend_handles_labels()
-        if len(handles) > 1:
-            if len(handles) >=7:
-                ncols = 2
-                fz = 9
-            else:
-                ncols = 1
-                fz = 10
-            self.canvas.ax.legend(handles, labels, fontsize = fz, ncols = ncols)
-        else:
-            if not self.lines:
-                self.canvas.draw_idle()
-                return
+        if len(self.lines) == 1:
             line = list(self.lines.values())[0]
             line.set_markevery(10e6)
-            self.canvas.ax.legend().remove()
+        update_legend(self.canvas.ax, len(self.lines))
         self.canvas.draw_idle()
-
-    def disconnect_signals(self):
-        self.group.currentTextChanged.disconnect()
-        self.group_x.currentTextChanged.disconnect()
-        self.x_settings.currentTextChanged.disconnect()
-        self.sizing_cmb_x.currentTextChanged.disconnect()
-        self.sizing_cmb.currentTextChanged.disconnect()
-
-    def connect_signals(self):
-        self.group.currentTextChanged.connect(self.main_window.update_graph)
-        self.group_x.currentTextChanged.connect(self.main_window.update_graph)
-        self.x_settings.currentTextChanged.connect(self.main_window.update_graph)
-        self.sizing_cmb_x.currentTextChanged.connect(self.main_window.update_graph)
-        self.sizing_cmb.currentTextChanged.connect(self.main_window.update_graph)
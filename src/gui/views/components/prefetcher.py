@@ -0,0 +1,128 @@
+"""Модуль фоновой подготовки изображений соседних страниц"""
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from src.core.constants import (
+    PREFETCH_RADIUS,
+    PREFETCH_WORKERS,
+    PREFETCH_DELAY,
+    PREFETCH_MAX_BYTES,
+)
+from src.core.page_cache import page_key
+from src.core.page_spec import copy_page_spec
+from src.core.render import render_page
+from src.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class PagePrefetcher(QObject):
+    """
+    Фоновая отрисовка соседних страниц (N±1, N±2) в кэш изображений главного окна.
+    Отрисовка начинается после паузы в навигации и выполняется вне потока GUI.
+    При переходе на другую страницу незавершенная подготовка отменяется.
+
+    Attributes:
+        main_window (QMainWindow): Ссылка на главное окно приложения.
+        radius (int): Количество соседних страниц с каждой стороны.
+        max_bytes (int): Объем памяти под изображения одной подготовки.
+    """
+
+    _rendered = pyqtSignal(int, str, object)
+
+    def __init__(
+        self,
+        main_window,
+        radius: int = PREFETCH_RADIUS,
+        workers: int = PREFETCH_WORKERS,
+        max_bytes: int = PREFETCH_MAX_BYTES,
+    ):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.radius = radius
+        self.max_bytes = max_bytes
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="prefetch"
+        )
+        self._generation = 0
+        self._futures = []
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(PREFETCH_DELAY)
+        self._idle_timer.timeout.connect(self._start)
+        self._rendered.connect(self._on_rendered)
+
+    def schedule(self):
+        """Отменяет устаревшую подготовку и запускает новую после паузы"""
+        self.cancel()
+        self._idle_timer.start()
+
+    def cancel(self):
+        """Отменяет всю незавершенную подготовку"""
+        self._generation += 1
+        self._idle_timer.stop()
+        for future in self._futures:
+            future.cancel()
+        self._futures = []
+
+    def shutdown(self):
+        """Останавливает рабочие потоки"""
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _neighbors(self) -> list[int]:
+        """Индексы соседних страниц в порядке приоритета: N+1, N-1, N+2, N-2..."""
+        current = self.main_window.current_page
+        count = len(self.main_window.pages)
+        result = []
+        for distance in range(1, self.radius + 1):
+            for idx in (current + distance, current - distance):
+                if 0 <= idx < count:
+                    result.append(idx)
+        return result
+
+    def _start(self):
+        """Ставит в очередь отрисовку соседних страниц, отсутствующих в кэше"""
+        main_window = self.main_window
+        if not main_window.pages:
+            return
+        canvas = main_window.plot_area.canvas
+        size = canvas.get_width_height(physical=True)
+        if size[0] <= 0 or size[1] <= 0:
+            return
+        budget = self.max_bytes // (size[0] * size[1] * 4)
+        generation = self._generation
+        for idx in self._neighbors()[:budget]:
+            # Копия: спецификация может измениться во время отрисовки
+            state = copy_page_spec(main_window.pages[idx])
+            key = page_key(state, main_window.data_version, size)
+            if key in main_window.page_cache:
+                continue
+            self._futures.append(
+                self._executor.submit(
+                    self._render,
+                    generation,
+                    key,
+                    state,
+                    main_window.data,
+                    size,
+                    canvas.figure.dpi,
+                )
+            )
+
+    def _render(self, generation, key, state, data, size, dpi):
+        """Отрисовка страницы в рабочем потоке"""
+        if generation != self._generation:
+            return
+        try:
+            image = render_page(state, data, size, dpi)
+        except Exception as e:
+            logger.error(f"Ошибка фоновой отрисовки страницы: {str(e)}", exc_info=True)
+            return
+        self._rendered.emit(generation, key, image)
+
+    def _on_rendered(self, generation: int, key: str, image):
+        """Помещает готовое изображение в кэш, если подготовка не устарела"""
+        if generation == self._generation:
+            self.main_window.page_cache.put(key, image)
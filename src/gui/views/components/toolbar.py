@@ -21,6 +21,22 @@ class MyNavigationToolbar(NavigationToolbar):
         self.view_history = {}
         self.canvas = canvas
         super().__init__(canvas, parent, coordinates)
+        self.cursor_action = self.addAction("Курсор")
+        self.cursor_action.setCheckable(True)
+        self.cursor_action.setToolTip(
+            "Перекрестие со значениями всех линий\nв момент времени под курсором"
+        )
+        self.cursor_action.triggered.connect(
+            lambda checked: self.plot_area.main_window.set_cursor_mode(checked)
+        )
+        self.sync_action = self.addAction("Синхр.")
+        self.sync_action.setCheckable(True)
+        self.sync_action.setToolTip(
+            "Показывать перекрестие в том же\nмомент времени на всех графиках"
+        )
+        self.sync_action.triggered.connect(
+            lambda checked: self.plot_area.main_window.set_cursor_sync(checked)
+        )
         logger.info('Инициализация MyNavigationToolbar успешно завершена')
 
     def my_home(self):
@@ -35,7 +51,7 @@ class MyNavigationToolbar(NavigationToolbar):
             ax.set_ylim(ylim)
         else:
             if time in self.plot_area.data.columns:
-                x_axis_limit = self.plot_area.data[time].max()
+                x_axis_limit = self.plot_area.main_window.column_stats.max(time)
                 ax.set_xlim(0, x_axis_limit)
             else:
                 ax.set_xlim(0, 1000)
@@ -0,0 +1,229 @@
+import sys
+
+import numpy as np
+import pandas as pd
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QDoubleValidator
+from PyQt5.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QCheckBox,
+    QComboBox,
+    QDialog,
+    QDialogButtonBox,
+    QFormLayout,
+    QHeaderView,
+    QLabel,
+    QLineEdit,
+    QMessageBox,
+    QPushButton,
+    QTableView,
+    QVBoxLayout,
+)
+
+from src.core.events import find_crossings, select_columns
+from src.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+# Направления пересечения: (направление, название)
+DIRECTIONS = [
+    ("up", "Снизу вверх"),
+    ("down", "Сверху вниз"),
+    ("both", "Любое"),
+]
+
+# Выбор параметров: (способ, название)
+SELECTIONS = [
+    ("all", "Все параметры"),
+    ("regex", "Регулярное выражение"),
+    ("list", "Список (через ;)"),
+]
+
+
+class CrossingModel(QAbstractTableModel):
+    """
+    Таблица найденных пересечений с сортировкой по любому столбцу.
+
+    Attributes:
+        result (pd.DataFrame): Пересечения (src/core/events.py: find_crossings).
+    """
+
+    HEADERS = ["Параметр", "Время, с", "Строка", "Направление"]
+    KEYS = ["column", "time", "row", "direction"]
+
+    def __init__(self, result: pd.DataFrame | None = None):
+        super().__init__()
+        self.result = result if result is not None else pd.DataFrame(columns=self.KEYS)
+
+    def set_result(self, result: pd.DataFrame) -> None:
+        self.beginResetModel()
+        self.result = result.reset_index(drop=True)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return len(self.result)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return len(self.KEYS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        value = self.result.iat[index.row(), index.column()]
+        key = self.KEYS[index.column()]
+        if key == "time":
+            return f"{value:.6g}"
+        if key == "direction":
+            return "вверх" if value == "up" else "вниз"
+        return str(value)
+
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+
+    def sort(self, column: int, order=Qt.AscendingOrder) -> None:
+        self.layoutAboutToBeChanged.emit()
+        self.result = self.result.sort_values(
+            self.KEYS[column], ascending=order == Qt.AscendingOrder, kind="stable"
+        ).reset_index(drop=True)
+        self.layoutChanged.emit()
+
+
+class CrossingDialog(QDialog):
+    """
+    Диалоговое окно поиска пересечений порога параметрами набора данных.
+    По найденным пересечениям можно построить графики (кнопка 'Построить графики'
+    закрывает окно, выбранные параметры - selected_columns).
+
+    Attributes:
+        threshold_edit (QLineEdit): Порог.
+        direction_cmb (QComboBox): Направление пересечения.
+        selection_cmb (QComboBox): Способ выбора параметров.
+        selection_edit (QLineEdit): Регулярное выражение или список параметров.
+        first_chk (QCheckBox): Только первое пересечение каждого параметра.
+        table (QTableView): Найденные пересечения.
+        count_lbl (QLabel): Количество пересечений и параметров.
+    """
+
+    def __init__(self, data, parent=None):
+        super().__init__(parent)
+        logger.info("Инициализация CrossingDialog")
+        self.setWindowTitle("Поиск пересечений порога")
+        self.resize(600, 700)
+        self._data = data
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+        self.threshold_edit = QLineEdit("0")
+        self.threshold_edit.setValidator(QDoubleValidator())
+        self.direction_cmb = QComboBox()
+        for direction, title in DIRECTIONS:
+            self.direction_cmb.addItem(title, direction)
+        self.selection_cmb = QComboBox()
+        for selection, title in SELECTIONS:
+            self.selection_cmb.addItem(title, selection)
+        self.selection_edit = QLineEdit()
+        self.selection_edit.setEnabled(False)
+        self.selection_cmb.currentIndexChanged.connect(
+            lambda index: self.selection_edit.setEnabled(
+                self.selection_cmb.currentData() != "all"
+            )
+        )
+        self.first_chk = QCheckBox("Только первое пересечение")
+        self.first_chk.setChecked(True)
+        self.search_btn = QPushButton("Найти")
+        self.search_btn.clicked.connect(self.search)
+        form.addRow("Порог:", self.threshold_edit)
+        form.addRow("Направление:", self.direction_cmb)
+        form.addRow("Параметры:", self.selection_cmb)
+        form.addRow("", self.selection_edit)
+        form.addRow("", self.first_chk)
+        self.model = CrossingModel()
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSortingEnabled(True)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.count_lbl = QLabel()
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        self.pages_btn = buttons.addButton(
+            "Построить графики", QDialogButtonBox.AcceptRole
+        )
+        self.pages_btn.setEnabled(False)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addLayout(form)
+        layout.addWidget(self.search_btn)
+        layout.addWidget(self.table)
+        layout.addWidget(self.count_lbl)
+        layout.addWidget(buttons)
+        logger.info("Инициализация CrossingDialog успешно завершена")
+
+    def threshold(self) -> float:
+        return float(self.threshold_edit.text().replace(",", ".") or 0)
+
+    def columns(self) -> list[str]:
+        """Параметры поиска по способу выбора"""
+        columns = [str(column) for column in self._data.columns[1:]]
+        selection = self.selection_cmb.currentData()
+        text = self.selection_edit.text().strip()
+        if selection == "regex":
+            return select_columns(columns, text)
+        if selection == "list":
+            return select_columns(
+                columns, [name.strip() for name in text.split(";") if name.strip()]
+            )
+        return columns
+
+    def search(self):
+        """Поиск пересечений и вывод их в таблицу"""
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            result = find_crossings(
+                self._data,
+                self.threshold(),
+                self.columns(),
+                self.direction_cmb.currentData(),
+                self.first_chk.isChecked(),
+            )
+        except ValueError as e:
+            QApplication.restoreOverrideCursor()
+            QMessageBox.warning(self, "Ошибка", str(e))
+            logger.error(f"Ошибка поиска пересечений: {str(e)}")
+            return
+        QApplication.restoreOverrideCursor()
+        self.model.set_result(result)
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.count_lbl.setText(
+            f"Пересечений: {len(result)}, параметров: {result['column'].nunique()}"
+        )
+        self.pages_btn.setEnabled(len(result) > 0)
+        logger.info(f"Найдено пересечений порога {self.threshold()}: {len(result)}")
+
+    def selected_columns(self) -> list[str]:
+        """
+        Параметры выделенных строк таблицы (все найденные, если ничего не выделено)
+        в порядке строк таблицы
+        """
+        selected = self.table.selectionModel().selectedRows()
+        rows = sorted(index.row() for index in selected)
+        names = self.model.result["column"]
+        if rows:
+            names = names.iloc[rows]
+        return list(dict.fromkeys(names))
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    t = np.linspace(0, 100, 10001)
+    frame = pd.DataFrame(
+        {"Время": t, **{f"Параметр {i}": np.sin(t / (i + 1)) * i for i in range(50)}}
+    )
+    dialog = CrossingDialog(frame)
+    if dialog.exec_():
+        print(dialog.threshold(), dialog.selected_columns())
+    sys.exit(0)
@@ -0,0 +1,81 @@
+import sys
+
+from PyQt5.QtWidgets import (
+    QApplication,
+    QComboBox,
+    QDialog,
+    QDialogButtonBox,
+    QFormLayout,
+    QHBoxLayout,
+    QLabel,
+    QSpinBox,
+)
+
+from src.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+# Форматы экспорта всех графиков: (формат, название)
+EXPORT_FORMATS = [
+    ("png", "PNG (файл на каждый график)"),
+    ("pdf", "PDF (один многостраничный файл)"),
+    ("svg", "SVG (файл на каждый график)"),
+]
+
+
+class ExportDialog(QDialog):
+    """
+    Диалоговое окно настроек экспорта всех графиков: формат и диапазон страниц.
+
+    Attributes:
+        format_cmb (QComboBox): Формат экспорта.
+        first_spin (QSpinBox): Первая страница диапазона.
+        last_spin (QSpinBox): Последняя страница диапазона.
+    """
+
+    def __init__(self, page_count: int, current_page: int = 0, parent=None):
+        super().__init__(parent)
+        logger.info("Инициализация ExportDialog")
+        self.setWindowTitle("Сохранение графиков")
+        layout = QFormLayout(self)
+        self.format_cmb = QComboBox()
+        for fmt, title in EXPORT_FORMATS:
+            self.format_cmb.addItem(title, fmt)
+        self.first_spin = QSpinBox()
+        self.first_spin.setRange(1, page_count)
+        self.first_spin.setValue(1)
+        self.last_spin = QSpinBox()
+        self.last_spin.setRange(1, page_count)
+        self.last_spin.setValue(page_count)
+        self.first_spin.valueChanged.connect(
+            lambda value: self.last_spin.setMinimum(value)
+        )
+        self.last_spin.valueChanged.connect(
+            lambda value: self.first_spin.setMaximum(value)
+        )
+        range_layout = QHBoxLayout()
+        range_layout.addWidget(self.first_spin)
+        range_layout.addWidget(QLabel("по"))
+        range_layout.addWidget(self.last_spin)
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addRow("Формат:", self.format_cmb)
+        layout.addRow("Графики с", range_layout)
+        layout.addRow(buttons)
+        logger.info("Инициализация ExportDialog успешно завершена")
+
+    def export_format(self) -> str:
+        return self.format_cmb.currentData()
+
+    def page_range(self) -> range:
+        """Индексы экспортируемых страниц (с 0)"""
+        return range(self.first_spin.value() - 1, self.last_spin.value())
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    dialog = ExportDialog(12)
+    if dialog.exec_():
+        print(dialog.export_format(), list(dialog.page_range()))
+    sys.exit(0)
@@ -0,0 +1,98 @@
+import sys
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import (
+    QApplication,
+    QDialog,
+    QDialogButtonBox,
+    QLabel,
+    QLineEdit,
+    QListWidget,
+    QListWidgetItem,
+    QVBoxLayout,
+)
+
+from src.core.constants import MANY_LINES_MAX
+from src.utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class LinesDialog(QDialog):
+    """
+    Диалоговое окно выбора линий страницы в режиме 'много линий'.
+    Номера линий присваиваются в порядке отметки параметров.
+
+    Attributes:
+        filter_edit (QLineEdit): Поле фильтра параметров.
+        list_widget (QListWidget): Список параметров с отметками.
+        count_lbl (QLabel): Количество выбранных линий.
+    """
+
+    def __init__(self, columns: list[str], selected: list[str], parent=None):
+        super().__init__(parent)
+        logger.info("Инициализация LinesDialog")
+        self.setWindowTitle("Выбор линий")
+        self.resize(450, 600)
+        self._selected = [text for text in selected if text]
+        layout = QVBoxLayout(self)
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Фильтр")
+        self.filter_edit.textChanged.connect(self.apply_filter)
+        self.list_widget = QListWidget()
+        chosen = set(self._selected)
+        # Выбранные параметры, которых нет в наборе данных, тоже показываются
+        for column in [*columns, *(text for text in self._selected if text not in columns)]:
+            item = QListWidgetItem(column)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked if column in chosen else Qt.Unchecked)
+            self.list_widget.addItem(item)
+        self.list_widget.itemChanged.connect(self.on_item_changed)
+        self.count_lbl = QLabel()
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(self.filter_edit)
+        layout.addWidget(self.list_widget)
+        layout.addWidget(self.count_lbl)
+        layout.addWidget(buttons)
+        self.update_count()
+        logger.info("Инициализация LinesDialog успешно завершена")
+
+    def apply_filter(self, text: str):
+        """Скрывает параметры, не содержащие текст фильтра"""
+        text = text.lower()
+        for row in range(self.list_widget.count()):
+            item = self.list_widget.item(row)
+            item.setHidden(text not in item.text().lower())
+
+    def on_item_changed(self, item: QListWidgetItem):
+        """Добавляет или удаляет параметр из выбранных линий"""
+        column = item.text()
+        if item.checkState() == Qt.Checked:
+            if column in self._selected:
+                return
+            if len(self._selected) >= MANY_LINES_MAX:
+                self.list_widget.blockSignals(True)
+                item.setCheckState(Qt.Unchecked)
+                self.list_widget.blockSignals(False)
+                return
+            self._selected.append(column)
+        elif column in self._selected:
+            self._selected.remove(column)
+        self.update_count()
+
+    def update_count(self):
+        self.count_lbl.setText(f"Выбрано линий: {len(self._selected)} из {MANY_LINES_MAX}")
+
+    def selected_lines(self) -> list[str]:
+        """Выбранные параметры в порядке номеров линий"""
+        return list(self._selected)
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    dialog = LinesDialog([f"Параметр {i}" for i in range(300)], ["Параметр 5"])
+    if dialog.exec_():
+        print(dialog.selected_lines())
+    sys.exit(0)
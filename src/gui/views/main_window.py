@@ -6,8 +6,8 @@
 """
 import sys
 import os
+from io import BytesIO
 import yaml
-import re
 from pathlib import Path
 from collections import Counter
 
@@ -15,8 +15,6 @@ from PyQt5.QtWidgets import (
     QApplication,
     QMainWindow,
     QWidget,
-    QVBoxLayout,
-    QHBoxLayout,
     QFileDialog,
     QStackedWidget,
     QToolBar,
@@ -40,17 +38,44 @@ from src.core.constants import (
     SAVE_FILE,
     DEFAULT_DIR,
     ICONS_DIR,
+    PAGE_CACHE_MAX_BYTES,
+    PAGE_FIGURE_SIZE,
+    GRID_BUCKETS,
+    LINES_PER_PAGE,
+    RENDER_CACHE_DIR,
+    RENDER_CACHE_MAX_BYTES,
 )
 from src.core.data_loader import DataLoader, DublicatedColumnsError
+from src.core.page_cache import PageBitmapCache, page_key
+from src.core.column_stats import ColumnStats
+from src.core.dataset import Dataset
+from src.core.operation_log import OperationLog, make_operation
+from src.core.decimation import SharedDecimation
+from src.core.page_spec import (
+    new_page_spec,
+    spec_from_state,
+    clear_page_spec,
+    copy_page_spec,
+    spec_labels,
+    derived_columns,
+    next_page_number,
+    pad_lines,
+)
+from src.core.render_pool import RenderPool
+from src.core.render_cache import RenderCache, render_key, page_columns, hit_rate_text
 from src.gui.views.components.lyne_edit import MyLineEdit
-from src.gui.views.components.left_panel import LeftPanel
-from src.gui.views.components.plot_area import PlotArea
+from src.gui.views.components.page_view import PageView, PageViewPool
+from src.gui.views.components.combo_box import ColumnModel
 from src.gui.views.dialogs.message import MessageWindow
 from src.gui.views.dialogs.progress import MyProgressDialog
 from src.gui.views.word.settings import WordSettings
 from src.gui.views.word.word_export import Word
 from src.gui.views.components.data_table import DataTableView
 from src.gui.views.components.buffer import Buffer
+from src.gui.views.components.prefetcher import PagePrefetcher
+from src.gui.views.components.export_job import ExportJob, PdfExportJob
+from src.gui.views.dialogs.export_dialog import ExportDialog
+from src.gui.views.dialogs.crossing_dialog import CrossingDialog
 from src.utils.logger import Logger
 
 logger = Logger.get_logger(__name__)
@@ -61,13 +86,22 @@ class MainWindow(QMainWindow):
     Главное окно приложения для построения графиков.
 
     Attributes:
-        pages (list): Список словарей, содержащих информацию о каждой странице (графике).
+        pages (list): Список спецификаций страниц (графиков) в формате файла сохранения.
         current_page (int): Индекс текущей активной страницы.
         data_file_path (str): Путь к файлу с данными.
-        data (pd.DataFrame): DataFrame с данными для построения графиков.
+        data (Dataset): Набор данных для построения графиков.
+        operation_log (OperationLog): Журнал операций, задающих производные столбцы.
         stack (QStackedWidget): Виджет для отображения страниц.
-        alternative_captions(dict): словарь для альтернативных названий линий
         params(dict): словарь для хранения настроек Word для документа(шрифт, интервал и тд)
+        data_version (int): Версия набора данных, увеличивается при каждом его изменении.
+        page_cache (PageBitmapCache): Кэш отрисованных изображений страниц.
+        prefetcher (PagePrefetcher): Фоновая подготовка изображений соседних страниц.
+        page_pool (PageViewPool): Живые представления, отображающие видимую страницу.
+        column_model (ColumnModel): Общая модель имен столбцов для выпадающих списков линий.
+        column_stats (ColumnStats): Кэш статистики столбцов текущего набора данных.
+        cursor_enabled (bool): Включен режим перекрестия с показаниями линий.
+        cursor_sync (bool): Перекрестие показывается в одном моменте времени на всех страницах.
+        cursor_time (float | None): Момент времени перекрестия для синхронизации страниц.
     """
 
     def __init__(self, version: str):
@@ -75,14 +109,29 @@ class MainWindow(QMainWindow):
         logger.info("Инициализация MainWindow")
         self.pages: list = []
         self.params: dict = {}
-        self.alternative_captions: dict = {}
         self.version: str = version
         self.stack: QWidget = QStackedWidget()
         self.setCentralWidget(self.stack)
         self.setStyleSheet(STACK_WIDGET_STYLE)
         self.current_page = 0
         self.data_file_path = DEFAULT_FILE_PATH
-        self.data = DataLoader.default_data
+        self.data_version = 0
+        self.page_cache = PageBitmapCache(PAGE_CACHE_MAX_BYTES)
+        self.prefetcher = PagePrefetcher(self)
+        self.render_pool = RenderPool()
+        self.render_cache = RenderCache(RENDER_CACHE_DIR, RENDER_CACHE_MAX_BYTES)
+        self.page_pool = PageViewPool(self.create_page_view)
+        self._page_counter = 0
+        self.cursor_enabled = False
+        self.cursor_sync = False
+        self.cursor_time = None
+        self.operation_log = OperationLog()
+        self.data = Dataset(DataLoader.default_data)
+        self.data.subscribe(self._on_data_invalidated)
+        self.column_stats = ColumnStats(self.data)
+        self._shared_decimation = None
+        self.column_model = ColumnModel(self)
+        self.sync_columns()
         self.init_ui()
         logger.info("Интерфейс MainWindow успешно инициализирован")
         reply = QMessageBox.question(
@@ -94,7 +143,6 @@ class MainWindow(QMainWindow):
         )
         if reply != QMessageBox.No:
             self._load_state()
-        self.init_context_menu()
         self.change_status("Файл состояния не выбран")
 
     def init_ui(self):
@@ -133,6 +181,8 @@ class MainWindow(QMainWindow):
             "Новый проект",
             self.new_project,
         )
+        analysis_menu = self.menubar.addMenu("Анализ")
+        analysis_menu.addAction("Поиск пересечений порога...", self.find_crossings)
 
     def init_toolbar(self):
         """Инициализация ToolBar'a"""
@@ -256,17 +306,94 @@ class MainWindow(QMainWindow):
         toolbar.addWidget(self.path_lbl)
         toolbar.addWidget(self.path_ent)
 
-    def init_context_menu(self):
-        """Привязка к каждой странице контекстного меню по правому клику"""
-        for page in self.pages:
-            try:
-                page["widget"].customContextMenuRequested.disconnect()
-            except:
-                pass
-            page["widget"].setContextMenuPolicy(Qt.CustomContextMenu)
-            page["widget"].customContextMenuRequested.connect(self.show_context_menu)
-            shortcut_refresh = QShortcut(QKeySequence("F5"), page["widget"])
-            shortcut_refresh.activated.connect(self.update_graph)
+    @property
+    def left_panel(self):
+        """Левая панель видимой страницы"""
+        return self.page_pool.current.left
+
+    @property
+    def plot_area(self):
+        """Область графика видимой страницы"""
+        return self.page_pool.current.right
+
+    def create_page_view(self) -> PageView:
+        """Создает живое представление страницы с контекстным меню по правому клику"""
+        view = PageView(self.data, self)
+        view.setContextMenuPolicy(Qt.CustomContextMenu)
+        view.customContextMenuRequested.connect(self.show_context_menu)
+        shortcut_refresh = QShortcut(QKeySequence("F5"), view)
+        shortcut_refresh.activated.connect(self.update_graph)
+        view.right.toolbar.cursor_action.setChecked(self.cursor_enabled)
+        view.right.toolbar.sync_action.setChecked(self.cursor_sync)
+        view.right.cursor.set_enabled(self.cursor_enabled)
+        self.stack.addWidget(view)
+        return view
+
+    def set_cursor_mode(self, enabled: bool):
+        """Включает или выключает перекрестие на всех представлениях страниц"""
+        self.cursor_enabled = enabled
+        for view in self.page_pool.views:
+            view.right.toolbar.cursor_action.setChecked(enabled)
+            view.right.cursor.set_enabled(enabled)
+
+    def set_cursor_sync(self, enabled: bool):
+        """Включает или выключает синхронизацию перекрестия между страницами"""
+        self.cursor_sync = enabled
+        for view in self.page_pool.views:
+            view.right.toolbar.sync_action.setChecked(enabled)
+        if enabled:
+            self.cursor_time = self.plot_area.cursor.time
+
+    def shared_decimation(self) -> SharedDecimation:
+        """Общий прореженный индекс времени набора данных для страниц с панелями"""
+        if self._shared_decimation is None or self._shared_decimation.data is not self.data:
+            self._shared_decimation = SharedDecimation(self.data, GRID_BUCKETS)
+        return self._shared_decimation
+
+    def export_key(self, spec: dict, size_inches, dpi: float, format="png", view=None) -> str:
+        """Ключ дискового кэша изображения страницы для текущего набора данных"""
+        fingerprints = {
+            column: self.column_stats.fingerprint(column)
+            for column in page_columns(spec, self.data)
+        }
+        return render_key(spec, fingerprints, size_inches, dpi, format, view)
+
+    def prepare_render_pool(self, specs: list[dict]):
+        """
+        Запускает пул отрисовки для экспорта страниц. В разделяемую память
+        передаются только время и столбцы, построенные на страницах (производные
+        вычисляются заранее), набор столбцов входит в версию пула.
+        """
+        columns = list(
+            dict.fromkeys(
+                column
+                for spec in specs
+                for column in page_columns(spec, self.data)
+                if column in self.data
+            )
+        )
+        version = (self.data_version, tuple(columns))
+        if not self.render_pool.is_ready(version):
+            self.data.materialize(self.data.with_dependencies(columns))
+            self.render_pool.prepare(self.data, version, columns)
+
+    def change_page_mode(self, mode: str):
+        """Переключает режим видимой страницы ('lines' или 'many')"""
+        view = self.page_pool.current
+        spec = view.spec
+        if spec is None or spec["Mode"] == mode:
+            return
+        spec["Mode"] = mode
+        # В обычном режиме остаются только линии выпадающих списков
+        spec["Lists"] = pad_lines(spec["Lists"], mode)
+        view.bind(spec)
+        self.update_graph()
+
+    def new_page_id(self) -> str:
+        """Возвращает уникальный ID для новой страницы"""
+        page_id = f"graph_{self._page_counter}"
+        self._page_counter += 1
+        return page_id
 
     def show_context_menu(self, pos: QPoint):
         """Добаление кнопок в контексное меню"""
@@ -301,46 +428,16 @@ class MainWindow(QMainWindow):
 
     def copy_graph(self):
         """Копирование"""
-        id_graph = f"graph_{self.current_page}"
-        alt_caption = self.alternative_captions.get(id_graph, "")
-        self.buffer.copy(self.pages[self.current_page], alt_caption)
+        self.buffer.copy(self.pages[self.current_page])
 
     def paste_graph(self):
         """Вставка"""
-        left_panel, plot_area, alt_caption = self.buffer.paste()
-
-        for combo_idx, combo in enumerate(self.pages[self.current_page]["left"].combos):
-            combo.setCurrentText(left_panel[combo_idx])
-        self.pages[self.current_page]["right"].disconnect_signals()
-
-        self.pages[self.current_page]["right"].group.setCurrentText(
-            plot_area["Y_axis"]["group"]
-        )
-        self.pages[self.current_page]["right"].y_settings.setText(
-            plot_area["Y_axis"]["limits"]
-        )
-        self.pages[self.current_page]["right"].sizing_cmb.setCurrentText(
-            plot_area["Y_axis"]["sizing"]
-        )
-        self.pages[self.current_page]["right"].group_x.setCurrentText(
-            plot_area["X_axis"]["group"]
-        )
-        self.pages[self.current_page]["right"].x_settings.setCurrentText(
-            plot_area["X_axis"]["limits"]
-        )
-        self.pages[self.current_page]["right"].sizing_cmb_x.setCurrentText(
-            plot_area["X_axis"]["sizing"]
-        )
-        self.pages[self.current_page]["right"].markers.setCurrentText(
-            plot_area["marker_freq"]
-        )
-        self.pages[self.current_page]["right"].x_spacing_grid_spinBox.setValue(
-            plot_area["line_spacing"]
-        )
-        self.pages[self.current_page]["right"].connect_signals()
-        id_graph = f"graph_{self.current_page}"
-        self.alternative_captions.update({id_graph: alt_caption})
-        self.update_graph()
+        spec = self.buffer.paste()
+        if spec is None:
+            return
+        self.pages[self.current_page].update(spec)
+        self.page_pool.release(self.pages[self.current_page])
+        self.show_page(self.current_page)
 
     def center(self):
         """Центрирование главного окна окна"""
@@ -349,6 +446,12 @@ class MainWindow(QMainWindow):
         screen.moveCenter(center)
         self.move(screen.topLeft())
 
+    def closeEvent(self, event):
+        """Обработчик события закрытия главного окна"""
+        self.prefetcher.shutdown()
+        self.render_pool.shutdown()
+        super().closeEvent(event)
+
     def showEvent(self, event):
         """Обработчик события отображения окна на экране"""
         super().showEvent(event)
@@ -374,7 +477,10 @@ class MainWindow(QMainWindow):
                     state = yaml.load(f, Loader=yaml.FullLoader)
                     file_path = state.get("data_file_path", DEFAULT_FILE_PATH)
                     self.path_ent.setText(file_path)
-            self.data = DataLoader(path=file_path, enc=ENCODING).get_data()
+            self.set_dataset(DataLoader(path=file_path, enc=ENCODING).get_data())
+            # Производные столбцы прежнего набора данных в новом не создаются:
+            # страницы очищаются, журнал операций - тоже
+            self.operation_log.clear()
             self.update_pages()
         except DublicatedColumnsError as e:
             logger.error(f"Файл данных содержит дубликаты: {e.dublicated_columns}")
@@ -383,7 +489,8 @@ class MainWindow(QMainWindow):
                 detText=f"{e.dublicated_columns}",
             )
             msg.exec_()
-            self.data = DataLoader.default_data
+            self.set_dataset(DataLoader.default_data)
+            self.operation_log.clear()
             self.update_pages()
         except FileNotFoundError:
             logger.error(f"Файл данных не найден: {file_path}")
@@ -419,11 +526,7 @@ class MainWindow(QMainWindow):
         if not file_name:
             return
         logger.info(f"Сохранение графиков в Word в директорию: {file_name}")
-        progress = MyProgressDialog(title="Сохранение документа", parent=self)
-        progress.show()
         try:
-            # Сохраняем текущую страницу
-            original_page = self.current_page
             # Махинации с Word
             word_doc = Word()
             # Отступы
@@ -438,77 +541,107 @@ class MainWindow(QMainWindow):
                 int_before=self.params.get("int-before", "0"),
                 int_after=self.params.get("int-after", "0"),
             )
-            # Временная папка для изображений
-            temp_dir = Path("./temp_grf")
-            temp_dir.mkdir(exist_ok=True, parents=True)
-            progress.setMaximum(len(self.pages))
-            for idx, page in enumerate(self.pages):
-                progress.setValue(idx)
-                # Переключаемся на страницу
-                self.current_page = idx
-                self.stack.setCurrentIndex(idx)
-                QApplication.processEvents()
-                if progress.wasCanceled():
-                    break
-                # Обновляем график
-                self.update_graph()
-                page["right"].canvas.draw_idle()
-                QApplication.processEvents()
-                # Сохраняем временное изображение
-                img_path = temp_dir / f"graph_{idx}.png"
-                current_width, current_hight = page[
-                    "right"
-                ].canvas.fig.get_size_inches()
-                page["right"].canvas.fig.set_size_inches(
-                    page["right"].init_width, page["right"].init_hight
-                )
-
-                page["right"].canvas.figure.savefig(img_path, dpi=300)
-                page["right"].canvas.figure.set_size_inches(
-                    current_width, current_hight
-                )
-                # Добавляем в документ
-                # 1. Изображение
+            # Копии: страницы можно изменять, пока идет экспорт
+            specs = [copy_page_spec(spec) for spec in self.pages]
+            images = {}
+            keys = {}
+            futures = []
+            order = []
+            for idx, spec in enumerate(specs):
+                key = self.export_key(spec, PAGE_FIGURE_SIZE, 300)
+                image = self.render_cache.get(key)
+                if image is not None:
+                    images[idx] = image
+                    continue
+                keys[idx] = key
+                order.append(idx)
+            hits = len(specs) - len(order)
+            if order:
+                self.prepare_render_pool([specs[idx] for idx in order])
+                futures = [
+                    self.render_pool.submit_render(specs[idx], PAGE_FIGURE_SIZE, 300)
+                    for idx in order
+                ]
+            job = ExportJob(futures, self)
+        except Exception as e:
+            QMessageBox.critical(self, "Ошибка", f"Ошибка экспорта: {str(e)}")
+            logger.error(f"Ошибка экспорта в Word: {str(e)}", exc_info=True)
+            return
+        progress = MyProgressDialog(
+            title="Сохранение документа",
+            label_text=f"Экспорт {len(specs)} графиков в Word...",
+            parent=self,
+        )
+        progress.setMaximum(len(specs))
+        progress.setValue(hits)
+        progress.setWindowModality(Qt.NonModal)
+        progress.canceled.connect(job.cancel)
+        # Изображения добавляются в документ в порядке страниц по мере готовности
+        next_page = [0]
+
+        def add_ready_pages():
+            while next_page[0] in images:
+                idx = next_page[0]
                 word_doc.add_image(
-                    img_path,
+                    BytesIO(images.pop(idx)),
                     pic_width=self.params.get("pic-width", "16.0"),
                     pic_height=self.params.get("pic-height", "9.5"),
                 )
-                # 2. Подписи к изображениям
-                labels = [
-                    combo.currentText().split(",")[0].strip()
-                    for combo in page["left"].combos
-                    if combo.currentText()
-                ]
-                # Используем ID графика для получения альтернативной подписи
-                graph_id = page.get("id", f"graph_{idx}")
-                alternative_caption = self.alternative_captions.get(graph_id)
-                word_doc.set_caption(idx, labels, self.params, alternative_caption)
-            # Удаляем временные файлы
-            for f in temp_dir.glob("*.png"):
-                f.unlink()
-            temp_dir.rmdir()
-
-            # Сохраняем документ
-            if not progress.wasCanceled():
-                word_doc.save_doc(file_name)
-                QMessageBox.information(
-                    self,
-                    "Успех",
-                    f"Графики успешно экспортированы в Word в директорию:\n{file_name}",
-                )
-                logger.info(
-                    f"Графики успешно экспортированы в Word в директорию: {file_name}"
+                word_doc.set_caption(
+                    idx, spec_labels(specs[idx]), self.params, specs[idx]["alternative_caption"]
                 )
-        except Exception as e:
-            QMessageBox.critical(self, "Ошибка", f"Ошибка экспорта: {str(e)}")
+                next_page[0] += 1
+
+        def on_page_done(task_idx, image):
+            idx = order[task_idx]
+            self.render_cache.put(keys[idx], image)
+            images[idx] = image
+            if job.canceled:
+                return
+            try:
+                add_ready_pages()
+            except Exception as e:
+                logger.error(f"Ошибка добавления графика в Word: {str(e)}", exc_info=True)
+                job.errors.append(str(e))
+                job.cancel()
 
-        finally:
-            # Восстанавливаем ранее открытую страницу
+        def on_finished(canceled, errors):
+            self.word_act.setEnabled(True)
             progress.close()
-            self.current_page = original_page
-            self.stack.setCurrentIndex(original_page)
-            self.update_buttons()
+            job.deleteLater()
+            if errors:
+                QMessageBox.critical(
+                    self, "Ошибка", f"Ошибка экспорта: {errors[0]}"
+                )
+                return
+            if canceled:
+                # Документ существует только в памяти - на диске ничего не остается
+                logger.info(f"Экспорт в Word отменен: {file_name}")
+                return
+            try:
+                add_ready_pages()
+                word_doc.save_doc(file_name)
+            except Exception as e:
+                QMessageBox.critical(self, "Ошибка", f"Ошибка экспорта: {str(e)}")
+                return
+            cache_text = hit_rate_text(hits, len(specs))
+            logger.info(cache_text)
+            QMessageBox.information(
+                self,
+                "Успех",
+                f"Графики успешно экспортированы в Word в директорию:\n{file_name}"
+                f"\n{cache_text}",
+            )
+            logger.info(
+                f"Графики успешно экспортированы в Word в директорию: {file_name}"
+            )
+
+        job.progress.connect(lambda done, total: progress.setValue(hits + done))
+        job.page_done.connect(on_page_done)
+        job.finished.connect(on_finished)
+        add_ready_pages()
+        self.word_act.setEnabled(False)
+        progress.show()
 
     def open_settings(self):
         """Открывает окно настроек Word"""
@@ -517,35 +650,10 @@ class MainWindow(QMainWindow):
         self.word_settings.show()
 
     def add_page(self):
-        """Добавляет новую страницу в стек виджетов."""
+        """Добавляет новую страницу в конец."""
         logger.info(f"Добавление страницы")
-        page = QWidget()
-        layout = QHBoxLayout(page)
-        vlayout = QVBoxLayout()
-
-        left_panel = LeftPanel(self.data, self)
-        plot_area = PlotArea(self.data, self)
-
-        vlayout.addWidget(left_panel, 1)
-        vlayout.addStretch(10)
-        layout.addLayout(vlayout, 1)
-        layout.addWidget(plot_area, 4)
-
-        page_data = {
-            "widget": page,
-            "left": left_panel,
-            "right": plot_area,
-            "id": f"graph_{len(self.pages)}",  # Добавляем уникальный ID
-        }
-
-        self.pages.append(page_data)
-        self.stack.addWidget(page)
-        self.current_page = len(self.pages) - 1
-        self.stack.setCurrentIndex(self.current_page)
-        self.pages[self.current_page]["left"].update_label()
-        self.update_buttons()
-        self.stack.setCurrentIndex(self.current_page)
-        self.init_context_menu()
+        self.pages.append(new_page_spec(self.new_page_id()))
+        self.show_page(len(self.pages) - 1)
         logger.info(f"Добавлена страница №{self.current_page + 1}")
 
     def remove_page(self):
@@ -559,14 +667,12 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             logger.info(f"Удаление страницы")
             if len(self.pages) > 1:
-                page_to_remove = self.pages.pop(self.current_page)
-                self.stack.removeWidget(page_to_remove["widget"])
-                page_to_remove["widget"].deleteLater()
+                spec_to_remove = self.pages.pop(self.current_page)
+                self.page_pool.release(spec_to_remove)
                 if self.current_page >= len(self.pages):
                     self.current_page = len(self.pages) - 1
-                self.stack.setCurrentIndex(self.current_page)
-                self.pages[self.current_page]["left"].update_label()
-                self.update_buttons()
+                self.show_page(self.current_page)
+                self.prefetcher.schedule()
                 logger.info(f"Удалена страница №{self.current_page + 1}")
             else:
                 msg = MessageWindow(
@@ -576,76 +682,61 @@ class MainWindow(QMainWindow):
 
     def insert_page_right(self):
         logger.info(f"Добавление страницы")
-        page = QWidget()
-        layout = QHBoxLayout(page)
-        vlayout = QVBoxLayout()
-
-        left_panel = LeftPanel(self.data, self)
-        plot_area = PlotArea(self.data, self)
-
-        vlayout.addWidget(left_panel, 1)
-        vlayout.addStretch(10)
-        layout.addLayout(vlayout, 1)
-        layout.addWidget(plot_area, 4)
-        self.current_page = self.current_page + 1
-
-        page_data = {
-            "widget": page,
-            "left": left_panel,
-            "right": plot_area,
-            "id": f"graph_{len(self.pages)}",  # Добавляем уникальный ID
-        }
-
-        self.pages.insert(self.current_page, page_data)
-        self.stack.insertWidget(self.current_page, page)
-        self.stack.setCurrentIndex(self.current_page)
-        self.pages[self.current_page]["left"].update_label()
-        self.update_buttons()
-        self.init_context_menu()
+        idx = self.current_page + 1
+        self.pages.insert(idx, new_page_spec(self.new_page_id()))
+        self.show_page(idx)
         logger.info(f"Добавлена страница №{self.current_page + 1}")
 
     def insert_page_left(self):
         logger.info(f"Добавление страницы")
-        page = QWidget()
-        layout = QHBoxLayout(page)
-        vlayout = QVBoxLayout()
-
-        left_panel = LeftPanel(self.data, self)
-        plot_area = PlotArea(self.data, self)
-
-        vlayout.addWidget(left_panel, 1)
-        vlayout.addStretch(10)
-        layout.addLayout(vlayout, 1)
-        layout.addWidget(plot_area, 4)
-        self.current_page = self.current_page
-
-        page_data = {
-            "widget": page,
-            "left": left_panel,
-            "right": plot_area,
-            "id": f"graph_{len(self.pages)}",  # Добавляем уникальный ID
-        }
+        idx = self.current_page
+        self.pages.insert(idx, new_page_spec(self.new_page_id()))
+        self.show_page(idx)
+        logger.info(f"Добавлена страница №{self.current_page + 1}")
 
-        self.pages.insert(self.current_page, page_data)
-        self.stack.insertWidget(self.current_page, page)
-        self.stack.setCurrentIndex(self.current_page)
-        self.pages[self.current_page]["left"].update_label()
+    def show_page(self, idx: int):
+        """
+        Показывает страницу idx в одном из живых представлений.
+        Если представление пришлось перепривязать, график берется из кэша или перестраивается.
+        """
+        self.current_page = idx
+        view, rebound = self.page_pool.acquire(self.pages[idx])
+        self.stack.setCurrentWidget(view)
+        view.left.update_label()
         self.update_buttons()
-        self.init_context_menu()
-        logger.info(f"Добавлена страница №{self.current_page + 1}")
+        if rebound:
+            self.show_current_graph()
+        if self.cursor_enabled and self.cursor_sync:
+            view.right.cursor.show_time(self.cursor_time)
 
     def update_pages(self):
-        for page in self.pages:
-            for combo in page["left"].combos:
-                combo.clear()
-                combo.blockSignals(True)
-                combo._original_items = []
-                combo.addItems(self.data.columns[1:])
-                combo.setCurrentIndex(-1)
-                combo.blockSignals(False)
-            page["right"].data = self.data
-            page["right"].clear_graph()
-            self.update_graph()
+        """Сбрасывает линии и настройки осей всех страниц после загрузки нового набора данных"""
+        for spec in self.pages:
+            clear_page_spec(spec)
+        self.page_pool.release_all()
+        if self.pages:
+            self.show_page(self.current_page)
+
+    def sync_columns(self):
+        """
+        Приводит общую модель имен столбцов к текущему набору данных.
+        Новые столбцы в конце добавляются без сброса модели.
+        """
+        columns = [str(column) for column in self.data.columns[1:]]
+        current = self.column_model.stringList()
+        if columns[: len(current)] == current:
+            self.column_model.append_columns(columns[len(current) :])
+            return
+        combos = [combo for view in self.page_pool.views for combo in view.left.combos]
+        for combo in combos:
+            combo.blockSignals(True)
+        self.column_model.set_columns(columns)
+        for combo in combos:
+            combo.blockSignals(False)
+        # Сброс модели очищает текст в выпадающих списках - восстанавливаем его
+        for view in self.page_pool.views:
+            if view.spec is not None:
+                view.left.bind(view.spec)
 
     def update_buttons(self):
         self.prev_page_act.setEnabled(self.current_page > 0)
@@ -655,34 +746,110 @@ class MainWindow(QMainWindow):
         self.remove_page_act.setEnabled(len(self.pages) > 1)
 
     def update_graph(self):
-        combos = self.pages[self.current_page]["left"].combos
-        for i in range(len(combos)):
-            self.plot_selection(i)
+        plot_area = self.plot_area
+        plot_area.stale = False
+        plot_area.pending_capture = True
+        if plot_area.spec["Mode"] == "many":
+            plot_area.plot_many_lines()
+        elif plot_area.spec["Mode"] == "grid":
+            plot_area.plot_grid()
+        else:
+            combos = self.left_panel.combos
+            for i in range(len(combos)):
+                self.plot_selection(i)
+        # Холст мог отображать предыдущую страницу представления
+        plot_area.canvas.draw_idle()
+
+    def show_current_graph(self):
+        """
+        Показывает график текущей страницы из кэша изображений.
+        Если изображения нет, график перестраивается полностью.
+        """
+        plot_area = self.plot_area
+        canvas = plot_area.canvas
+        key = page_key(
+            self.pages[self.current_page],
+            self.data_version,
+            canvas.get_width_height(physical=True),
+        )
+        image = self.page_cache.get(key)
+        if image is not None and canvas.show_image(image):
+            plot_area.stale = True
+            return
+        self.update_graph()
+
+    def store_page_image(self, plot_area):
+        """Сохраняет отрисованное изображение страницы в кэш"""
+        if plot_area.spec is None:
+            return
+        canvas = plot_area.canvas
+        key = page_key(
+            plot_area.spec,
+            self.data_version,
+            canvas.get_width_height(physical=True),
+        )
+        self.page_cache.put(key, canvas.grab_image())
+
+    def set_dataset(self, data):
+        """
+        Устанавливает новый набор данных (Dataset или DataFrame)
+        и сбрасывает кэш изображений страниц
+        """
+        self.prefetcher.cancel()
+        if not isinstance(data, Dataset):
+            data = Dataset(data)
+        if data is not self.data:
+            # Прежний набор данных не должен держать ссылку на окно
+            self.data.unsubscribe(self._on_data_invalidated)
+            data.subscribe(self._on_data_invalidated)
+        self.data = data
+        self.column_stats = ColumnStats(data)
+        self._shared_decimation = None
+        self.data_version += 1
+        self.page_cache.clear()
+        self.sync_columns()
+        for view in self.page_pool.views:
+            view.left.data = data
+            view.right.data = data
+        # Графики скрытых представлений построены по прежним данным
+        self.page_pool.release_all(keep_current=True)
+
+    def _on_data_invalidated(self, columns: list):
+        """Столбцы набора данных изменились: сбрасываются зависящие от них кэши"""
+        self.prefetcher.cancel()
+        for column in columns:
+            self.column_stats.invalidate(column)
+        self._shared_decimation = None
+        self.data_version += 1
+        self.page_cache.clear()
+        self.page_pool.release_all(keep_current=True)
 
     def prev_page(self):
         if self.current_page > 0:
-            self.current_page -= 1
-            self.stack.setCurrentIndex(self.current_page)
-            self.pages[self.current_page]["left"].update_label()
-            self.update_buttons()
-            self.update_graph()
+            self.show_page(self.current_page - 1)
+            self.prefetcher.schedule()
 
     def next_page(self):
         if self.current_page < len(self.pages) - 1:
-            self.current_page += 1
-            self.stack.setCurrentIndex(self.current_page)
-            self.pages[self.current_page]["left"].update_label()
-            self.update_buttons()
-            self.update_graph()
+            self.show_page(self.current_page + 1)
+            self.prefetcher.schedule()
 
     def plot_selection(self, combo_idx: int):
-        current_page = self.pages[self.current_page]
-        combo = current_page["left"].combos[combo_idx]
+        plot_area = self.plot_area
+        if plot_area.stale:
+            # График показан из кэша: перестраиваются сразу все линии
+            plot_area.ensure_current()
+            return
+        if plot_area.spec["Mode"] == "grid":
+            # Панели строятся вместе на одной фигуре
+            self.update_graph()
+            return
+        combo = self.left_panel.combos[combo_idx]
         selected_col = combo.currentText()
         if selected_col:
-            current_page["right"].update_plot(combo_idx, selected_col)
+            plot_area.update_plot(combo_idx, selected_col)
         else:
-            current_page["right"].remove_line(combo_idx)
+            plot_area.remove_line(combo_idx)
 
     def save_state(self):
         options = QFileDialog.Options()
@@ -704,54 +871,24 @@ class MainWindow(QMainWindow):
         if not file_name.endswith(".yaml"):
             file_name = file_name + ".yaml"
         logger.info(f"Сохранение состояния в директорию: {file_name}")
-        self.state_additional_data = []
 
         if file_name:
             path = Path(self.path_ent.text())
+            # Производные столбцы сохраняются журналом операций. Выражения
+            # на страницах, которых нет в журнале, дописываются, чтобы не потерять их
+            operations = self.operation_log.to_state()
+            outputs = {entry["output"] for entry in operations}
+            operations += [
+                make_operation("expression", expression=text)
+                for text in derived_columns(self.pages)
+                if text not in outputs
+            ]
             state = {
                 "data_file_path": path.as_posix(),
                 "_Word": self.params,
-                "pages": [],
+                "pages": [copy_page_spec(spec) for spec in self.pages],
+                "operations": operations,
             }
-            for i, page_data in enumerate(self.pages):
-                # Используем ID графика вместо номера
-                graph_id = page_data.get("id", f"graph_{i}")
-                # Получаем альтернативную подпись из self.alternative_captions
-                alternative_caption = self.alternative_captions.get(graph_id, "")
-                page_state = {
-                    "id": graph_id,
-                    "Symbol_Y": [
-                        str(page_data["right"].group.currentText()),
-                        str(page_data["right"].sizing_cmb.currentText()),
-                    ],
-                    "Symbol_X": [
-                        str(page_data["right"].group_x.currentText()),
-                        str(page_data["right"].sizing_cmb_x.currentText()),
-                    ],
-                    "Axis_settings": {
-                        "X": str(page_data["right"].x_settings.currentText()),
-                        "Y": str(page_data["right"].y_settings.text()),
-                        "Frequency": str(page_data["right"].markers.currentText()),
-                        "X_grid_lines": str(
-                            page_data["right"].x_spacing_grid_spinBox.value()
-                        ),
-                    },
-                    "Lists": [],
-                    "alternative_caption": alternative_caption,
-                }
-                for combo in page_data["left"].combos:
-                    text = combo.currentText()
-                    page_state["Lists"].append(text)
-                    if (
-                        text not in self.state_additional_data
-                        and text.startswith("$")
-                        and text.endswith("$")
-                        and text != ""
-                        and text != " "
-                    ):
-                        self.state_additional_data.append(text)
-                state["pages"].append(page_state)
-                state["_Additional_data"] = self.state_additional_data
 
             with open(file_name, "w", encoding="cp1251") as f:
                 yaml.dump(state, f, indent=2, allow_unicode=True)
@@ -769,75 +906,28 @@ class MainWindow(QMainWindow):
             with open(file_path, "r", encoding=ENCODING) as f:
                 state = yaml.load(f, Loader=yaml.FullLoader)
             # 1. Очистка текущего состояния
-            while self.pages:
-                page = self.pages.pop()
-                self.stack.removeWidget(page["widget"])
-            QApplication.processEvents()
+            self.prefetcher.cancel()
+            self.page_pool.release_all()
+            self.pages = []
             # 2. Загрузка данных
             self.path_ent.blockSignals(True)
             self.data_file_path = state.get("data_file_path", DEFAULT_FILE_PATH)
             self.params = state.get("_Word", {})
             self.path_ent.setText(self.data_file_path)
             self.path_ent.blockSignals(False)
-            self.data = DataLoader(self.data_file_path, ENCODING).get_data()
-            self.state_additional_data = state.get("_Additional_data", [])
-            self.unpuck_additional_data(self.state_additional_data)
-            self.alternative_captions = {}
-
-            # 3. Воссоздание страниц
-            total_pages = len(state.get("pages", []))
-            progress.setMaximum(total_pages)
-            for i, page_state in enumerate(state.get("pages", [])):
-                progress.setValue(i)
-                progress.setLabelText(f"Загрузка страницы {i}/{total_pages}")
-                QApplication.processEvents()
-                if progress.wasCanceled():
-                    break
-                self.current_page = 0
-                self.add_page()
-                current_page = self.pages[-1]
-                # Устанавливаем ID графика
-                current_page["id"] = page_state.get("id", f"graph_{i}")
-                # Загрузка параметров правой части
-                current_page["right"].x_settings.setCurrentText(
-                    page_state["Axis_settings"]["X"]
-                )
-                current_page["right"].y_settings.setText(
-                    page_state["Axis_settings"]["Y"]
-                )
-                current_page["right"].markers.setCurrentText(
-                    page_state["Axis_settings"]["Frequency"]
-                )
-                current_page["right"].x_spacing_grid_spinBox.setValue(
-                    int(page_state["Axis_settings"]["X_grid_lines"])
-                )
-                current_page["right"].group.setCurrentText(page_state["Symbol_Y"][0])
-                current_page["right"].sizing_cmb.setCurrentText(
-                    page_state["Symbol_Y"][1]
-                )
-                current_page["right"].group_x.setCurrentText(page_state["Symbol_X"][0])
-                current_page["right"].sizing_cmb_x.setCurrentText(
-                    page_state["Symbol_X"][1]
-                )
+            self.set_dataset(DataLoader(self.data_file_path, ENCODING).get_data())
+            self.operation_log = OperationLog.from_state(state)
+            self.apply_operation_log()
 
-                # Загрузка параметров левой части
-                for j, combo_text in enumerate(page_state["Lists"]):
-                    if j < len(current_page["left"].combos):
-                        current_page["left"].combos[j].setCurrentText(combo_text)
-                # Загрузка альтернативной подписи по ID
-                graph_id = page_state.get("id", f"graph_{i}")
-                self.alternative_captions[graph_id] = page_state.get(
-                    "alternative_caption", ""
-                )
-                self.update_graph()
-                QApplication.processEvents()
+            # 3. Воссоздание страниц (виджеты не создаются, только спецификации)
+            for i, page_state in enumerate(state.get("pages", [])):
+                self.pages.append(spec_from_state(page_state, f"graph_{i}"))
+            self._page_counter = next_page_number(self.pages)
 
             # 4. Восстановление позиции
-            if self.pages:
-                self.current_page = 0
-                self.stack.setCurrentIndex(0)
-                self.update_buttons()
-                self.pages[0]["left"].update_label()
+            if not self.pages:
+                self.pages.append(new_page_spec(self.new_page_id()))
+            self.show_page(0)
             self.write_path(file_path)
             self.change_status(file_path)
             logger.info("Состояние успешно загружено")
@@ -859,114 +949,30 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Ошибка", f"Ошибка загрузки: {str(e)}")
             logger.error(f"Ошибка при загрузке состояния: {str(e)}", exc_info=True)
+            if not self.pages:
+                self.add_page()
         finally:
             progress.close()
 
-    def unpuck_additional_data(self, list_params: list):
+    def apply_operation_log(self):
         """
-        Обрабатывает дополнительные параметры из yaml файла используя функционал DataTableView
-
-        Args:
-            list_params (list): список параметров которые нужно вычислить
+        Добавляет в набор данных производные столбцы операций журнала.
+        Значения вычисляются при первом обращении к столбцу
         """
-        if not list_params:
+        outputs = [entry["output"] for entry in self.operation_log.active]
+        if not outputs:
             return
-        list_params = list(list_params)
-
-        try:
-            # Регулярные выражения для разных типов операций
-            # Формат: $(param)op(value)$, где op может быть +,-,*,/
-            operation_pattern = r"^\$\((.*?)\)([\+\-\*/])\((.*?)\)\$$"
-            integral_pattern = r"^\$Integral\((.*?)\)\$$"
-            horizontal_pattern = r"\$Horizontal\((.*?)\)\$$"
-
-            # Создаем временную таблицу для обработки данных
-            table = DataTableView(self)
-            table.set_data(self.data.copy())
-
-            # Словарь соответствия операторов и методов
-            operations_map = {
-                "+": (
-                    table.model._operations.add_constant,
-                    table.model._operations.add_columns,
-                ),
-                "-": (
-                    table.model._operations.subtract_constant,
-                    table.model._operations.subtract_columns,
-                ),
-                "*": (table.model._operations.multiply_constant, None),
-                "/": (table.model._operations.divide_constant, None),
-            }
-
-            for param_name in list_params:
-                try:
-                    # Проверяем на операцию с константой или между столбцами
-                    match = re.match(operation_pattern, param_name)
-                    if match:
-                        param1, operator, param2 = match.groups()
-
-                        # Пытаемся преобразовать param2 в число
-                        try:
-                            constant = float(param2)
-                            # Операция с константой
-                            constant_operation, _ = operations_map[operator]
-                            if constant_operation:
-                                table.model.perform_constant_operation(
-                                    constant_operation, param1, constant
-                                )
-                            else:
-                                logger.warning(
-                                    f"Операция {operator} с константой не поддерживается"
-                                )
-
-                        except ValueError:
-                            # Операция между столбцами
-                            _, columns_operation = operations_map[operator]
-                            if columns_operation:
-                                table.model.perform_constant_operation(
-                                    columns_operation, param1, param2
-                                )
-                            else:
-                                logger.warning(
-                                    f"Операция {operator} между столбцами не поддерживается"
-                                )
-
-                    # Проверяем на интеграл
-                    match = re.match(integral_pattern, param_name)
-                    if match:
-                        param = match.group(1)
-                        table.model.perform_integral(
-                            table.model._operations.integral,
-                            self.data.columns[0],
-                            param,
-                        )
-                    # Проверяем на горизонтальную линию
-                    match = re.match(horizontal_pattern, param_name)
-                    if match:
-                        param = match.group(1)
-                        table.model.perform_horizontal(
-                            table.model._operations.horizontal,
-                            float(param),
-                        )
-                except Exception as e:
-                    logger.error(
-                        f"Ошибка при выполнении операции для {param_name}: {str(e)}"
-                    )
-                    continue
-
-            # Получаем обновленные данные
-            self.data = table.get_data()
-            logger.info(f"Успешно добавлены вычисленные параметры: {list_params}")
-
-        except Exception as e:
-            logger.error(
-                f"Ошибка при обработке дополнительных параметров: {str(e)}",
-                exc_info=True,
-            )
+        errors = self.data.add_derived_many(outputs)
+        for output, error in errors.items():
+            logger.error(f"Ошибка при выполнении операции для {output}: {error}")
+        self.set_dataset(self.data)
+        logger.info(f"Добавлены вычисляемые параметры: {self.data.derived_names}")
+        if errors:
             QMessageBox.warning(
                 self,
                 "Предупреждение",
-                f"Ошибка при обработке дополнительных параметров: {str(e)}",
+                "Не удалось добавить параметры:\n"
+                + "\n".join(f"{name}: {error}" for name, error in errors.items()),
             )
 
     def load_state(self):
@@ -985,7 +991,6 @@ class MainWindow(QMainWindow):
         if self.state_file_path != "":
             try:
                 self._load_state(self.state_file_path)
-                self.init_context_menu()
             except Exception as e:
                 msg = MessageWindow(
                     f"Ошибка загрузки состояния из файла:\n{self.state_file_path}",
@@ -994,15 +999,42 @@ class MainWindow(QMainWindow):
                 msg.exec_()
 
     def save_all(self):
-        """Сохраняет все графики в выбранную пользователем директорию."""
-        # Запрос директории сохранения
-        options = QFileDialog.Options()
-        options |= QFileDialog.ShowDirsOnly  # Показываем только папки
+        """Сохраняет графики выбранного диапазона в PNG, SVG или один файл PDF."""
+        dialog = ExportDialog(len(self.pages), self.current_page, self)
+        if not dialog.exec_():
+            return
+        fmt = dialog.export_format()
+        pages = dialog.page_range()
         path = self.path_ent.text()
         if path:
             home_dir = Path(path).parent.as_posix()
         else:
             home_dir = os.path.expanduser(DEFAULT_DIR)
+        if fmt == "pdf":
+            file_name, _ = QFileDialog.getSaveFileName(
+                self,
+                "Сохранить графики в PDF",
+                home_dir,
+                "PDF Files (*.pdf);;All Files (*)",
+            )
+            if not file_name:
+                return
+            if not file_name.lower().endswith(".pdf"):
+                file_name = file_name + ".pdf"
+            logger.info(f"Сохранение графиков в PDF: {file_name}")
+            # Копии: страницы можно изменять, пока идет экспорт
+            job = PdfExportJob(
+                [copy_page_spec(self.pages[idx]) for idx in pages],
+                self.data,
+                file_name,
+                PAGE_FIGURE_SIZE,
+                self,
+            )
+            self._start_save_all(job, f"Сохранение {len(pages)} графиков в PDF...", file_name)
+            return
+        # Запрос директории сохранения
+        options = QFileDialog.Options()
+        options |= QFileDialog.ShowDirsOnly  # Показываем только папки
         directory = QFileDialog.getExistingDirectory(
             self, "Выберите папку для сохранения графиков", home_dir, options=options
         )
@@ -1011,59 +1043,83 @@ class MainWindow(QMainWindow):
             return  # Пользователь отменил выбор
 
         logger.info(f"Сохранение всех графиков в директорию: {directory}")
-        # Сохраняем текущую активную страницу
-        original_page = self.current_page
+        tasks = []
+        keys = []
+        hits = 0
+        for idx in pages:
+            spec = self.pages[idx]
+            number = f"График №{idx + 1} из {len(self.pages)}"
+            number = number.replace(" ", "_").replace("/", "-")
+            filename = os.path.join(directory, f"{number}.{fmt}")
+            key = self.export_key(spec, PAGE_FIGURE_SIZE, 300, fmt)
+            # Неизмененная страница копируется из кэша без отрисовки
+            if self.render_cache.copy_to(key, filename):
+                hits += 1
+                continue
+            # Копия: страницу можно изменить, пока идет экспорт
+            tasks.append((copy_page_spec(spec), filename, PAGE_FIGURE_SIZE, 300, fmt))
+            keys.append(key)
+        cache_text = hit_rate_text(hits, len(pages))
+        logger.info(cache_text)
         try:
-            # Создаем папку если нужно
-            for idx, page in enumerate(self.pages):
-                self.current_page = idx
-                self.stack.setCurrentIndex(idx)
-
-                # Обновляем интерфейс страницы
-                QApplication.processEvents()
-
-                # Принудительно обновляем графики
-                self.update_graph()
-                page["left"].update_label()
-                page["right"].canvas.draw_idle()
-                QApplication.processEvents()
-
-                number = (
-                    page["left"].num_page.text().replace(" ", "_").replace("/", "-")
-                )
-                filename = os.path.join(directory, f"{number}.png")
-                current_width, current_hight = page[
-                    "right"
-                ].canvas.fig.get_size_inches()
-                page["right"].canvas.fig.set_size_inches(
-                    page["right"].init_width, page["right"].init_hight
-                )
-
-                page["right"].canvas.figure.savefig(
-                    filename,
-                    format="png",
-                    dpi=300,
-                )
-                page["right"].canvas.figure.set_size_inches(
-                    current_width, current_hight
-                )
-            QMessageBox.information(
-                self, "Успешно", f"Графики сохранены в:\n{directory}"
+            if tasks:
+                self.prepare_render_pool([task[0] for task in tasks])
+            job = ExportJob(
+                [self.render_pool.submit_save(*task) for task in tasks], self
             )
-            self.update_buttons()
-            self.current_page = original_page
-            self.stack.setCurrentIndex(original_page)
-            logger.info(f"Успешное сохранение всех графиков в директорию: {directory}")
-
         except Exception as e:
             QMessageBox.critical(self, "Ошибка", f"Ошибка сохранения: {str(e)}")
             logger.error(
                 f"Ошибка при сохранении всех графиков: {str(e)}", exc_info=True
             )
-        finally:
-            self.current_page = original_page
-            self.stack.setCurrentIndex(original_page)
-            self.update_buttons()
+            return
+        job.page_done.connect(
+            lambda idx, _: self.render_cache.put_file(keys[idx], tasks[idx][1])
+        )
+        self._start_save_all(
+            job, f"Сохранение {len(tasks)} графиков...", directory, cache_text
+        )
+
+    def _start_save_all(self, job, label_text: str, target: str, cache_text: str = ""):
+        """Показывает немодальное окно прогресса фонового экспорта"""
+        progress = MyProgressDialog(
+            title="Сохранение графиков",
+            label_text=label_text,
+            max_val=job.total,
+            parent=self,
+        )
+        progress.setMaximum(job.total)
+        progress.setValue(0)
+        # Окно прогресса не блокирует работу с программой во время экспорта
+        progress.setWindowModality(Qt.NonModal)
+        progress.canceled.connect(job.cancel)
+        job.progress.connect(lambda done, total: progress.setValue(done))
+        job.finished.connect(
+            lambda canceled, errors: self._on_save_all_finished(
+                job, progress, target, canceled, errors, cache_text
+            )
+        )
+        self.save_all_act.setEnabled(False)
+        progress.show()
+
+    def _on_save_all_finished(self, job, progress, target, canceled, errors, cache_text):
+        """Завершение фонового сохранения графиков"""
+        self.save_all_act.setEnabled(True)
+        progress.close()
+        job.deleteLater()
+        if errors:
+            QMessageBox.critical(
+                self,
+                "Ошибка",
+                f"Ошибка сохранения ({len(errors)} из {job.total}): {errors[0]}",
+            )
+        elif canceled:
+            logger.info(f"Сохранение графиков отменено: {target}")
+        else:
+            QMessageBox.information(
+                self, "Успешно", f"Графики сохранены в:\n{target}\n{cache_text}".strip()
+            )
+            logger.info(f"Успешное сохранение графиков: {target}")
 
     def write_path(self, path):
         """Перезаписывает путь к последнему файлу состояния"""
@@ -1081,25 +1137,55 @@ class MainWindow(QMainWindow):
         )
         if reply == QMessageBox.Yes:
             self.clear_all()
-            self.pages = []
             self.add_page()
             self.path_ent.clear()
-            [i.clear() for i in self.pages[0]["left"].combos]
-            self.pages[0]["left"].combos[0].clear()
         else:
             return
 
     def clear_all(self):
-        """Очистка главного окна от всех виджетов"""
-        for page in self.pages:
-            self.stack.removeWidget(page["widget"])
-        self.data = DataLoader.default_data
-        self.update_pages()
-        self.init_context_menu()
+        """Очистка главного окна от всех страниц"""
+        self.pages = []
+        self._page_counter = 0
+        self.page_pool.release_all()
+        self.operation_log.clear()
+        self.set_dataset(DataLoader.default_data)
+
+    def find_crossings(self):
+        """
+        Поиск пересечений порога параметрами. Для выбранных в результатах
+        параметров добавляются страницы с линией порога
+        """
+        dialog = CrossingDialog(self.data, parent=self)
+        if not dialog.exec_():
+            return
+        columns = dialog.selected_columns()
+        if columns:
+            self.add_threshold_pages(columns, dialog.threshold())
+
+    def add_threshold_pages(self, columns: list[str], threshold: float):
+        """
+        Добавляет в конец страницы с параметрами columns (по LINES_PER_PAGE - 1
+        на странице) и горизонтальной линией порога
+        """
+        entry = make_operation("horizontal", constant=float(threshold))
+        line = entry["output"]
+        if line not in self.data:
+            self.data.add_derived(line)
+            self.operation_log.record(entry)
+            self.sync_columns()
+        per_page = LINES_PER_PAGE - 1
+        first = len(self.pages)
+        for start in range(0, len(columns), per_page):
+            spec = new_page_spec(self.new_page_id())
+            lines = [*columns[start : start + per_page], line]
+            spec["Lists"] = pad_lines(lines, "lines")
+            self.pages.append(spec)
+        logger.info(f"Добавлены страницы пересечений порога: {len(self.pages) - first}")
+        self.show_page(first)
 
     def show_data(self):
         self.data_table = DataTableView(self)
-        self.data_table.set_data(self.data)
+        self.data_table.set_data(self.data, self.column_stats)
         self.data_table.setWindowModality(Qt.ApplicationModal)
         self.data_table.show()
 
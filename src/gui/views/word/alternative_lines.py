@@ -79,7 +79,7 @@ class AlternativeLines(QtWidgets.QWidget):
         page_indx = graph_num
         page = QtWidgets.QWidget()
         # Количество полей ввода в главном окне левой панели на соответствующей странице
-        count_field = len(self.pages[page_indx]["left"].combos)
+        count_field = len(self.pages[page_indx]["Lists"])
         page_layout = QtWidgets.QVBoxLayout(page)
         page_layout.setContentsMargins(10, 10, 10, 10)
         page_layout.setSpacing(10)
@@ -123,8 +123,8 @@ class AlternativeLines(QtWidgets.QWidget):
             line_edit = QtWidgets.QLineEdit()
             line_edit.setReadOnly(True)
             form_layout.addRow(lbl, line_edit)
-            # Получаем текс из комбобоксов левой панели главного окна соответствующей страницы
-            text = self.pages[page_indx]["left"].combos[i].currentText()
+            # Получаем текст линии из спецификации соответствующей страницы
+            text = self.pages[page_indx]["Lists"][i]
             line_edit.setText(text)
         lines_and_text_layout.addLayout(form_layout)
 
@@ -167,8 +167,8 @@ class AlternativeLines(QtWidgets.QWidget):
     def set_text_to_textEdit(self):
         """Метод установки текста в textEdit с использованием ID графиков"""
         for i, graph_id in self.graph_ids.items():
-            if graph_id in self.main_window.alternative_captions:
-                text = self.main_window.alternative_captions[graph_id]
+            text = self.pages[i].get("alternative_caption", "")
+            if text:
                 self.textEdits[f"{i}"].setText(text)
                 self.cuptions[graph_id] = text
 
@@ -186,7 +186,9 @@ class AlternativeLines(QtWidgets.QWidget):
         """
         for idx in self.graph_ids.keys():
             self.accept_changes(idx)
-        self.main_window.alternative_captions.update(self.cuptions)
+        for idx, graph_id in self.graph_ids.items():
+            if graph_id in self.cuptions:
+                self.pages[idx]["alternative_caption"] = self.cuptions[graph_id]
         QMessageBox.information(
             self, "Успешно", "Все изменения сохранены."
         )
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import BinaryIO
 
 from docx import Document
 from docx.shared import Pt, Cm
@@ -55,18 +56,22 @@ class Word:
 
     def add_image(
         self,
-        image_path: Path = Path("./temp_grf"),
+        image_path: Path | BinaryIO = Path("./temp_grf"),
         pic_width: str | int | float = 16.0,
         pic_height: str | int | float = 9.0,
     ):
-        """Добавление рисунка в документ"""
+        """Добавление рисунка в документ (из файла или файлоподобного объекта в памяти)"""
 
         if self.validation_params(**{"pic_width": pic_width, "pic_height": pic_height}):
             para_img = self.doc.add_paragraph()
             para_img.alignment = WD_ALIGN_PARAGRAPH.CENTER
             run = para_img.add_run()
+            if hasattr(image_path, "read"):
+                image = image_path
+            else:
+                image = Path(image_path).as_posix()
             run.add_picture(
-                image_path_or_stream=Path(image_path).as_posix(),
+                image_path_or_stream=image,
                 width=Cm(float(pic_width)),
                 height=Cm(float(pic_height)),
             )
@@ -0,0 +1,52 @@
+"""Проверка кодирования PNG (src/core/image_encoding.py): точная палитра без потерь"""
+from io import BytesIO
+
+import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+from src.core.image_encoding import encode_png, to_image
+
+OPTIONS = {"compress_level": 6, "palette": True, "quantize": False}
+
+
+def make_rgba(colors: int, height: int = 60, width: int = 80) -> np.ndarray:
+    """Непрозрачное изображение из colors различных цветов на белом фоне"""
+    rng = np.random.default_rng(0)
+    table = rng.integers(0, 256, size=(colors, 3), dtype=np.uint8)
+    table[0] = 255
+    index = rng.integers(0, colors, size=(height, width))
+    index[:, : width // 2] = 0
+    rgba = np.full((height, width, 4), 255, dtype=np.uint8)
+    rgba[..., :3] = table[index]
+    return rgba
+
+
+def decode(data: bytes) -> np.ndarray:
+    return np.asarray(Image.open(BytesIO(data)).convert("RGB"))
+
+
+@pytest.mark.parametrize("colors", [1, 2, 129, 256])
+def test_palette_round_trip(colors):
+    rgba = make_rgba(colors)
+    data = encode_png(rgba, 300, OPTIONS)
+    assert Image.open(BytesIO(data)).mode == "P"
+    np.testing.assert_array_equal(decode(data), rgba[..., :3])
+
+
+def test_many_colors_stay_lossless_without_quantize():
+    rgba = make_rgba(256)
+    rgba[0, :, 0] = np.arange(rgba.shape[1], dtype=np.uint8)
+    image = to_image(rgba, palette=True, quantize=False)
+    assert image.mode == "RGB"
+    np.testing.assert_array_equal(decode(encode_png(rgba, 300, OPTIONS)), rgba[..., :3])
+
+
+def test_transparent_image_keeps_alpha():
+    rgba = make_rgba(4)
+    rgba[0, 0, 3] = 0
+    data = encode_png(rgba, 300, OPTIONS)
+    np.testing.assert_array_equal(
+        np.asarray(Image.open(BytesIO(data)).convert("RGBA")), rgba
+    )